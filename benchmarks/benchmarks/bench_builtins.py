@@ -0,0 +1,62 @@
+# -*- coding: utf-8 -*-
+
+"""This file is part of the TPOT library.
+
+TPOT was primarily developed at the University of Pennsylvania by:
+    - Randal S. Olson (rso@randalolson.com)
+    - Weixuan Fu (weixuanf@upenn.edu)
+    - Daniel Angell (dpa34@drexel.edu)
+    - and many more generous open source contributors
+
+TPOT is free software: you can redistribute it and/or modify
+it under the terms of the GNU Lesser General Public License as
+published by the Free Software Foundation, either version 3 of
+the License, or (at your option) any later version.
+
+TPOT is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+GNU Lesser General Public License for more details.
+
+You should have received a copy of the GNU Lesser General Public
+License along with TPOT. If not, see <http://www.gnu.org/licenses/>.
+
+"""
+
+import numpy as np
+from sklearn.naive_bayes import GaussianNB
+
+from tpot.builtins import ZeroCount, OneHotEncoder, StackingEstimator, MedianImputer
+
+from .common import RANDOM_STATE, classification_data
+
+
+class Builtins(object):
+    """Cost of the built-in transformers for different sizes of feature matrices."""
+
+    params = ([1000, 10000, 100000], [10, 100])
+    param_names = ['n_samples', 'n_features']
+    timeout = 600
+
+    def setup(self, n_samples, n_features):
+        self.features, self.target = classification_data(n_samples, n_features)
+        rng = np.random.RandomState(RANDOM_STATE)
+        # integer features with a few distinct values, which OneHotEncoder treats as categorical
+        self.categorical_features = rng.randint(0, 5, size=(n_samples, n_features)).astype(np.float64)
+        self.missing_features = self.features.copy()
+        self.missing_features[rng.rand(n_samples, n_features) < 0.1] = np.nan
+
+    def time_zero_count(self, n_samples, n_features):
+        ZeroCount().fit_transform(self.features)
+
+    def time_one_hot_encoder(self, n_samples, n_features):
+        OneHotEncoder(minimum_fraction=0.05).fit_transform(self.categorical_features)
+
+    def time_stacking_estimator(self, n_samples, n_features):
+        StackingEstimator(estimator=GaussianNB()).fit(self.features, self.target).transform(self.features)
+
+    def time_median_imputer(self, n_samples, n_features):
+        MedianImputer().fit(self.missing_features).transform(self.missing_features)
+
+    def peakmem_one_hot_encoder(self, n_samples, n_features):
+        OneHotEncoder(minimum_fraction=0.05).fit_transform(self.categorical_features)
@@ -0,0 +1,48 @@
+# -*- coding: utf-8 -*-
+
+"""This file is part of the TPOT library.
+
+TPOT was primarily developed at the University of Pennsylvania by:
+    - Randal S. Olson (rso@randalolson.com)
+    - Weixuan Fu (weixuanf@upenn.edu)
+    - Daniel Angell (dpa34@drexel.edu)
+    - and many more generous open source contributors
+
+TPOT is free software: you can redistribute it and/or modify
+it under the terms of the GNU Lesser General Public License as
+published by the Free Software Foundation, either version 3 of
+the License, or (at your option) any later version.
+
+TPOT is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+GNU Lesser General Public License for more details.
+
+You should have received a copy of the GNU Lesser General Public
+License along with TPOT. If not, see <http://www.gnu.org/licenses/>.
+
+"""
+
+from .common import classification_data, population, seed, tpot_classifier
+
+
+class EvaluateIndividuals(object):
+    """Throughput of _evaluate_individuals for a generation of pipelines."""
+
+    params = [1, 2, 4]
+    param_names = ['n_jobs']
+    timeout = 600
+
+    def setup(self, n_jobs):
+        self.features, self.target = classification_data()
+        self.tpot_obj = tpot_classifier(n_jobs=n_jobs)
+        self.pop = population(self.tpot_obj, 20)
+
+    def time_evaluate_individuals(self, n_jobs):
+        # forget the pipelines evaluated by the previous repeat
+        self.tpot_obj.evaluated_individuals_ = {}
+        seed()
+        self.tpot_obj._evaluate_individuals(self.pop, self.features, self.target)
+
+    def teardown(self, n_jobs):
+        self.tpot_obj._shutdown_executor()
@@ -0,0 +1,44 @@
+# -*- coding: utf-8 -*-
+
+"""This file is part of the TPOT library.
+
+TPOT was primarily developed at the University of Pennsylvania by:
+    - Randal S. Olson (rso@randalolson.com)
+    - Weixuan Fu (weixuanf@upenn.edu)
+    - Daniel Angell (dpa34@drexel.edu)
+    - and many more generous open source contributors
+
+TPOT is free software: you can redistribute it and/or modify
+it under the terms of the GNU Lesser General Public License as
+published by the Free Software Foundation, either version 3 of
+the License, or (at your option) any later version.
+
+TPOT is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+GNU Lesser General Public License for more details.
+
+You should have received a copy of the GNU Lesser General Public
+License along with TPOT. If not, see <http://www.gnu.org/licenses/>.
+
+"""
+
+from tpot.export_utils import export_pipeline
+
+from .common import population, tpot_classifier
+
+
+class ExportPipeline(object):
+    """Cost of generating the Python code of pipelines."""
+
+    def setup(self):
+        self.tpot_obj = tpot_classifier()
+        self.pop = population(self.tpot_obj, 50)
+
+    def time_export_pipeline(self):
+        for ind in self.pop:
+            export_pipeline(ind, self.tpot_obj.operators, self.tpot_obj._pset, pipeline_score=0.5, random_state=42)
+
+    def time_clean_pipeline_string(self):
+        for ind in self.pop:
+            self.tpot_obj.clean_pipeline_string(ind)
@@ -0,0 +1,108 @@
+# -*- coding: utf-8 -*-
+
+"""This file is part of the TPOT library.
+
+TPOT was primarily developed at the University of Pennsylvania by:
+    - Randal S. Olson (rso@randalolson.com)
+    - Weixuan Fu (weixuanf@upenn.edu)
+    - Daniel Angell (dpa34@drexel.edu)
+    - and many more generous open source contributors
+
+TPOT is free software: you can redistribute it and/or modify
+it under the terms of the GNU Lesser General Public License as
+published by the Free Software Foundation, either version 3 of
+the License, or (at your option) any later version.
+
+TPOT is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+GNU Lesser General Public License for more details.
+
+You should have received a copy of the GNU Lesser General Public
+License along with TPOT. If not, see <http://www.gnu.org/licenses/>.
+
+"""
+
+import numpy as np
+
+from tpot.base import TPOTBase
+from tpot.gp_deap import cxOnePoint, mutNodeReplacement, varOr, selNSGA2, ParetoFront
+
+from .common import RANDOM_STATE, population, seed, tpot_classifier
+
+
+class GPOperators(object):
+    """Cost of generating and varying a population of pipelines."""
+
+    params = [10, 50, 100]
+    param_names = ['population_size']
+    timeout = 600
+
+    def setup(self, population_size):
+        self.tpot_obj = tpot_classifier()
+        self.pop = population(self.tpot_obj, population_size)
+
+    def time_gen_grow_safe(self, population_size):
+        seed()
+        for _ in range(population_size):
+            self.tpot_obj._gen_grow_safe(self.tpot_obj._pset, min_=1, max_=3)
+
+    def time_varOr(self, population_size):
+        seed()
+        varOr(self.pop, self.tpot_obj._toolbox, population_size, cxpb=0.1, mutpb=0.9)
+
+    def time_cxOnePoint(self, population_size):
+        seed()
+        clone = self.tpot_obj._toolbox.clone
+        for ind1, ind2 in zip(self.pop[::2], self.pop[1::2]):
+            cxOnePoint(clone(ind1), clone(ind2))
+
+    def time_mutNodeReplacement(self, population_size):
+        seed()
+        clone = self.tpot_obj._toolbox.clone
+        for ind in self.pop:
+            mutNodeReplacement(clone(ind), pset=self.tpot_obj._pset)
+
+
+class PreTest(object):
+    """Overhead of the _pre_test decorator, which fits each new pipeline on a small data set."""
+
+    def setup(self):
+        self.tpot_obj = tpot_classifier()
+
+    def time_generate(self):
+        seed()
+        for _ in range(20):
+            self.tpot_obj._generate(self.tpot_obj._pset, 1, 3, lambda height, depth: depth == height)
+
+    def time_generate_without_pre_test(self):
+        seed()
+        # the undecorated function, from functools.wraps
+        generate = TPOTBase._generate.__wrapped__
+        for _ in range(20):
+            generate(self.tpot_obj, self.tpot_obj._pset, 1, 3, lambda height, depth: depth == height)
+
+
+class Selection(object):
+    """Cost of the NSGA-II selection and of the Pareto front update for large populations."""
+
+    params = [100, 1000, 5000]
+    param_names = ['population_size']
+
+    def setup(self, population_size):
+        self.tpot_obj = tpot_classifier()
+        rng = np.random.RandomState(RANDOM_STATE)
+        # population + offspring, with the operator counts and CV scores of a typical run
+        individual = population(self.tpot_obj, 1)[0]
+        self.pop = []
+        for _ in range(2 * population_size):
+            ind = self.tpot_obj._toolbox.clone(individual)
+            ind.fitness.values = (rng.randint(1, 6), rng.rand())
+            self.pop.append(ind)
+
+    def time_selNSGA2(self, population_size):
+        selNSGA2(self.pop, population_size)
+
+    def time_pareto_front_update(self, population_size):
+        pareto_front = ParetoFront(similar=lambda ind1, ind2: np.allclose(ind1.fitness.values, ind2.fitness.values))
+        pareto_front.update(self.pop)
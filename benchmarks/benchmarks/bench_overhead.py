@@ -0,0 +1,61 @@
+# -*- coding: utf-8 -*-
+
+"""This file is part of the TPOT library.
+
+TPOT was primarily developed at the University of Pennsylvania by:
+    - Randal S. Olson (rso@randalolson.com)
+    - Weixuan Fu (weixuanf@upenn.edu)
+    - Daniel Angell (dpa34@drexel.edu)
+    - and many more generous open source contributors
+
+TPOT is free software: you can redistribute it and/or modify
+it under the terms of the GNU Lesser General Public License as
+published by the Free Software Foundation, either version 3 of
+the License, or (at your option) any later version.
+
+TPOT is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+GNU Lesser General Public License for more details.
+
+You should have received a copy of the GNU Lesser General Public
+License along with TPOT. If not, see <http://www.gnu.org/licenses/>.
+
+"""
+
+from .overhead import PHASES, run_overhead_benchmark
+
+
+class Overhead(object):
+    """Time spent by TPOT in each phase of the optimization process, with dummy operators.
+
+    The optimization process runs once per benchmarked commit, and each phase is tracked
+    as a separate benchmark, so that a regression can be traced to a phase.
+    """
+
+    timeout = 1800
+    unit = 'seconds'
+
+    def setup_cache(self):
+        return run_overhead_benchmark(population_size=100, generations=10, n_jobs=1, verbosity=0)
+
+    def track_total(self, report):
+        return report['total']
+
+    def track_other(self, report):
+        return report['other']
+
+    def track_pipelines_per_second(self, report):
+        return report['n_pipelines'] / report['total']
+    track_pipelines_per_second.unit = 'pipelines/s'
+
+
+def _track_phase(phase):
+    def track(self, report):
+        return report[phase]
+    track.__name__ = 'track_' + phase
+    return track
+
+
+for _phase in PHASES:
+    setattr(Overhead, 'track_' + _phase, _track_phase(_phase))
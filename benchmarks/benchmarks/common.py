@@ -0,0 +1,71 @@
+# -*- coding: utf-8 -*-
+
+"""This file is part of the TPOT library.
+
+TPOT was primarily developed at the University of Pennsylvania by:
+    - Randal S. Olson (rso@randalolson.com)
+    - Weixuan Fu (weixuanf@upenn.edu)
+    - Daniel Angell (dpa34@drexel.edu)
+    - and many more generous open source contributors
+
+TPOT is free software: you can redistribute it and/or modify
+it under the terms of the GNU Lesser General Public License as
+published by the Free Software Foundation, either version 3 of
+the License, or (at your option) any later version.
+
+TPOT is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+GNU Lesser General Public License for more details.
+
+You should have received a copy of the GNU Lesser General Public
+License along with TPOT. If not, see <http://www.gnu.org/licenses/>.
+
+"""
+
+import random
+
+import numpy as np
+from sklearn.datasets import make_classification
+from tqdm import tqdm
+
+from tpot import TPOTClassifier
+from tpot.gp_deap import initialize_stats_dict
+
+RANDOM_STATE = 42
+
+
+def seed(random_state=RANDOM_STATE):
+    """Seed the random number generators used by TPOT."""
+    random.seed(random_state)
+    np.random.seed(random_state)
+
+
+def classification_data(n_samples=500, n_features=20):
+    """Generate a classification data set."""
+    return make_classification(
+        n_samples=n_samples,
+        n_features=n_features,
+        n_informative=min(n_features, 10),
+        random_state=RANDOM_STATE
+    )
+
+
+def tpot_classifier(**kwargs):
+    """Create a TPOTClassifier set up to optimize pipelines, as fit() does before the first generation."""
+    params = {'random_state': RANDOM_STATE, 'verbosity': 0, 'config_dict': 'TPOT light'}
+    params.update(kwargs)
+    tpot_obj = TPOTClassifier(**params)
+    tpot_obj._fit_init()
+    tpot_obj._pbar = tqdm(total=1, disable=True)
+    return tpot_obj
+
+
+def population(tpot_obj, size):
+    """Generate a seeded population of pipelines with a fitness, as after their evaluation."""
+    seed()
+    pop = tpot_obj._toolbox.population(n=size)
+    for ind in pop:
+        initialize_stats_dict(ind)
+        ind.fitness.values = (len(ind), 0.5)
+    return pop
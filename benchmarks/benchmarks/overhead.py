@@ -0,0 +1,289 @@
+# -*- coding: utf-8 -*-
+
+"""This file is part of the TPOT library.
+
+TPOT was primarily developed at the University of Pennsylvania by:
+    - Randal S. Olson (rso@randalolson.com)
+    - Weixuan Fu (weixuanf@upenn.edu)
+    - Daniel Angell (dpa34@drexel.edu)
+    - and many more generous open source contributors
+
+TPOT is free software: you can redistribute it and/or modify
+it under the terms of the GNU Lesser General Public License as
+published by the Free Software Foundation, either version 3 of
+the License, or (at your option) any later version.
+
+TPOT is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+GNU Lesser General Public License for more details.
+
+You should have received a copy of the GNU Lesser General Public
+License along with TPOT. If not, see <http://www.gnu.org/licenses/>.
+
+"""
+
+from __future__ import print_function
+
+import argparse
+import time
+import zlib
+from collections import OrderedDict, defaultdict
+from contextlib import contextmanager
+from functools import wraps
+
+import numpy as np
+from deap import tools
+from sklearn.base import BaseEstimator, ClassifierMixin, RegressorMixin, TransformerMixin
+from sklearn.datasets import make_classification, make_regression
+
+import tpot.base
+from tpot import TPOTClassifier, TPOTRegressor
+from tpot.base import TPOTBase
+from tpot.config.classifier import classifier_config_dict
+from tpot.config.regressor import regressor_config_dict
+from tpot.decorators import _pre_test
+from tpot.operator_utils import source_decode
+
+# phases of the optimization process, in the order of the report
+PHASES = ['generation', 'pre_test', 'compile', 'dispatch', 'scoring', 'selection', 'pareto_update']
+
+
+def _params_seed(estimator):
+    """Derive a seed from the parameters of an estimator, so that different pipelines get different scores."""
+    params = sorted((key, repr(value)) for key, value in estimator.get_params(deep=False).items())
+    return zlib.crc32(repr(params).encode('utf-8')) & 0xffffffff
+
+
+class _DummyClassifier(BaseEstimator, ClassifierMixin):
+    """Classifier predicting random classes in constant time per sample."""
+
+    def fit(self, X, y, sample_weight=None):
+        self.classes_ = np.unique(y)
+        return self
+
+    def predict(self, X):
+        random_state = np.random.RandomState(_params_seed(self))
+        return random_state.choice(self.classes_, size=X.shape[0])
+
+    def predict_proba(self, X):
+        return np.full((X.shape[0], len(self.classes_)), 1. / len(self.classes_))
+
+
+class _DummyRegressor(BaseEstimator, RegressorMixin):
+    """Regressor predicting a constant in constant time per sample."""
+
+    def fit(self, X, y, sample_weight=None):
+        self.mean_ = np.mean(y)
+        return self
+
+    def predict(self, X):
+        random_state = np.random.RandomState(_params_seed(self))
+        return np.full(X.shape[0], self.mean_ + random_state.randn())
+
+
+class _DummyTransformer(BaseEstimator, TransformerMixin):
+    """Transformer returning its input."""
+
+    def fit(self, X, y=None):
+        return self
+
+    def transform(self, X):
+        return X
+
+
+def _dummy_operator(name, op_obj, param_names):
+    """Create a dummy operator with the name and the parameters of an operator, at the module level."""
+    if issubclass(op_obj, ClassifierMixin):
+        base_class = _DummyClassifier
+    elif issubclass(op_obj, RegressorMixin):
+        base_class = _DummyRegressor
+    else:
+        base_class = _DummyTransformer
+    # scikit-learn reads the parameters of an estimator from the signature of __init__
+    source = 'def __init__(self{}):\n    pass\n'.format(''.join(', {}=None'.format(param) for param in param_names))
+    source += ''.join('    self.{0} = {0}\n'.format(param) for param in param_names)
+    namespace = {}
+    exec(source, namespace)
+    dummy = type(name, (base_class,), {'__init__': namespace['__init__'], '__module__': __name__})
+    # the operators are imported by name from this module
+    globals()[name] = dummy
+    return dummy
+
+
+def dummy_config(config_dict):
+    """Replace every operator of a configuration dictionary with a constant-time dummy operator.
+
+    The dummy operators have the name, the type (classifier, regressor or transformer) and
+    the hyperparameters of the operators they replace, so that TPOT generates the same
+    pipelines, but they fit and predict in constant time per sample, so that the optimization
+    process measures TPOT's overhead rather than the cost of the estimators.
+
+    Parameters
+    ----------
+    config_dict: dict
+        TPOT configuration dictionary
+
+    Returns
+    -------
+    dummy_config_dict: dict
+        Configuration dictionary of the dummy operators
+    """
+    dummy_config_dict = {}
+    for key, params in config_dict.items():
+        _, op_str, op_obj = source_decode(key)
+        if op_obj is None:
+            continue
+        _dummy_operator(op_str, op_obj, sorted(params))
+        dummy_config_dict['{}.{}'.format(__name__, op_str)] = params
+    return dummy_config_dict
+
+
+class PhaseTimer(object):
+    """Attribute the time spent in nested phases to the innermost phase."""
+
+    def __init__(self):
+        self.times = defaultdict(float)
+        self.calls = defaultdict(int)
+        self._stack = []
+        self._last = None
+
+    def _switch(self):
+        now = time.time()
+        if self._stack:
+            self.times[self._stack[-1]] += now - self._last
+        self._last = now
+
+    @contextmanager
+    def phase(self, name):
+        self._switch()
+        self._stack.append(name)
+        self.calls[name] += 1
+        try:
+            yield
+        finally:
+            self._switch()
+            self._stack.pop()
+
+    def wrap(self, name, func):
+        """Time the calls to func in the phase name."""
+        @wraps(func)
+        def timed(*args, **kwargs):
+            with self.phase(name):
+                return func(*args, **kwargs)
+        return timed
+
+
+@contextmanager
+def _timed_phases(timer):
+    """Time the phases of the optimization process of every TPOT object while in the context.
+
+    Needs Python 3, which keeps the functions decorated with _pre_test in __wrapped__.
+    """
+    original_setup_toolbox = TPOTBase._setup_toolbox
+
+    def setup_toolbox(self):
+        original_setup_toolbox(self)
+        self._toolbox.select = timer.wrap('selection', self._toolbox.select)
+
+    patches = [(TPOTBase, '_setup_toolbox', setup_toolbox)]
+    # the pipelines are generated in the generation phase, and pre-tested in the pre_test phase
+    for method_name in ['_generate', '_mate_operator', '_random_mutation_operator']:
+        undecorated = getattr(TPOTBase, method_name).__wrapped__
+        patches.append((TPOTBase, method_name,
+                        timer.wrap('pre_test', _pre_test(timer.wrap('generation', undecorated)))))
+    patches += [
+        (TPOTBase, '_preprocess_individuals', timer.wrap('compile', TPOTBase._preprocess_individuals)),
+        (TPOTBase, '_evaluate_individuals', timer.wrap('dispatch', TPOTBase._evaluate_individuals)),
+        (TPOTBase, '_check_periodic_pipeline', timer.wrap('pareto_update', TPOTBase._check_periodic_pipeline)),
+        (tpot.base, '_cross_val_score_before_deadline',
+         timer.wrap('scoring', tpot.base._cross_val_score_before_deadline)),
+        (tools.ParetoFront, 'update', timer.wrap('pareto_update', tools.ParetoFront.update))
+    ]
+
+    originals = [(obj, attr, getattr(obj, attr)) for obj, attr, _ in patches]
+    for obj, attr, value in patches:
+        setattr(obj, attr, value)
+    try:
+        yield
+    finally:
+        for obj, attr, value in originals:
+            setattr(obj, attr, value)
+
+
+def run_overhead_benchmark(mode='classification', population_size=100, offspring_size=None, generations=10,
+                           n_samples=1000, n_features=20, random_state=42, **tpot_params):
+    """Run the TPOT optimization process with dummy operators and time its phases.
+
+    The evaluation of the pipelines is timed in the scoring phase only if it runs in the
+    main process, i.e. with n_jobs=1; otherwise the dispatch phase includes the wait for
+    the workers.
+
+    Parameters
+    ----------
+    mode: 'classification' or 'regression', optional (default: 'classification')
+        Type of the optimized pipelines, with the default configuration of TPOT
+    population_size, offspring_size, generations, random_state: optional
+        Parameters of the TPOT optimization process
+    n_samples, n_features: int, optional (default: 1000, 20)
+        Size of the generated data set
+    tpot_params: keyword arguments
+        Other parameters of TPOTClassifier or TPOTRegressor
+
+    Returns
+    -------
+    report: OrderedDict
+        Time spent in each phase of PHASES and elsewhere ('other') during fit(), the
+        total time ('total'), in seconds, and the number of evaluated pipelines ('n_pipelines')
+    """
+    if mode == 'classification':
+        features, target = make_classification(n_samples=n_samples, n_features=n_features, random_state=random_state)
+        tpot_class, config_dict = TPOTClassifier, classifier_config_dict
+    else:
+        features, target = make_regression(n_samples=n_samples, n_features=n_features, random_state=random_state)
+        tpot_class, config_dict = TPOTRegressor, regressor_config_dict
+
+    tpot_obj = tpot_class(
+        population_size=population_size,
+        offspring_size=offspring_size,
+        generations=generations,
+        random_state=random_state,
+        config_dict=dummy_config(config_dict),
+        **tpot_params
+    )
+
+    timer = PhaseTimer()
+    with _timed_phases(timer):
+        start_time = time.time()
+        tpot_obj.fit(features, target)
+        total = time.time() - start_time
+
+    report = OrderedDict((phase, timer.times[phase]) for phase in PHASES)
+    report['other'] = total - sum(report.values())
+    report['total'] = total
+    report['n_pipelines'] = len(tpot_obj.evaluated_individuals_)
+    return report
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Time the phases of the TPOT optimization process with dummy operators.')
+    parser.add_argument('-mode', default='classification', choices=['classification', 'regression'])
+    parser.add_argument('-p', dest='population_size', default=100, type=int)
+    parser.add_argument('-os', dest='offspring_size', default=None, type=int)
+    parser.add_argument('-g', dest='generations', default=10, type=int)
+    parser.add_argument('-n', dest='n_samples', default=1000, type=int)
+    parser.add_argument('-f', dest='n_features', default=20, type=int)
+    parser.add_argument('-s', dest='random_state', default=42, type=int)
+    args = parser.parse_args()
+
+    report = run_overhead_benchmark(**vars(args))
+    print('{:<15}{:>10}{:>8}'.format('phase', 'seconds', '%'))
+    for phase in PHASES + ['other']:
+        print('{:<15}{:>10.3f}{:>8.1f}'.format(phase, report[phase], 100 * report[phase] / report['total']))
+    print('{:<15}{:>10.3f}'.format('total', report['total']))
+    print('{} pipelines evaluated, {:.1f} pipelines/s'.format(report['n_pipelines'],
+                                                             report['n_pipelines'] / report['total']))
+
+
+if __name__ == '__main__':
+    main()
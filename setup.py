@@ -47,6 +47,8 @@ This project is hosted at https://github.com/EpistasisLab/tpot
         'xgboost': ['xgboost==0.6a2'],
         'skrebate': ['skrebate>=0.3.4'],
         'mdr': ['scikit-mdr>=0.4.4'],
+        # pyarrow 1.0 does not support Python 2
+        'pyarrow': ['pyarrow>=1.0.0; python_version >= "3.5"'],
         'dask': ['dask>=0.18.2',
                  'distributed>=1.22.1',
                  'dask-ml>=0.9.0'],
@@ -0,0 +1,186 @@
+# -*- coding: utf-8 -*-
+
+"""This file is part of the TPOT library.
+
+TPOT was primarily developed at the University of Pennsylvania by:
+    - Randal S. Olson (rso@randalolson.com)
+    - Weixuan Fu (weixuanf@upenn.edu)
+    - Daniel Angell (dpa34@drexel.edu)
+    - and many more generous open source contributors
+
+TPOT is free software: you can redistribute it and/or modify
+it under the terms of the GNU Lesser General Public License as
+published by the Free Software Foundation, either version 3 of
+the License, or (at your option) any later version.
+
+TPOT is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+GNU Lesser General Public License for more details.
+
+You should have received a copy of the GNU Lesser General Public
+License along with TPOT. If not, see <http://www.gnu.org/licenses/>.
+
+"""
+
+from tpot.callbacks import Callback, CallbackDispatcher, MetricsSink, _replace_file
+
+import json
+import os
+from shutil import rmtree
+from tempfile import mkdtemp
+
+from nose.tools import assert_equal, assert_raises
+
+
+class RecordingCallback(Callback):
+    def __init__(self):
+        self.events = []
+
+    def on_generation_start(self, info):
+        self.events.append(('on_generation_start', info))
+
+    def on_generation_end(self, info):
+        self.events.append(('on_generation_end', info))
+        return info['generation'] >= 1
+
+
+class FailingCallback(Callback):
+    def on_generation_start(self, info):
+        raise ValueError('Failing callback')
+
+
+def test_CallbackDispatcher():
+    """Assert that CallbackDispatcher notifies the callbacks in the order of the events."""
+    callback = RecordingCallback()
+    dispatcher = CallbackDispatcher([FailingCallback(), callback])
+    # events are dropped before start
+    dispatcher.emit('on_generation_start', generation=0)
+    dispatcher.start()
+    assert dispatcher.active
+    dispatcher.emit('on_generation_start', generation=0)
+    dispatcher.emit('on_generation_end', generation=0)
+    dispatcher.emit('on_pareto_update', generation=0, pareto_front=[])
+    dispatcher.close()
+    assert not dispatcher.active
+
+    assert [event for event, _ in callback.events] == ['on_generation_start', 'on_generation_end']
+    assert callback.events[0][1]['generation'] == 0
+    assert 'time' in callback.events[0][1]
+    assert not dispatcher.stop_requested
+
+
+def test_CallbackDispatcher_2():
+    """Assert that CallbackDispatcher requests to stop when a callback returns True."""
+    dispatcher = CallbackDispatcher([RecordingCallback()])
+    dispatcher.start()
+    dispatcher.emit('on_generation_end', generation=0)
+    dispatcher.close()
+    assert not dispatcher.stop_requested
+
+    dispatcher.start()
+    dispatcher.emit('on_generation_end', generation=1)
+    dispatcher.close()
+    assert dispatcher.stop_requested
+
+
+def test_CallbackDispatcher_3():
+    """Assert that CallbackDispatcher does not start a thread without callbacks."""
+    dispatcher = CallbackDispatcher([])
+    dispatcher.start()
+    assert not dispatcher.active
+    dispatcher.emit('on_generation_start', generation=0)
+    dispatcher.close()
+
+
+def _feed_metrics_sink(sink):
+    """Send the events of a generation of two pipelines to a MetricsSink."""
+    sink.on_generation_start({'time': 0., 'generation': 0, 'n_pipelines': 2, 'n_cached': 2, 'n_workers': 2})
+    sink.on_evaluation_submitted({'time': 0., 'generation': 0, 'pipeline': 'GaussianNB(input_matrix)'})
+    sink.on_evaluation_submitted({'time': 0., 'generation': 0, 'pipeline': 'BernoulliNB(input_matrix)'})
+    sink.on_evaluation_completed({
+        'time': 1., 'generation': 0, 'pipeline': 'GaussianNB(input_matrix)', 'score': 0.9,
+        'wall_time': 1., 'cpu_time': 1., 'peak_rss_increase': 10., 'worker': 'localhost:1', 'failure': None
+    })
+    sink.on_timeout({'time': 2., 'generation': 0, 'pipeline': 'BernoulliNB(input_matrix)'})
+    sink.on_evaluation_completed({
+        'time': 2., 'generation': 0, 'pipeline': 'BernoulliNB(input_matrix)', 'score': -float('inf'),
+        'wall_time': 2., 'cpu_time': 2., 'peak_rss_increase': 10., 'worker': 'localhost:2', 'failure': 'Timeout'
+    })
+    sink.on_generation_end({'time': 2., 'generation': 0, 'n_pipelines': 2, 'n_cached': 2, 'duration': 2., 'best_score': 0.9})
+    sink.on_pareto_update({'time': 2., 'generation': 0, 'pareto_front': [('GaussianNB(input_matrix)', 1, 0.9)]})
+
+
+def test_MetricsSink():
+    """Assert that MetricsSink writes one JSON record per evaluation and per generation."""
+    tmp_dir = mkdtemp()
+    path = os.path.join(tmp_dir, 'metrics.jsonl')
+    sink = MetricsSink(path)
+    assert_equal(sink.format, 'jsonl')
+    _feed_metrics_sink(sink)
+
+    with open(path) as f:
+        records = [json.loads(line) for line in f]
+    rmtree(tmp_dir)
+
+    assert_equal([record['type'] for record in records], ['evaluation', 'evaluation', 'generation'])
+    assert_equal(records[0]['pipeline'], 'GaussianNB(input_matrix)')
+    assert_equal(records[0]['queue_depth'], 1)
+    assert_equal(records[1]['score'], None)
+    assert_equal(records[1]['failure'], 'Timeout')
+    assert_equal(records[1]['queue_depth'], 0)
+    assert_equal(records[2]['evaluations_total'], 2)
+    assert_equal(records[2]['failures_total'], 1)
+    assert_equal(records[2]['timeouts_total'], 1)
+    assert_equal(records[2]['pipelines_per_second'], 1.)
+    assert_equal(records[2]['worker_utilization'], 0.75)
+    assert_equal(records[2]['cache_hit_rate'], 0.5)
+    assert_equal(records[2]['best_score'], 0.9)
+
+
+def test_MetricsSink_2():
+    """Assert that MetricsSink writes the current value of the metrics in a Prometheus textfile."""
+    tmp_dir = mkdtemp()
+    path = os.path.join(tmp_dir, 'tpot.prom')
+    sink = MetricsSink(path)
+    assert_equal(sink.format, 'prometheus')
+    _feed_metrics_sink(sink)
+    sink.on_generation_start({'time': 3., 'generation': 1, 'n_pipelines': 0, 'n_cached': 4, 'n_workers': 2})
+    sink.on_generation_end({'time': 3., 'generation': 1, 'n_pipelines': 0, 'n_cached': 4, 'duration': 0.5, 'best_score': 0.9})
+
+    with open(path) as f:
+        lines = f.read().splitlines()
+    files = os.listdir(tmp_dir)
+    rmtree(tmp_dir)
+
+    assert_equal(files, ['tpot.prom'])
+    assert '# TYPE tpot_evaluations_total counter' in lines
+    assert 'tpot_evaluations_total 2.0' in lines
+    assert '# TYPE tpot_best_score gauge' in lines
+    assert 'tpot_best_score 0.9' in lines
+    assert 'tpot_generation 1.0' in lines
+    assert 'tpot_pareto_size 1.0' in lines
+    assert 'tpot_cache_hits_total 6.0' in lines
+    assert 'tpot_pipelines_per_second 0.0' in lines
+
+
+def test_replace_file():
+    """Assert that _replace_file replaces an existing file."""
+    tmp_dir = mkdtemp()
+    src, dst = os.path.join(tmp_dir, 'src'), os.path.join(tmp_dir, 'dst')
+    for content in ['first', 'second']:
+        with open(src, 'w') as f:
+            f.write(content)
+        _replace_file(src, dst)
+    with open(dst) as f:
+        content = f.read()
+    files = os.listdir(tmp_dir)
+    rmtree(tmp_dir)
+
+    assert_equal(content, 'second')
+    assert_equal(files, ['dst'])
+
+
+def test_MetricsSink_3():
+    """Assert that MetricsSink raises a ValueError for an unknown format."""
+    assert_raises(ValueError, MetricsSink, 'metrics.csv', 'csv')
@@ -25,6 +25,7 @@ License along with TPOT. If not, see <http://www.gnu.org/licenses/>.
 
 import subprocess
 import sys
+import zipfile
 from os import remove, path
 from contextlib import contextmanager
 from distutils.version import LooseVersion
@@ -38,7 +39,9 @@ import numpy as np
 import pandas as pd
 import sklearn
 
-from tpot.driver import positive_integer, float_range, _get_arg_parser, _print_args, _read_data_file, load_scoring_function, tpot_driver
+from tpot.driver import positive_integer, float_range, _get_arg_parser, _print_args, _read_data_file, _load_data, _detect_file_format, load_scoring_function, tpot_driver
+from tempfile import mkdtemp
+from shutil import rmtree
 from nose.tools import assert_raises, assert_equal, assert_in
 from unittest import TestCase
 
@@ -224,6 +227,120 @@ def test_read_data_file():
     assert isinstance(input_data, pd.DataFrame)
 
 
+def test_load_data():
+    """Assert that _load_data returns the same features and target for a CSV file read at once or in chunks."""
+    args = _get_arg_parser().parse_args(['tests/tests.csv', '-is', ',', '-target', 'class'])
+    input_data = _read_data_file(args)
+    memmap_folder = mkdtemp()
+
+    features, target = _load_data(args, memmap_folder)
+    assert np.allclose(features, input_data.drop('class', axis=1).values)
+    assert np.allclose(target, input_data['class'].values)
+
+    args = _get_arg_parser().parse_args(['tests/tests.csv', '-is', ',', '-target', 'class', '-chunksize', '7', '-dtype', 'float32'])
+    memmap_features, memmap_target = _load_data(args, memmap_folder)
+    assert isinstance(memmap_features, np.memmap)
+    assert_equal(memmap_features.dtype, np.float32)
+    assert np.allclose(memmap_features, features)
+    assert np.allclose(memmap_target, target)
+
+    del memmap_features
+    rmtree(memmap_folder, ignore_errors=True)
+
+
+def test_load_data_2():
+    """Assert that _load_data memory-maps .npy files and uses -target as the index of the target column."""
+    input_data = pd.read_csv('tests/tests.csv', sep=',', dtype=np.float64)
+    memmap_folder = mkdtemp()
+    npy_file = path.join(memmap_folder, 'tests.npy')
+    np.save(npy_file, input_data.values)
+    target_index = list(input_data.columns).index('class')
+
+    args = _get_arg_parser().parse_args([npy_file, '-target', str(target_index)])
+    features, target = _load_data(args, memmap_folder)
+    assert np.allclose(features, input_data.drop('class', axis=1).values)
+    assert np.allclose(target, input_data['class'].values)
+
+    # the features are copied in chunks into a memory map when the target is a middle column
+    args = _get_arg_parser().parse_args([npy_file, '-target', '1', '-chunksize', '7'])
+    memmap_features, target = _load_data(args, memmap_folder)
+    assert isinstance(memmap_features, np.memmap)
+    assert np.allclose(memmap_features, np.delete(input_data.values, 1, axis=1))
+    assert np.allclose(target, input_data.values[:, 1])
+
+    # column names are not available in .npy files
+    args = _get_arg_parser().parse_args([npy_file, '-target', 'class'])
+    assert_raises(ValueError, _load_data, args, memmap_folder)
+
+    del features, memmap_features
+    rmtree(memmap_folder, ignore_errors=True)
+
+
+def test_load_data_3():
+    """Assert that _load_data reads the target and feature arrays of .npz files."""
+    input_data = pd.read_csv('tests/tests.csv', sep=',', dtype=np.float64)
+    memmap_folder = mkdtemp()
+    npz_file = path.join(memmap_folder, 'tests.npz')
+    np.savez(npz_file, features=input_data.drop('class', axis=1).values, ids=np.arange(input_data.shape[0]), **{'class': input_data['class'].values})
+
+    args = _get_arg_parser().parse_args([npz_file, '-target', 'class', '-dtype', 'float32'])
+    features, target = _load_data(args, memmap_folder)
+    assert_equal(features.dtype, np.float32)
+    assert np.allclose(features, input_data.drop('class', axis=1).values)
+    assert np.allclose(target, input_data['class'].values)
+
+    args = _get_arg_parser().parse_args([npz_file, '-target', 'clas'])
+    assert_raises(ValueError, _load_data, args, memmap_folder)
+
+    rmtree(memmap_folder, ignore_errors=True)
+
+
+def test_load_data_4():
+    """Assert that _load_data auto-detects and reads Parquet and Feather files."""
+    try:
+        import pyarrow  # noqa
+    except ImportError:
+        raise nose.SkipTest()
+
+    input_data = pd.read_csv('tests/tests.csv', sep=',', dtype=np.float64)
+    memmap_folder = mkdtemp()
+    parquet_file = path.join(memmap_folder, 'tests.data')
+    feather_file = path.join(memmap_folder, 'tests.feather')
+    input_data.to_parquet(parquet_file)
+    input_data.to_feather(feather_file)
+
+    for input_file in [parquet_file, feather_file]:
+        args = _get_arg_parser().parse_args([input_file, '-target', 'class'])
+        features, target = _load_data(args, memmap_folder)
+        assert np.allclose(features, input_data.drop('class', axis=1).values)
+        assert np.allclose(target, input_data['class'].values)
+
+    rmtree(memmap_folder, ignore_errors=True)
+
+
+def test_detect_file_format():
+    """Assert that _detect_file_format leaves zip-compressed CSV files and remote files to pandas.read_csv."""
+    input_data = pd.read_csv('tests/tests.csv', sep=',', dtype=np.float64)
+    memmap_folder = mkdtemp()
+    npz_file = path.join(memmap_folder, 'tests.npz')
+    np.savez(npz_file, features=input_data.values)
+    zip_file = path.join(memmap_folder, 'tests.csv.zip')
+    with zipfile.ZipFile(zip_file, 'w') as f:
+        f.write('tests/tests.csv', 'tests.csv')
+
+    assert_equal(_detect_file_format('tests/tests.csv'), 'csv')
+    assert_equal(_detect_file_format(npz_file), 'npz')
+    assert_equal(_detect_file_format(zip_file), 'csv')
+    assert_equal(_detect_file_format('https://example.com/tests.csv'), 'csv')
+
+    args = _get_arg_parser().parse_args([zip_file, '-is', ',', '-target', 'class'])
+    features, target = _load_data(args, memmap_folder)
+    assert np.allclose(features, input_data.drop('class', axis=1).values)
+    assert np.allclose(target, input_data['class'].values)
+
+    rmtree(memmap_folder, ignore_errors=True)
+
+
 class ParserTest(TestCase):
     def setUp(self):
         self.parser = _get_arg_parser()
@@ -233,7 +350,9 @@ class ParserTest(TestCase):
         """Assert that the TPOT driver stores correct default values for all parameters."""
         args = self.parser.parse_args(['tests/tests.csv'])
         self.assertEqual(args.CONFIG_FILE, None)
+        self.assertEqual(args.CHUNK_SIZE, None)
         self.assertEqual(args.CROSSOVER_RATE, 0.1)
+        self.assertEqual(args.DTYPE, 'float64')
         self.assertEqual(args.EARLY_STOP, None)
         self.assertEqual(args.DISABLE_UPDATE_CHECK, False)
         self.assertEqual(args.GENERATIONS, 100)
@@ -242,6 +361,7 @@ class ParserTest(TestCase):
         self.assertEqual(args.MAX_EVAL_MINS, 5)
         self.assertEqual(args.MAX_TIME_MINS, None)
         self.assertEqual(args.MEMORY, None)
+        self.assertEqual(args.METRICS_PATH, None)
         self.assertEqual(args.MUTATION_RATE, 0.9)
         self.assertEqual(args.NUM_CV_FOLDS, 5)
         self.assertEqual(args.NUM_JOBS, 1)
@@ -269,8 +389,10 @@ class ParserTest(TestCase):
         expected_output = """
 TPOT settings:
 CHECKPOINT_FOLDER   =     None
+CHUNK_SIZE          =     None
 CONFIG_FILE         =     None
 CROSSOVER_RATE      =     0.1
+DTYPE               =     float64
 EARLY_STOP          =     None
 GENERATIONS         =     100
 INPUT_FILE          =     tests/tests.csv
@@ -278,6 +400,7 @@ INPUT_SEPARATOR     =     ,
 MAX_EVAL_MINS       =     5
 MAX_TIME_MINS       =     None
 MEMORY              =     None
+METRICS_PATH        =     None
 MUTATION_RATE       =     0.9
 NUM_CV_FOLDS        =     5
 NUM_JOBS            =     1
@@ -311,8 +434,10 @@ VERBOSITY           =     1
         expected_output = """
 TPOT settings:
 CHECKPOINT_FOLDER   =     None
+CHUNK_SIZE          =     None
 CONFIG_FILE         =     None
 CROSSOVER_RATE      =     0.1
+DTYPE               =     float64
 EARLY_STOP          =     None
 GENERATIONS         =     100
 INPUT_FILE          =     tests/tests.csv
@@ -320,6 +445,7 @@ INPUT_SEPARATOR     =     ,
 MAX_EVAL_MINS       =     5
 MAX_TIME_MINS       =     None
 MEMORY              =     None
+METRICS_PATH        =     None
 MUTATION_RATE       =     0.9
 NUM_CV_FOLDS        =     5
 NUM_JOBS            =     1
@@ -0,0 +1,115 @@
+# -*- coding: utf-8 -*-
+
+"""This file is part of the TPOT library.
+
+TPOT was primarily developed at the University of Pennsylvania by:
+    - Randal S. Olson (rso@randalolson.com)
+    - Weixuan Fu (weixuanf@upenn.edu)
+    - Daniel Angell (dpa34@drexel.edu)
+    - and many more generous open source contributors
+
+TPOT is free software: you can redistribute it and/or modify
+it under the terms of the GNU Lesser General Public License as
+published by the Free Software Foundation, either version 3 of
+the License, or (at your option) any later version.
+
+TPOT is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+GNU Lesser General Public License for more details.
+
+You should have received a copy of the GNU Lesser General Public
+License along with TPOT. If not, see <http://www.gnu.org/licenses/>.
+
+"""
+
+from functools import partial
+
+import nose
+import numpy as np
+from nose.tools import assert_raises
+from sklearn.datasets import load_iris
+from sklearn.pipeline import make_pipeline
+from sklearn.linear_model import LogisticRegression
+from sklearn.model_selection import cross_val_score
+
+from tpot.executors import (
+    EvaluationExecutor, FuturesExecutor, LocalProcessExecutor, DaskExecutor, make_executor
+)
+from tpot.gp_deap import _wrapped_cross_val_score
+from tpot.metrics import SCORERS
+
+try:
+    from concurrent.futures import ThreadPoolExecutor
+except ImportError:
+    # concurrent.futures requires the futures package on Python 2
+    ThreadPoolExecutor = None
+
+iris = load_iris()
+evaluate = partial(_wrapped_cross_val_score, cv=3, scoring_function=SCORERS['accuracy'], timeout=60)
+
+
+def _check_executor(executor):
+    """Evaluate a pipeline with an executor and compare the score to cross_val_score."""
+    pipeline = make_pipeline(LogisticRegression(random_state=42))
+    executor.start(evaluate, features=iris.data, target=iris.target, sample_weight=None, groups=None)
+    try:
+        futures = [executor.submit(pipeline), executor.submit(pipeline)]
+        scores = [future.result() for future in executor.as_completed(futures)]
+    finally:
+        executor.shutdown()
+
+    expected_score = np.mean(cross_val_score(pipeline, iris.data, iris.target, cv=3, scoring='accuracy'))
+    assert np.allclose(scores, expected_score)
+
+
+def test_make_executor():
+    """Assert that make_executor builds the right EvaluationExecutor from the executor parameter."""
+    if ThreadPoolExecutor is None:
+        raise nose.SkipTest()
+    assert make_executor(None, 2) is None
+    assert isinstance(make_executor('processes', 2), LocalProcessExecutor)
+    assert isinstance(make_executor('threads', 2), FuturesExecutor)
+
+    thread_pool = ThreadPoolExecutor(max_workers=2)
+    executor = make_executor(thread_pool, 2)
+    assert isinstance(executor, FuturesExecutor)
+    assert executor.executor is thread_pool
+    assert not executor.owned
+    thread_pool.shutdown()
+
+    executor = EvaluationExecutor()
+    assert make_executor(executor, 2) is executor
+    assert_raises(ValueError, make_executor, 'not_an_executor', 2)
+
+
+def test_FuturesExecutor():
+    """Assert that FuturesExecutor returns the cross-validation score of a pipeline."""
+    if ThreadPoolExecutor is None:
+        raise nose.SkipTest()
+    _check_executor(make_executor('threads', 2))
+
+
+def test_LocalProcessExecutor():
+    """Assert that LocalProcessExecutor returns the cross-validation score of a pipeline."""
+    if ThreadPoolExecutor is None:
+        raise nose.SkipTest()
+    _check_executor(LocalProcessExecutor(2))
+
+
+def test_DaskExecutor():
+    """Assert that DaskExecutor returns the cross-validation score of a pipeline on a LocalCluster."""
+    try:
+        from distributed import Client, LocalCluster
+    except ImportError:
+        raise nose.SkipTest()
+
+    cluster = LocalCluster(n_workers=2, threads_per_worker=1, processes=False)
+    client = Client(cluster)
+    try:
+        executor = make_executor(client, 2)
+        assert isinstance(executor, DaskExecutor)
+        _check_executor(executor)
+    finally:
+        client.close()
+        cluster.close()
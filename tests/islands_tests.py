@@ -0,0 +1,63 @@
+# -*- coding: utf-8 -*-
+
+"""This file is part of the TPOT library.
+
+TPOT was primarily developed at the University of Pennsylvania by:
+    - Randal S. Olson (rso@randalolson.com)
+    - Weixuan Fu (weixuanf@upenn.edu)
+    - Daniel Angell (dpa34@drexel.edu)
+    - and many more generous open source contributors
+
+TPOT is free software: you can redistribute it and/or modify
+it under the terms of the GNU Lesser General Public License as
+published by the Free Software Foundation, either version 3 of
+the License, or (at your option) any later version.
+
+TPOT is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+GNU Lesser General Public License for more details.
+
+You should have received a copy of the GNU Lesser General Public
+License along with TPOT. If not, see <http://www.gnu.org/licenses/>.
+
+"""
+
+from tpot.islands import Island
+
+try:
+    from queue import Queue
+except ImportError:
+    from Queue import Queue
+
+from nose.tools import assert_equal
+
+
+def test_Island():
+    """Assert that Island sends individuals to the next island of the ring and receives them from the previous one."""
+    inboxes = [Queue(), Queue(), Queue()]
+    islands = [Island(index, inboxes, {}, Queue(), 1) for index in range(3)]
+
+    islands[0].send(['a', 'b'])
+    islands[2].send(['c'])
+    islands[0].send(['d'])
+    assert_equal(islands[0].receive(), ['c'])
+    assert_equal(islands[1].receive(), ['a', 'b', 'd'])
+    assert_equal(islands[1].receive(), [])
+    assert_equal(islands[2].receive(), [])
+
+
+def test_Island_2():
+    """Assert that Island shares the evaluated pipelines of the islands through the shared cache."""
+    shared_cache = {}
+    island = Island(0, [Queue()], shared_cache, Queue(), 1)
+
+    evaluated_individuals = {'a': {'internal_cv_score': 0.5}, 'b': {'internal_cv_score': 0.6}}
+    island.push(['a', 'c'], evaluated_individuals)
+    assert_equal(shared_cache, {'a': {'internal_cv_score': 0.5}})
+
+    shared_cache['d'] = {'internal_cv_score': 0.7}
+    evaluated_individuals = {'a': {'internal_cv_score': 0.4}}
+    island.pull(['a', 'd', 'e'], evaluated_individuals)
+    # pipelines already evaluated by this island are kept
+    assert_equal(evaluated_individuals, {'a': {'internal_cv_score': 0.4}, 'd': {'internal_cv_score': 0.7}})
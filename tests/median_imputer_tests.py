@@ -0,0 +1,101 @@
+# -*- coding: utf-8 -*-
+
+"""This file is part of the TPOT library.
+
+TPOT was primarily developed at the University of Pennsylvania by:
+    - Randal S. Olson (rso@randalolson.com)
+    - Weixuan Fu (weixuanf@upenn.edu)
+    - Daniel Angell (dpa34@drexel.edu)
+    - and many more generous open source contributors
+
+TPOT is free software: you can redistribute it and/or modify
+it under the terms of the GNU Lesser General Public License as
+published by the Free Software Foundation, either version 3 of
+the License, or (at your option) any later version.
+
+TPOT is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+GNU Lesser General Public License for more details.
+
+You should have received a copy of the GNU Lesser General Public
+License along with TPOT. If not, see <http://www.gnu.org/licenses/>.
+
+"""
+
+import numpy as np
+from sklearn.preprocessing import Imputer
+from tpot.builtins import MedianImputer, column_nan_mask
+
+X = np.array([[0., np.nan, 7., 0., np.nan],
+              [3., 0., 0., 2., np.nan],
+              [0., 1., 3., np.nan, np.nan],
+              [5., 4., 0., 0., np.nan]])
+
+
+def test_column_nan_mask():
+    """Assert that column_nan_mask finds the columns with missing values."""
+    assert np.array_equal(column_nan_mask(X), [False, True, False, True, True])
+
+
+def test_column_nan_mask_2():
+    """Assert that column_nan_mask gives the same result when the scan is split into many chunks."""
+    rng = np.random.RandomState(42)
+    X_large = rng.rand(1000, 20)
+    X_large[rng.randint(0, 1000, 5), [1, 5, 5, 17, 19]] = np.nan
+
+    expected = np.isnan(X_large).any(axis=0)
+    assert np.array_equal(column_nan_mask(X_large), expected)
+    assert np.array_equal(column_nan_mask(X_large, max_chunk_bytes=64), expected)
+
+
+def test_MedianImputer():
+    """Assert that MedianImputer imputes the same values as sklearn's median Imputer."""
+    op = MedianImputer()
+    X_transformed = op.fit_transform(X)
+    X_expected = Imputer(strategy="median").fit_transform(X)
+
+    assert X_transformed.shape == (4, 4)
+    assert np.allclose(X_transformed, X_expected)
+    assert np.array_equal(op.dropped_columns_, [4])
+    assert np.allclose(op.statistics_[:4], [1.5, 1., 1.5, 0.])
+
+
+def test_MedianImputer_2():
+    """Assert that MedianImputer keeps float32 inputs in float32 and does not modify its input."""
+    X_32 = X[:, :4].astype(np.float32)
+    X_transformed = MedianImputer().fit_transform(X_32)
+
+    assert X_transformed.dtype == np.float32
+    assert np.isnan(X_32[0, 1])
+    assert np.allclose(X_transformed[0, 1], 1.)
+
+
+def test_MedianImputer_3():
+    """Assert that MedianImputer imputes the columns without missing values at fit time with their median at fit time."""
+    op = MedianImputer().fit(X[:, :4])
+    statistics = op.statistics_.copy()
+    X_new = np.array([[np.nan, 2., 1., 0.],
+                      [2., 2., 1., 0.],
+                      [4., 2., 1., 0.]])
+    X_transformed = op.transform(X_new)
+
+    assert np.allclose(X_transformed[:, 0], [1.5, 2., 4.])
+    # transform does not learn from the data it transforms
+    assert np.array_equal(op.statistics_, statistics)
+    assert np.allclose(op.transform(X_new[:1]), X_transformed[:1])
+
+
+def test_MedianImputer_4():
+    """Assert that MedianImputer computes the same medians column by column as np.nanmedian and does not modify its input."""
+    rng = np.random.RandomState(42)
+    X_large = rng.rand(101, 20)
+    X_large[rng.randint(0, 101, 5), [1, 5, 5, 17, 19]] = np.nan
+    X_copy = X_large.copy()
+
+    op = MedianImputer().fit(X_large)
+    assert np.allclose(op.statistics_, np.nanmedian(X_large, axis=0))
+
+    X_transformed = op.transform(X_large)
+    assert not np.isnan(X_transformed).any()
+    assert np.allclose(X_large, X_copy, equal_nan=True)
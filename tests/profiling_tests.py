@@ -0,0 +1,81 @@
+# -*- coding: utf-8 -*-
+
+"""This file is part of the TPOT library.
+
+TPOT was primarily developed at the University of Pennsylvania by:
+    - Randal S. Olson (rso@randalolson.com)
+    - Weixuan Fu (weixuanf@upenn.edu)
+    - Daniel Angell (dpa34@drexel.edu)
+    - and many more generous open source contributors
+
+TPOT is free software: you can redistribute it and/or modify
+it under the terms of the GNU Lesser General Public License as
+published by the Free Software Foundation, either version 3 of
+the License, or (at your option) any later version.
+
+TPOT is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+GNU Lesser General Public License for more details.
+
+You should have received a copy of the GNU Lesser General Public
+License along with TPOT. If not, see <http://www.gnu.org/licenses/>.
+
+"""
+
+from tpot.profiling import ProfileCollector, _profiled_call, _should_profile
+
+import os
+import pstats
+from shutil import rmtree
+from tempfile import mkdtemp
+
+from nose.tools import assert_equal, assert_almost_equal
+
+
+def _busy(n):
+    return sum(i * i for i in range(n))
+
+
+def test_should_profile():
+    """Assert that _should_profile picks pipelines with the given probability."""
+    assert not any(_should_profile(0.) for _ in range(100))
+    assert all(_should_profile(1.) for _ in range(100))
+
+
+def test_profiled_call():
+    """Assert that _profiled_call returns the result of the function and its cProfile statistics."""
+    result, stats = _profiled_call(_busy, 1000)
+    assert_equal(result, _busy(1000))
+    assert any(funcname == '_busy' for _, _, funcname in stats)
+
+
+def test_ProfileCollector():
+    """Assert that ProfileCollector merges the statistics of the main process and of the workers."""
+    tmp_dir = mkdtemp()
+    path = os.path.join(tmp_dir, 'tpot.pstats')
+    collector = ProfileCollector()
+    collector.start()
+    _busy(1000)
+    collector.pause()
+    _, worker_stats = _profiled_call(_busy, 2000)
+    collector.add({'wall_time': 2., 'step_stats': [{'fit_time': 1., 'predict_time': 0.5}]})
+    collector.add({
+        'profile_stats': worker_stats,
+        'wall_time': 2.,
+        # the times of the last operator are not measured
+        'step_stats': [{'fit_time': 1., 'predict_time': 0.5}, {'fit_time': 0.25, 'predict_time': 0.},
+                       {'fit_time': None, 'predict_time': None}]
+    })
+    collector.resume()
+    summary = collector.dump(path)
+
+    stats = pstats.Stats(path)
+    rmtree(tmp_dir)
+
+    assert_equal(summary['n_pipelines'], 1)
+    assert_almost_equal(summary['estimator_time'], 1.75)
+    assert_almost_equal(summary['evaluation_overhead'], 0.25)
+    assert summary['optimization_overhead'] > 0
+    # _busy was called once from the main process and once from a worker
+    assert_equal([stat[1] for func, stat in stats.stats.items() if func[2] == '_busy'], [2])
@@ -103,3 +103,14 @@ def test_StackingEstimator_4():
     known_cv_score = 0.795877470354
 
     assert np.allclose(known_cv_score, cv_score)
+
+
+def test_StackingEstimator_float32():
+    """Assert that the StackingEstimator keeps float32 inputs in float32."""
+    stack_clf = StackingEstimator(estimator=RandomForestClassifier(random_state=42))
+    features_32 = training_features.astype(np.float32)
+    stack_clf.fit(features_32, training_target)
+    X_clf_transformed = stack_clf.transform(features_32)
+
+    assert X_clf_transformed.dtype == np.float32
+    assert np.allclose(features_32, X_clf_transformed[:, -features_32.shape[1]:])
@@ -0,0 +1,70 @@
+# -*- coding: utf-8 -*-
+
+"""This file is part of the TPOT library.
+
+TPOT was primarily developed at the University of Pennsylvania by:
+    - Randal S. Olson (rso@randalolson.com)
+    - Weixuan Fu (weixuanf@upenn.edu)
+    - Daniel Angell (dpa34@drexel.edu)
+    - and many more generous open source contributors
+
+TPOT is free software: you can redistribute it and/or modify
+it under the terms of the GNU Lesser General Public License as
+published by the Free Software Foundation, either version 3 of
+the License, or (at your option) any later version.
+
+TPOT is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+GNU Lesser General Public License for more details.
+
+You should have received a copy of the GNU Lesser General Public
+License along with TPOT. If not, see <http://www.gnu.org/licenses/>.
+
+"""
+
+from tpot import TPOTClassifier
+from tpot.surrogate import SurrogateModel
+
+import numpy as np
+from nose.tools import assert_equal
+
+tpot_obj = TPOTClassifier(random_state=42, config_dict='TPOT light')
+tpot_obj._fit_init()
+
+
+def _evaluated_individuals(n):
+    """Generate evaluated pipelines whose score grows with their number of nodes."""
+    evaluated_individuals = {}
+    for ind in tpot_obj._toolbox.population(n=n):
+        evaluated_individuals[str(ind)] = {'internal_cv_score': len(ind) / 10.}
+    return evaluated_individuals
+
+
+def test_SurrogateModel():
+    """Assert that SurrogateModel is only trained with enough successfully evaluated pipelines."""
+    surrogate = SurrogateModel(tpot_obj._pset, random_state=42, min_samples=10)
+    pop = tpot_obj._toolbox.population(n=5)
+
+    surrogate.fit({})
+    assert surrogate.predict(pop) is None
+
+    evaluated_individuals = _evaluated_individuals(50)
+    for individual_str in list(evaluated_individuals)[:45]:
+        evaluated_individuals[individual_str]['internal_cv_score'] = -float('inf')
+    surrogate.fit(evaluated_individuals)
+    assert surrogate.predict(pop) is None
+
+
+def test_SurrogateModel_2():
+    """Assert that SurrogateModel predicts the scores of pipelines from their structure."""
+    surrogate = SurrogateModel(tpot_obj._pset, random_state=42)
+    surrogate.fit(_evaluated_individuals(100))
+
+    pop = tpot_obj._toolbox.population(n=20)
+    scores = surrogate.predict(pop)
+    assert_equal(scores.shape, (20,))
+    # the random forest learns that the score grows with the number of nodes
+    lengths = np.array([len(ind) for ind in pop])
+    if lengths.min() < lengths.max():
+        assert scores[lengths == lengths.max()].mean() > scores[lengths == lengths.min()].mean()
@@ -5,9 +5,18 @@ https://github.com/DEAP/deap/issues/75
 import unittest
 
 import nose
+import numpy as np
 from sklearn.datasets import make_classification
+from sklearn.decomposition import PCA
+from sklearn.linear_model import LogisticRegression
+from sklearn.model_selection import cross_val_score
+from sklearn.naive_bayes import GaussianNB
+from sklearn.pipeline import make_pipeline
+from sklearn.preprocessing import StandardScaler
 
 from tpot import TPOTClassifier
+from tpot.gp_deap import _dask_data, _dask_cv_scores
+from tpot.metrics import SCORERS
 
 try:
     import dask  # noqa
@@ -16,6 +25,16 @@ except ImportError:
     raise nose.SkipTest()
 
 
+TELEMETRY_KEYS = ['wall_time', 'cpu_time', 'peak_rss_increase', 'fold_fit_times', 'fold_score_times', 'step_stats', 'worker', 'failure']
+
+
+def _without_telemetry(evaluated_individuals):
+    return {
+        pipeline: {key: value for key, value in stats.items() if key not in TELEMETRY_KEYS}
+        for pipeline, stats in evaluated_individuals.items()
+    }
+
+
 class TestDaskMatches(unittest.TestCase):
 
     def test_dask_matches(self):
@@ -44,5 +63,27 @@ class TestDaskMatches(unittest.TestCase):
                 self.assertEqual(a.score(X, y), b.score(X, y))
                 self.assertEqual(a.pareto_front_fitted_pipelines_.keys(),
                                  b.pareto_front_fitted_pipelines_.keys())
-                self.assertEqual(a.evaluated_individuals_,
-                                 b.evaluated_individuals_)
+                # the telemetry of the evaluations depends on the run
+                self.assertEqual(_without_telemetry(a.evaluated_individuals_),
+                                 _without_telemetry(b.evaluated_individuals_))
+
+    def test_dask_cv_scores(self):
+        X, y = make_classification(random_state=0)
+        pipelines = [
+            make_pipeline(StandardScaler(), PCA(n_components=2, random_state=0), GaussianNB()),
+            make_pipeline(StandardScaler(), PCA(n_components=2, random_state=0), LogisticRegression(random_state=0)),
+            make_pipeline(StandardScaler(), GaussianNB()),
+        ]
+        data = _dask_data(X, y)
+        scores = _dask_cv_scores(pipelines, X, y, cv=3, scoring_function=SCORERS['accuracy'], data=data)
+
+        # the folds and the common steps are computed once for the whole generation
+        graph = dask.base.collections_to_dsk(scores)
+        self.assertEqual(len([key for key in graph if key.startswith('tpot-split-')]), 3)
+        self.assertEqual(len([key for key in graph if key.startswith('tpot-standardscaler-')]), 3)
+        self.assertEqual(len([key for key in graph if key.startswith('tpot-pca-')]), 3)
+
+        with dask.config.set(scheduler='single-threaded'):
+            computed_scores = dask.compute(*scores)
+        for pipeline, score in zip(pipelines, computed_scores):
+            self.assertTrue(np.allclose(score, np.mean(cross_val_score(pipeline, X, y, cv=3))))
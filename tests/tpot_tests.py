@@ -23,11 +23,15 @@ License along with TPOT. If not, see <http://www.gnu.org/licenses/>.
 
 """
 
+import tpot.base
 from tpot import TPOTClassifier, TPOTRegressor
-from tpot.base import TPOTBase, is_notebook
+from tpot.base import TPOTBase, is_notebook, _measure_pipeline, LazyFittedPipelines
+from tpot.callbacks import Callback
+from tpot.islands import Island
 from tpot.driver import float_range
 from tpot.gp_types import Output_Array
-from tpot.gp_deap import mutNodeReplacement, _wrapped_cross_val_score, pick_two_individuals_eligible_for_crossover, cxOnePoint, varOr, initialize_stats_dict
+from tpot.gp_deap import mutNodeReplacement, _wrapped_cross_val_score, _cross_val_score_before_deadline, _instrumented_clone, pick_two_individuals_eligible_for_crossover, cxOnePoint, varOr, initialize_stats_dict, sortNondominated, selNSGA2
+from tpot.gp_deap import ParetoFront as SortedParetoFront
 from tpot.metrics import balanced_accuracy, SCORERS
 from tpot.operator_utils import TPOTOperatorClassFactory, set_sample_weight
 from tpot.decorators import pretest_X, pretest_y
@@ -44,12 +48,16 @@ import numpy as np
 import pandas as pd
 from scipy import sparse
 import inspect
+import pickle
+import pstats
 import random
+import threading
 import warnings
 from multiprocessing import cpu_count
 import os
 from re import search
 from datetime import datetime
+import time
 from time import sleep
 from tempfile import mkdtemp
 from shutil import rmtree
@@ -58,7 +66,9 @@ from sklearn.datasets import load_digits, load_boston
 from sklearn.model_selection import train_test_split, cross_val_score, GroupKFold
 from sklearn.externals.joblib import Memory
 from sklearn.metrics import make_scorer, roc_auc_score
-from deap import creator, gp
+from sklearn.pipeline import make_pipeline
+from sklearn.linear_model import LogisticRegression
+from deap import creator, gp, tools
 from deap.tools import ParetoFront
 from nose.tools import assert_raises, assert_not_equal, assert_greater_equal, assert_equal, assert_in
 from driver_tests import captured_output
@@ -70,6 +80,11 @@ try:
 except ImportError:
     from io import StringIO
 
+try:
+    from queue import Queue
+except ImportError:
+    from Queue import Queue
+
 # Ensure we can use `with closing(...) as ... :` syntax
 if getattr(StringIO, '__exit__', False) and \
    getattr(StringIO, '__enter__', False):
@@ -320,6 +335,102 @@ def test_timeout():
     assert return_value == "Timeout"
 
 
+def test_cross_val_score_before_deadline():
+    """Assert that _cross_val_score_before_deadline returns Timeout once the deadline is reached."""
+    pipeline = make_pipeline(LogisticRegression(random_state=42))
+    kwargs = dict(features=training_features, target=training_target, cv=5,
+                  scoring_function='accuracy', timeout=300)
+
+    return_value, eval_stats = _cross_val_score_before_deadline(pipeline, deadline=time.time() - 1, **kwargs)
+    assert return_value == "Timeout"
+    assert eval_stats['failure'] == "Deadline"
+
+    # the pipeline itself timed out
+    return_value, eval_stats = _cross_val_score_before_deadline(pipeline, deadline=None, **dict(kwargs, timeout=0))
+    assert return_value == "Timeout"
+    assert eval_stats['failure'] == "Timeout"
+
+    return_value, eval_stats = _cross_val_score_before_deadline(pipeline, deadline=time.time() + 300, **kwargs)
+    assert np.allclose(return_value, _cross_val_score_before_deadline(pipeline, deadline=None, **kwargs)[0])
+    assert eval_stats['wall_time'] > 0
+    assert eval_stats['cpu_time'] >= 0
+    assert eval_stats['peak_rss_increase'] is None or eval_stats['peak_rss_increase'] >= 0
+    assert len(eval_stats['fold_fit_times']) == 5
+    assert len(eval_stats['fold_score_times']) == 5
+    assert_equal(sum(eval_stats['fold_test_sizes']), training_features.shape[0])
+    assert eval_stats['worker'].endswith(':{}'.format(os.getpid()))
+    assert eval_stats['failure'] is None
+
+
+def test_cross_val_score_before_deadline_2():
+    """Assert that _cross_val_score_before_deadline does not measure the CPU time and memory of the process in a thread."""
+    pipeline = make_pipeline(LogisticRegression(random_state=42))
+    results = []
+    thread = threading.Thread(target=lambda: results.append(_cross_val_score_before_deadline(
+        pipeline, features=training_features, target=training_target, cv=5, scoring_function='accuracy', timeout=300
+    )))
+    thread.start()
+    thread.join()
+
+    return_value, eval_stats = results[0]
+    assert np.isfinite(return_value)
+    assert eval_stats['wall_time'] > 0
+    assert eval_stats['cpu_time'] is None
+    assert eval_stats['peak_rss_increase'] is None
+
+
+def test_instrumented_clone():
+    """Assert that _instrumented_clone records the fit and predict times of each operator of a pipeline."""
+    tpot_obj = TPOTClassifier()
+    tpot_obj._fit_init()
+    pipeline_string = (
+        'KNeighborsClassifier(StandardScaler(input_matrix), '
+        'KNeighborsClassifier__n_neighbors=10, KNeighborsClassifier__p=1, KNeighborsClassifier__weights=uniform)'
+    )
+    sklearn_pipeline = tpot_obj._toolbox.compile(expr=creator.Individual.from_string(pipeline_string, tpot_obj._pset))
+
+    step_stats = []
+    for _ in range(2):
+        pipeline = _instrumented_clone(sklearn_pipeline, step_stats)
+        pipeline.fit(training_features, training_target).predict(testing_features)
+
+    assert_equal([operator_stats['operator'] for operator_stats in step_stats], ['StandardScaler', 'KNeighborsClassifier'])
+    assert_equal(step_stats[1]['params']['n_neighbors'], 10)
+    for operator_stats in step_stats:
+        assert operator_stats['fit_time'] > 0
+        assert operator_stats['predict_time'] > 0
+        assert operator_stats['failure'] is None
+    # the original pipeline is not instrumented
+    assert 'fit' not in vars(sklearn_pipeline.steps[0][1])
+
+
+def test_instrumented_clone_2():
+    """Assert that _instrumented_clone does not measure the operators cloned by a pipeline with memory caching."""
+    tpot_obj = TPOTClassifier()
+    tpot_obj._fit_init()
+    pipeline_string = (
+        'KNeighborsClassifier(StandardScaler(input_matrix), '
+        'KNeighborsClassifier__n_neighbors=10, KNeighborsClassifier__p=1, KNeighborsClassifier__weights=uniform)'
+    )
+    sklearn_pipeline = tpot_obj._toolbox.compile(expr=creator.Individual.from_string(pipeline_string, tpot_obj._pset))
+    cachedir = mkdtemp()
+    sklearn_pipeline.memory = Memory(cachedir=cachedir, verbose=0)
+
+    step_stats = []
+    try:
+        pipeline = _instrumented_clone(sklearn_pipeline, step_stats)
+        pipeline.fit(training_features, training_target).predict(testing_features)
+    finally:
+        rmtree(cachedir)
+
+    # the pipeline fits a clone of StandardScaler
+    assert step_stats[0]['fit_time'] is None
+    assert step_stats[0]['predict_time'] is None
+    assert step_stats[0]['peak_rss_increase'] is None
+    assert step_stats[1]['fit_time'] > 0
+    assert step_stats[1]['predict_time'] > 0
+
+
 def test_invalid_pipeline():
     """Assert that _wrapped_cross_val_score return -float(\'inf\') with a invalid_pipeline"""
 
@@ -762,6 +873,131 @@ def test_predict_proba_5():
     assert result.shape == (features_with_nan.shape[0], num_labels)
 
 
+def test_predict_n_jobs():
+    """Assert that the TPOT predict and predict_proba functions return the same results when predicting row blocks in parallel."""
+    tpot_obj = TPOTClassifier()
+    tpot_obj._fit_init()
+    pipeline_string = (
+        'DecisionTreeClassifier('
+        'input_matrix, '
+        'DecisionTreeClassifier__criterion=gini, '
+        'DecisionTreeClassifier__max_depth=8, '
+        'DecisionTreeClassifier__min_samples_leaf=5, '
+        'DecisionTreeClassifier__min_samples_split=5)'
+    )
+    tpot_obj._optimized_pipeline = creator.Individual.from_string(pipeline_string, tpot_obj._pset)
+    tpot_obj.fitted_pipeline_ = tpot_obj._toolbox.compile(expr=tpot_obj._optimized_pipeline)
+    tpot_obj.fitted_pipeline_.fit(training_features, training_target)
+    # use small blocks so that the testing set is split
+    tpot_obj._min_rows_per_predict_block = 100
+
+    for backend in ['threading', 'multiprocessing']:
+        assert np.array_equal(
+            tpot_obj.predict(testing_features, n_jobs=3, backend=backend),
+            tpot_obj.predict(testing_features, n_jobs=1)
+        )
+        assert np.allclose(
+            tpot_obj.predict_proba(testing_features, n_jobs=3, backend=backend),
+            tpot_obj.predict_proba(testing_features, n_jobs=1)
+        )
+
+
+def test_predict_n_jobs_2():
+    """Assert that predict is serial by default and splits the feature matrix like joblib with a negative n_jobs."""
+    tpot_obj = TPOTClassifier(n_jobs=3)
+    tpot_obj._fit_init()
+    pipeline_string = (
+        'DecisionTreeClassifier('
+        'input_matrix, '
+        'DecisionTreeClassifier__criterion=gini, '
+        'DecisionTreeClassifier__max_depth=8, '
+        'DecisionTreeClassifier__min_samples_leaf=5, '
+        'DecisionTreeClassifier__min_samples_split=5)'
+    )
+    tpot_obj._optimized_pipeline = creator.Individual.from_string(pipeline_string, tpot_obj._pset)
+    tpot_obj.fitted_pipeline_ = tpot_obj._toolbox.compile(expr=tpot_obj._optimized_pipeline)
+    tpot_obj.fitted_pipeline_.fit(training_features, training_target)
+    # one row per block so that the number of blocks is the number of jobs
+    tpot_obj._min_rows_per_predict_block = 1
+
+    predict_block = tpot.base._predict_block
+    blocks = []
+
+    def counted_predict_block(*args):
+        blocks.append(args[-1].shape[0])
+        return predict_block(*args)
+
+    tpot.base._predict_block = counted_predict_block
+    try:
+        # the n_jobs of the optimization process is not used
+        tpot_obj.predict(testing_features)
+        assert_equal(blocks, [])
+        tpot_obj.predict(testing_features, n_jobs=-2)
+        assert_equal(len(blocks), cpu_count() - 1 if cpu_count() > 2 else 0)
+    finally:
+        tpot.base._predict_block = predict_block
+
+
+def test_predict_iter():
+    """Assert that the TPOT predict_iter function yields the same predictions as predict batch by batch."""
+    tpot_obj = TPOTClassifier()
+    tpot_obj._fit_init()
+    pipeline_string = (
+        'DecisionTreeClassifier('
+        'input_matrix, '
+        'DecisionTreeClassifier__criterion=gini, '
+        'DecisionTreeClassifier__max_depth=8, '
+        'DecisionTreeClassifier__min_samples_leaf=5, '
+        'DecisionTreeClassifier__min_samples_split=5)'
+    )
+    tpot_obj._optimized_pipeline = creator.Individual.from_string(pipeline_string, tpot_obj._pset)
+    tpot_obj.fitted_pipeline_ = tpot_obj._toolbox.compile(expr=tpot_obj._optimized_pipeline)
+    tpot_obj.fitted_pipeline_.fit(training_features, training_target)
+    expected = tpot_obj.predict(testing_features)
+
+    # a single feature matrix is split into batches of batch_size rows
+    batches = list(tpot_obj.predict_iter(testing_features, batch_size=100))
+    assert_equal(len(batches), int(np.ceil(testing_features.shape[0] / 100.)))
+    assert np.array_equal(np.concatenate(batches), expected)
+
+    # an iterable of DataFrames is scored batch by batch
+    df_batches = (pd.DataFrame(testing_features[i:i + 50]) for i in range(0, testing_features.shape[0], 50))
+    assert np.array_equal(np.concatenate(list(tpot_obj.predict_iter(df_batches))), expected)
+
+    # a delimited text file is read batch_size rows at a time
+    tmpdir = mkdtemp()
+    csv_path = os.path.join(tmpdir, 'testing_features.csv')
+    pd.DataFrame(testing_features).to_csv(csv_path, index=False)
+    assert np.array_equal(np.concatenate(list(tpot_obj.predict_iter(csv_path, batch_size=64))), expected)
+    # a unicode path is a path on Python 2 too
+    assert np.array_equal(np.concatenate(list(tpot_obj.predict_iter(u'{}'.format(csv_path), batch_size=64))), expected)
+
+    probas = np.concatenate(list(tpot_obj.predict_proba_iter(csv_path, batch_size=64)))
+    assert np.allclose(probas, tpot_obj.predict_proba(testing_features))
+    rmtree(tmpdir)
+
+
+def test_iter_batches():
+    """Assert that _iter_batches splits a sparse matrix of any format into batches of rows."""
+    tpot_obj = TPOTClassifier()
+    tpot_obj._fit_init()
+    coo_features = sparse.coo_matrix(testing_features)
+
+    batches = list(tpot_obj._iter_batches(coo_features, batch_size=100))
+    assert_equal(len(batches), int(np.ceil(testing_features.shape[0] / 100.)))
+    assert all(sparse.isspmatrix_csr(batch) for batch in batches)
+    assert np.array_equal(sparse.vstack(batches).toarray(), testing_features)
+
+
+def test_predict_iter_2():
+    """Assert that the TPOT predict_iter function raises a RuntimeError when no optimized pipeline exists."""
+    tpot_obj = TPOTClassifier()
+    tpot_obj._fit_init()
+
+    assert_raises(RuntimeError, tpot_obj.predict_iter, testing_features)
+    assert_raises(RuntimeError, tpot_obj.predict_proba_iter, testing_features)
+
+
 def test_warm_start():
     """Assert that the TPOT warm_start flag stores the pop and pareto_front from the first run."""
     tpot_obj = TPOTClassifier(
@@ -856,6 +1092,289 @@ def test_fit_4():
     assert not (tpot_obj._start_datetime is None)
 
 
+def test_fit_callbacks():
+    """Assert that the TPOT fit function notifies the callbacks and stops when a callback returns True."""
+    class RecordingCallback(Callback):
+        def __init__(self):
+            self.events = []
+
+        def on_generation_start(self, info):
+            self.events.append(('on_generation_start', info))
+
+        def on_generation_end(self, info):
+            self.events.append(('on_generation_end', info))
+            return info['generation'] >= 1
+
+        def on_evaluation_submitted(self, info):
+            self.events.append(('on_evaluation_submitted', info))
+
+        def on_evaluation_completed(self, info):
+            self.events.append(('on_evaluation_completed', info))
+
+        def on_pareto_update(self, info):
+            self.events.append(('on_pareto_update', info))
+
+    callback = RecordingCallback()
+    tpot_obj = TPOTClassifier(
+        random_state=42,
+        population_size=5,
+        offspring_size=5,
+        generations=10,
+        verbosity=0,
+        config_dict='TPOT light',
+        callbacks=[callback]
+    )
+    tpot_obj.fit(training_features, training_target)
+
+    events = [event for event, _ in callback.events]
+    # the callbacks are called asynchronously, so the optimization stops at one of the next generations
+    assert_greater_equal(events.count('on_generation_start'), 2)
+    assert events.count('on_generation_start') < 11
+    assert_equal(events.count('on_generation_start'), events.count('on_generation_end'))
+    assert_equal(events.count('on_evaluation_submitted'), events.count('on_evaluation_completed'))
+    assert 'on_pareto_update' in events
+    for event, info in callback.events:
+        if event == 'on_evaluation_completed':
+            assert info['pipeline'] in tpot_obj.evaluated_individuals_
+            assert 'wall_time' in info
+    assert isinstance(tpot_obj._optimized_pipeline, creator.Individual)
+
+
+def test_fit_profile():
+    """Assert that the TPOT fit function writes the cProfile statistics of the optimization process."""
+    tmp_dir = mkdtemp()
+    path = os.path.join(tmp_dir, 'tpot.pstats')
+    tpot_obj = TPOTClassifier(
+        random_state=42,
+        population_size=2,
+        offspring_size=4,
+        generations=1,
+        verbosity=0,
+        config_dict='TPOT light',
+        profile=path,
+        profile_fraction=1.
+    )
+    tpot_obj.fit(training_features, training_target)
+
+    stats = pstats.Stats(path)
+    rmtree(tmp_dir)
+    profiled_functions = [funcname for _, _, funcname in stats.stats]
+    # the optimization process and the evaluation of the pipelines are profiled
+    assert 'eaMuPlusLambda' in profiled_functions
+    assert '_wrapped_cross_val_score' in profiled_functions
+    for stats in tpot_obj.evaluated_individuals_.values():
+        assert 'profile_stats' not in stats
+
+
+def test_fit_profile_2():
+    """Assert that the TPOT fit function raises a ValueError when the profile fraction is not in (0, 1]."""
+    tpot_obj = TPOTClassifier(profile='tpot.pstats', profile_fraction=0.)
+    assert_raises(ValueError, tpot_obj.fit, training_features, training_target)
+
+
+def test_fit_islands():
+    """Assert that the TPOT fit function provides an optimized pipeline with n_islands > 1."""
+    tpot_obj = TPOTClassifier(
+        random_state=42,
+        population_size=4,
+        offspring_size=4,
+        generations=1,
+        verbosity=0,
+        config_dict='TPOT light',
+        n_islands=2
+    )
+    tpot_obj.fit(training_features, training_target)
+
+    assert isinstance(tpot_obj._optimized_pipeline, creator.Individual)
+    assert tpot_obj._pareto_front.items
+    # the pipelines evaluated by both islands are gathered in evaluated_individuals_
+    for pipeline in tpot_obj._pareto_front.items:
+        assert str(pipeline) in tpot_obj.evaluated_individuals_
+
+
+def test_fit_islands_2():
+    """Assert that the TPOT fit function raises a ValueError with an invalid n_islands."""
+    tpot_obj = TPOTClassifier(population_size=4, n_islands=5)
+    assert_raises(ValueError, tpot_obj.fit, training_features, training_target)
+
+    tpot_obj = TPOTClassifier(population_size=4, n_islands=2, executor='threads')
+    assert_raises(ValueError, tpot_obj.fit, training_features, training_target)
+
+
+def test_fit_surrogate():
+    """Assert that the TPOT fit function only evaluates offspring_size offspring in each generation with surrogate_ratio."""
+    tpot_obj = TPOTClassifier(
+        random_state=42,
+        population_size=10,
+        offspring_size=5,
+        generations=2,
+        verbosity=0,
+        config_dict='TPOT light',
+        surrogate_ratio=4.
+    )
+    tpot_obj.fit(training_features, training_target)
+
+    assert isinstance(tpot_obj._optimized_pipeline, creator.Individual)
+    assert len(tpot_obj.evaluated_individuals_) <= 20
+
+
+def test_fit_surrogate_2():
+    """Assert that the TPOT fit function raises a ValueError when surrogate_ratio is < 1."""
+    tpot_obj = TPOTClassifier(surrogate_ratio=0.5)
+    assert_raises(ValueError, tpot_obj.fit, training_features, training_target)
+
+
+def test_screen_offspring():
+    """Assert that _screen_offspring keeps the offspring with the best predicted scores."""
+    class LengthSurrogate(object):
+        trained = False
+
+        def fit(self, evaluated_individuals):
+            return self
+
+        def predict(self, individuals):
+            if not self.trained:
+                return None
+            return np.array([len(ind) / 10. for ind in individuals])
+
+    tpot_obj = TPOTClassifier(random_state=42, verbosity=0, config_dict='TPOT light', surrogate_ratio=3.)
+    tpot_obj._fit_init()
+    tpot_obj._surrogate = LengthSurrogate()
+    pop = tpot_obj._toolbox.population(n=10)
+    for ind in pop:
+        ind.fitness.values = (len(ind), 0.5)
+
+    # the offspring are not screened before the surrogate model is trained
+    offspring = tpot_obj._screen_offspring(pop, 5, 0.1, 0.9)
+    assert_equal(len(offspring), 5)
+
+    tpot_obj._surrogate.trained = True
+    random.seed(42)
+    np.random.seed(42)
+    offspring = tpot_obj._screen_offspring(pop, 5, 0.1, 0.9)
+    random.seed(42)
+    np.random.seed(42)
+    candidates = varOr(pop, tpot_obj._toolbox, 15, 0.1, 0.9)
+    assert_equal(len(offspring), 5)
+    assert_greater_equal(min(len(ind) for ind in offspring), sorted(len(ind) for ind in candidates)[-5])
+
+
+def test_screen_offspring_2():
+    """Assert that _screen_offspring generates the candidate offspring with a single call to varOr."""
+    tpot_obj = TPOTClassifier(random_state=42, verbosity=0, config_dict='TPOT light', surrogate_ratio=3.)
+    tpot_obj._fit_init()
+    pop = tpot_obj._toolbox.population(n=10)
+    for ind in pop:
+        ind.fitness.values = (len(ind), 0.5)
+
+    calls = []
+
+    def counting_varOr(population, toolbox, lambda_, cxpb, mutpb):
+        calls.append(lambda_)
+        return varOr(population, toolbox, lambda_, cxpb, mutpb)
+
+    tpot.base.varOr = counting_varOr
+    try:
+        offspring = tpot_obj._screen_offspring(pop, 5, 0.1, 0.9)
+    finally:
+        tpot.base.varOr = varOr
+    assert_equal(calls, [15])
+    assert_equal(len(offspring), 5)
+
+
+def test_fit_objectives():
+    """Assert that the TPOT fit function optimizes the fit time and predict latency of the pipelines with objectives."""
+    tpot_obj = TPOTClassifier(
+        random_state=42,
+        population_size=2,
+        offspring_size=4,
+        generations=1,
+        verbosity=0,
+        config_dict='TPOT light',
+        objectives=['fit_time', 'predict_latency']
+    )
+    try:
+        tpot_obj.fit(training_features, training_target)
+
+        assert isinstance(tpot_obj._optimized_pipeline, creator.Individual)
+        for pipeline in tpot_obj._pareto_front.items:
+            stats = tpot_obj.evaluated_individuals_[str(pipeline)]
+            assert_equal(pipeline.fitness.values,
+                         (stats['fit_time'], stats['predict_latency'], stats['internal_cv_score']))
+            assert stats['fit_time'] > 0
+            assert stats['predict_latency'] > 0
+    finally:
+        # restore the default fitness of the individuals for the other tests
+        TPOTClassifier(disable_update_check=True)._fit_init()
+
+
+def test_fit_objectives_2():
+    """Assert that the TPOT fit function raises a ValueError with invalid objectives."""
+    tpot_obj = TPOTClassifier(objectives=['operator_count', 'memory'])
+    assert_raises(ValueError, tpot_obj.fit, training_features, training_target)
+
+    tpot_obj = TPOTClassifier(objectives=['fit_time'], use_dask=True)
+    assert_raises(ValueError, tpot_obj.fit, training_features, training_target)
+
+
+def test_fitness_values():
+    """Assert that _fitness_values returns the objectives of a pipeline followed by its internal CV score."""
+    tpot_obj = TPOTClassifier(objectives=['predict_latency', 'operator_count'])
+    try:
+        tpot_obj._fit_init()
+        eval_stats = {
+            'fold_fit_times': [1., 3.],
+            'fold_score_times': [0.1, 0.3],
+            'fold_test_sizes': [10, 10]
+        }
+        stats = tpot_obj._combine_individual_stats(2, 0.9, {}, eval_stats)
+        assert np.allclose(stats['fit_time'], 2.)
+        assert np.allclose(stats['predict_latency'], 0.02)
+        assert np.allclose(tpot_obj._fitness_values(stats), (0.02, 2, 0.9))
+
+        # the objectives which were not measured, e.g. for failed pipelines, are the worst
+        stats = tpot_obj._combine_individual_stats(2, -float('inf'), {}, {'failure': 'ValueError'})
+        assert_equal(tpot_obj._fitness_values(stats), (float('inf'), 2, -float('inf')))
+    finally:
+        TPOTClassifier(disable_update_check=True)._fit_init()
+
+
+def test_migrate():
+    """Assert that _migrate replaces the worst individuals with the individuals received from the previous island."""
+    tpot_obj = TPOTClassifier(random_state=42, population_size=10, verbosity=0, config_dict='TPOT light')
+    tpot_obj._fit_init()
+    immigrant = creator.Individual.from_string('GaussianNB(input_matrix)', tpot_obj._pset)
+    pop = [ind for ind in tpot_obj._toolbox.population(n=20) if str(ind) != str(immigrant)][:10]
+    for i, ind in enumerate(pop):
+        ind.fitness.values = (1, i / 10.)
+    inboxes = [Queue(), Queue()]
+    shared_cache = {}
+    tpot_obj._island = Island(0, inboxes, shared_cache, Queue(), 2)
+
+    shared_cache[str(immigrant)] = {
+        'generation': 0,
+        'mutation_count': 0,
+        'crossover_count': 0,
+        'predecessor': ('ROOT',),
+        'operator_count': 1,
+        'internal_cv_score': 0.95
+    }
+    inboxes[0].put([str(immigrant)])
+
+    # no migration between the migration intervals
+    assert tpot_obj._migrate(pop, 1) is pop
+
+    new_pop = tpot_obj._migrate(pop, tpot_obj._migration_interval)
+    assert_equal(len(new_pop), 10)
+    # the two best individuals are sent to the next island
+    assert_equal(sorted(inboxes[1].get_nowait()), sorted(str(ind) for ind in pop[-2:]))
+    # the immigrant replaces the worst individual
+    assert str(immigrant) in [str(ind) for ind in new_pop]
+    assert all(ind is not pop[0] for ind in new_pop)
+    assert_equal(tpot_obj.evaluated_individuals_[str(immigrant)]['internal_cv_score'], 0.95)
+    assert_equal([ind.fitness.values for ind in new_pop if str(ind) == str(immigrant)], [(1, 0.95)])
+
+
 def test_fit_5():
     """Assert that the TPOT fit function provides an optimized pipeline with pandas DataFrame"""
     tpot_obj = TPOTClassifier(
@@ -873,6 +1392,140 @@ def test_fit_5():
     assert not (tpot_obj._start_datetime is None)
 
 
+def test_lazy_pareto_front():
+    """Assert that the pipelines on the Pareto front are only fitted on first access with lazy_pareto_front=True."""
+    tpot_obj = TPOTClassifier(
+        random_state=42,
+        population_size=5,
+        offspring_size=5,
+        generations=2,
+        verbosity=0,
+        lazy_pareto_front=True,
+        config_dict='TPOT light'
+    )
+    tpot_obj.fit(training_features, training_target)
+
+    pareto_front = tpot_obj.pareto_front_fitted_pipelines_
+    pipeline_strs = [str(pipeline) for pipeline in tpot_obj._pareto_front.items]
+    assert_equal(sorted(pareto_front.keys()), sorted(pipeline_strs))
+    # the best pipeline is reused instead of being fitted twice
+    assert pareto_front[str(tpot_obj._optimized_pipeline)] is tpot_obj.fitted_pipeline_
+
+    for pipeline_str in pipeline_strs:
+        pareto_front[pipeline_str].predict(testing_features)
+        assert pareto_front.is_fitted(pipeline_str)
+    assert pareto_front._features is None
+
+
+def test_lazy_pareto_front_3():
+    """Assert that the training set and the pipelines not fitted yet are not pickled with lazy_pareto_front=True."""
+    pipelines = {
+        'pipeline_1': make_pipeline(LogisticRegression(random_state=42)),
+        'pipeline_2': make_pipeline(LogisticRegression(random_state=42, C=0.1))
+    }
+    pareto_front = LazyFittedPipelines(pipelines, training_features, training_target)
+    pareto_front['pipeline_1']
+
+    unpickled = pickle.loads(pickle.dumps(pareto_front))
+    assert_equal(list(unpickled.keys()), ['pipeline_1'])
+    assert unpickled._features is None
+    assert unpickled._target is None
+    unpickled['pipeline_1'].predict(testing_features)
+    # the original object can still fit the other pipelines
+    pareto_front['pipeline_2'].predict(testing_features)
+
+
+def test_lazy_pareto_front_2():
+    """Assert that all the pipelines on the Pareto front are fitted at the end of fit() by default."""
+    tpot_obj = TPOTClassifier(
+        random_state=42,
+        population_size=5,
+        offspring_size=5,
+        generations=2,
+        n_jobs=2,
+        verbosity=0,
+        config_dict='TPOT light'
+    )
+    tpot_obj.fit(training_features, training_target)
+
+    for pipeline in tpot_obj._pareto_front.items:
+        assert tpot_obj.pareto_front_fitted_pipelines_.is_fitted(str(pipeline))
+        tpot_obj.pareto_front_fitted_pipelines_[str(pipeline)].predict(testing_features)
+
+
+def test_measure_pipeline():
+    """Assert that _measure_pipeline measures the predict latency, throughput and pickled size of a fitted pipeline."""
+    pipeline = make_pipeline(LogisticRegression(random_state=42)).fit(training_features, training_target)
+    metrics = _measure_pipeline(pipeline, testing_features[:100], n_repeats=3)
+
+    assert_equal(metrics['batch_size'], 100)
+    assert metrics['single_row_latency'] > 0
+    assert metrics['batch_latency'] > 0
+    assert np.allclose(metrics['throughput'], 100 / metrics['batch_latency'])
+    assert_equal(metrics['model_size'], len(pickle.dumps(pipeline, pickle.HIGHEST_PROTOCOL)))
+
+
+def test_pareto_front_metrics():
+    """Assert that pareto_front_metrics_ measures each pipeline on the Pareto front on first access."""
+    tpot_obj = TPOTClassifier(
+        random_state=42,
+        population_size=5,
+        offspring_size=5,
+        generations=2,
+        verbosity=0,
+        config_dict='TPOT light'
+    )
+    assert not hasattr(tpot_obj, 'pareto_front_metrics_')
+    tpot_obj.fit(training_features, training_target)
+
+    pareto_front_metrics = tpot_obj.pareto_front_metrics_
+    assert_equal(sorted(pareto_front_metrics), sorted(tpot_obj.pareto_front_fitted_pipelines_))
+    for pipeline_str, metrics in pareto_front_metrics.items():
+        assert tpot_obj.pareto_front_fitted_pipelines_.is_fitted(pipeline_str)
+        assert_equal(metrics['batch_size'], min(training_features.shape[0], tpot_obj._metrics_batch_size))
+        assert metrics['throughput'] > 0
+        assert metrics['model_size'] > 0
+    # the pipelines are only measured once
+    assert tpot_obj.pareto_front_metrics_ is pareto_front_metrics
+
+
+def test_pareto_front_metrics_2():
+    """Assert that the TPOT fit function prints the metrics of the Pareto front with verbosity=3."""
+    tpot_obj = TPOTClassifier(
+        random_state=42,
+        population_size=2,
+        offspring_size=2,
+        generations=1,
+        verbosity=3,
+        config_dict='TPOT light'
+    )
+    with captured_output() as (out, err):
+        tpot_obj.fit(training_features, training_target)
+    assert_in('Final Pareto front deployment metrics:', out.getvalue())
+    for pipeline_str in tpot_obj.pareto_front_metrics_:
+        assert_in(pipeline_str, out.getvalue())
+
+
+def test_pareto_front_metrics_3():
+    """Assert that the metrics of the Pareto front are printed when a pipeline of the front was skipped because of the deadline."""
+    tpot_obj = TPOTClassifier(
+        random_state=42,
+        population_size=5,
+        offspring_size=5,
+        generations=1,
+        verbosity=0,
+        config_dict='TPOT light'
+    )
+    tpot_obj.fit(training_features, training_target)
+    # pipelines skipped because of the deadline are not in evaluated_individuals_
+    skipped_pipeline_str = str(tpot_obj._pareto_front.items[0])
+    del tpot_obj.evaluated_individuals_[skipped_pipeline_str]
+
+    with captured_output() as (out, err):
+        tpot_obj._print_pareto_front_metrics()
+    assert_in(skipped_pipeline_str, out.getvalue())
+
+
 def test_memory():
     """Assert that the TPOT fit function runs normally with memory=\'auto\'."""
     tpot_obj = TPOTClassifier(
@@ -1342,6 +1995,29 @@ def test_evaluate_individuals():
         assert np.allclose(fitness_score[1], mean_cv_scores)
 
 
+def test_evaluate_individuals_telemetry():
+    """Assert that _evaluate_individuals records the telemetry of each pipeline in evaluated_individuals_."""
+    tpot_obj = TPOTClassifier(
+        random_state=42,
+        verbosity=0,
+        config_dict='TPOT light'
+    )
+    tpot_obj._fit_init()
+    tpot_obj._pbar = tqdm(total=1, disable=True)
+    pop = tpot_obj._toolbox.population(n=10)
+    tpot_obj._evaluate_individuals(pop, training_features, training_target)
+
+    for deap_pipeline in pop:
+        stats = tpot_obj.evaluated_individuals_[str(deap_pipeline)]
+        for key in ['wall_time', 'cpu_time', 'peak_rss_increase', 'fold_fit_times', 'fold_score_times', 'step_stats', 'worker', 'failure']:
+            assert key in stats
+        if stats['failure'] is None:
+            assert stats['wall_time'] >= sum(stats['fold_fit_times'])
+            assert len(stats['fold_score_times']) == 5
+        else:
+            assert stats['internal_cv_score'] == -float('inf')
+
+
 def test_evaluate_individuals_2():
     """Assert that _evaluate_individuals returns operator_counts and CV scores in correct order with n_jobs=2"""
     tpot_obj = TPOTClassifier(
@@ -1372,6 +2048,111 @@ def test_evaluate_individuals_2():
         assert np.allclose(fitness_score[1], mean_cv_scores)
 
 
+def test_evaluate_individuals_3():
+    """Assert that _evaluate_individuals returns the same fitness scores in the same order with executor='threads'."""
+    tpot_obj = TPOTClassifier(
+        random_state=42,
+        verbosity=0,
+        config_dict='TPOT light'
+    )
+    tpot_obj._fit_init()
+    tpot_obj._pbar = tqdm(total=1, disable=True)
+    pop = tpot_obj._toolbox.population(n=10)
+    fitness_scores = tpot_obj._evaluate_individuals(pop, training_features, training_target)
+
+    tpot_obj_threads = TPOTClassifier(
+        n_jobs=2,
+        random_state=42,
+        verbosity=0,
+        config_dict='TPOT light',
+        executor='threads'
+    )
+    tpot_obj_threads._fit_init()
+    tpot_obj_threads._pbar = tqdm(total=1, disable=True)
+    fitness_scores_threads = tpot_obj_threads._evaluate_individuals(pop, training_features, training_target)
+    tpot_obj_threads._shutdown_executor()
+
+    assert np.allclose(fitness_scores, fitness_scores_threads)
+
+
+def test_invalid_executor():
+    """Assert that _fit_init raises a ValueError with an unknown executor or with use_dask=True."""
+    tpot_obj = TPOTClassifier(executor='not_an_executor')
+    assert_raises(ValueError, tpot_obj._fit_init)
+
+    tpot_obj = TPOTClassifier(executor='threads', use_dask=True)
+    assert_raises(ValueError, tpot_obj._fit_init)
+
+
+def test_evaluation_deadline():
+    """Assert that _evaluation_deadline is the earliest of the max_time_mins and max_generation_time_mins deadlines."""
+    tpot_obj = TPOTClassifier()
+    tpot_obj._start_datetime = datetime.now()
+    assert tpot_obj._evaluation_deadline() is None
+
+    tpot_obj.max_time_mins = 10
+    assert abs(tpot_obj._evaluation_deadline() - (time.time() + 600)) < 5
+
+    tpot_obj.max_generation_time_mins = 1
+    assert abs(tpot_obj._evaluation_deadline() - (time.time() + 60)) < 5
+
+
+def test_evaluate_individuals_deadline():
+    """Assert that _evaluate_individuals scores the pipelines not evaluated before the generation deadline as timed out without caching them."""
+    tpot_obj = TPOTClassifier(
+        random_state=42,
+        verbosity=0,
+        config_dict='TPOT light',
+        max_generation_time_mins=1e-9
+    )
+    tpot_obj._fit_init()
+    tpot_obj._pbar = tqdm(total=1, disable=True)
+    pop = tpot_obj._toolbox.population(n=10)
+    fitness_scores = tpot_obj._evaluate_individuals(pop, training_features, training_target)
+
+    for deap_pipeline, fitness_score in zip(pop, fitness_scores):
+        assert fitness_score[1] == -float('inf')
+        # only the invalid pipelines are cached, the others are evaluated again in the next generation
+        stats = tpot_obj.evaluated_individuals_.get(str(deap_pipeline))
+        assert stats is None or stats['failure'] == 'Invalid'
+    _, eval_individuals_str, _, _ = tpot_obj._preprocess_individuals(pop)
+    assert_equal(sorted(eval_individuals_str),
+                 sorted(set(str(ind) for ind in pop) - set(tpot_obj.evaluated_individuals_)))
+
+
+def test_profile_report():
+    """Assert that profile_report aggregates the telemetry of the operators per operator and per hyperparameter."""
+    tpot_obj = TPOTClassifier(config_dict='TPOT light')
+    tpot_obj._fit_init()
+    assert_raises(RuntimeError, tpot_obj.profile_report)
+    assert_raises(ValueError, tpot_obj.profile_report, by='not_a_key')
+
+    def knn_stats(n_neighbors, fit_time, failure=None):
+        return {'operator': 'KNeighborsClassifier', 'params': {'n_neighbors': n_neighbors, 'n_jobs': 1},
+                'fit_time': fit_time, 'predict_time': 1., 'peak_rss_increase': 0., 'failure': failure}
+
+    tpot_obj.evaluated_individuals_ = {
+        'pipeline_1': {'step_stats': [knn_stats(10, 1.), knn_stats(100, 7., 'ValueError')]},
+        'pipeline_2': {'step_stats': [knn_stats(10, 3.)]},
+        'pipeline_3': {'step_stats': None},
+        # not measured because of memory caching
+        'pipeline_4': {'step_stats': [dict(knn_stats(10, None), predict_time=None, peak_rss_increase=None)]}
+    }
+
+    report = tpot_obj.profile_report()
+    assert_equal(report.loc['KNeighborsClassifier', 'evaluations'], 4)
+    assert np.allclose(report.loc['KNeighborsClassifier', 'mean_fit_time'], 11 / 3.)
+    assert np.allclose(report.loc['KNeighborsClassifier', 'total_time'], 14.)
+    assert np.allclose(report.loc['KNeighborsClassifier', 'failure_rate'], 1 / 4.)
+
+    report = tpot_obj.profile_report(by='hyperparameter')
+    # n_jobs is not a hyperparameter in config_dict
+    assert_equal(list(report.index), [('KNeighborsClassifier', 'n_neighbors', '100'),
+                                      ('KNeighborsClassifier', 'n_neighbors', '10')])
+    assert np.allclose(report.loc[('KNeighborsClassifier', 'n_neighbors', '10'), 'mean_fit_time'], 2.)
+    assert np.allclose(report.loc[('KNeighborsClassifier', 'n_neighbors', '100'), 'failure_rate'], 1.)
+
+
 def test_update_pbar():
     """Assert that _update_pbar updates self._pbar with printing correct warning message."""
     tpot_obj = TPOTClassifier(
@@ -1414,6 +2195,72 @@ def test_update_val():
         assert_equal(result_score_list, [0.9999, -float('inf')])
 
 
+def test_update_val_2():
+    """Assert _update_val keeps the telemetry of the pipelines and records the evaluation times of the successful and timed out ones."""
+    tpot_obj = TPOTClassifier(
+        random_state=42,
+        verbosity=0,
+        config_dict='TPOT light'
+    )
+    tpot_obj._fit_init()
+    tpot_obj._pbar = tqdm(total=10, disable=True)
+    result_score_list = []
+    result_score_list = tpot_obj._update_val((0.9999, {'wall_time': 2.}), result_score_list)
+    result_score_list = tpot_obj._update_val(("Timeout", {'wall_time': 300., 'failure': 'Timeout'}), result_score_list)
+    result_score_list = tpot_obj._update_val((-float('inf'), {'wall_time': 1., 'failure': 'ValueError'}), result_score_list)
+    assert_equal(result_score_list, [
+        (0.9999, {'wall_time': 2.}),
+        (-float('inf'), {'wall_time': 300., 'failure': 'Timeout'}),
+        (-float('inf'), {'wall_time': 1., 'failure': 'ValueError'})
+    ])
+    assert_equal(tpot_obj._eval_times, [2., 300.])
+
+
+def test_eval_timeout():
+    """Assert that _eval_timeout adapts the time limit of pipeline evaluations with adaptive_eval_time."""
+    tpot_obj = TPOTClassifier(max_eval_time_mins=5)
+    tpot_obj._fit_init()
+    tpot_obj._eval_times = [1.] * 20
+    assert_equal(tpot_obj._eval_timeout(), 300)
+
+    tpot_obj = TPOTClassifier(max_eval_time_mins=5, adaptive_eval_time=10)
+    tpot_obj._fit_init()
+    # not calibrated yet
+    tpot_obj._eval_times = [1.] * 5
+    assert_equal(tpot_obj._eval_timeout(), 300)
+    tpot_obj._eval_times = [1.] * 10 + [2.] * 10
+    assert_equal(tpot_obj._eval_timeout(), 20)
+    # bounded by max_eval_time_mins
+    tpot_obj._eval_times = [60.] * 20
+    assert_equal(tpot_obj._eval_timeout(), 300)
+    # never shorter than 10 seconds
+    tpot_obj._eval_times = [0.1] * 20
+    assert_equal(tpot_obj._eval_timeout(), 10)
+
+
+def test_eval_timeout_2():
+    """Assert that the time limit adapted with adaptive_eval_time does not shrink when pipelines time out."""
+    tpot_obj = TPOTClassifier(max_eval_time_mins=5, adaptive_eval_time=0.5, verbosity=0)
+    tpot_obj._fit_init()
+    tpot_obj._pbar = tqdm(total=100, disable=True)
+    for _ in range(10):
+        tpot_obj._update_val((0.9, {'wall_time': 40.}), [])
+    assert_equal(tpot_obj._eval_timeout(), 20)
+    # every pipeline of the next generations times out
+    for _ in range(5):
+        timeout = tpot_obj._eval_timeout()
+        for _ in range(10):
+            tpot_obj._update_val(("Timeout", {'wall_time': float(timeout), 'failure': 'Timeout'}), [])
+        assert_equal(tpot_obj._eval_timeout(), 20)
+
+
+def test_adaptive_eval_time():
+    """Assert that _fit_init raises a ValueError when adaptive_eval_time is not positive."""
+    for adaptive_eval_time in [0, -1.]:
+        tpot_obj = TPOTClassifier(adaptive_eval_time=adaptive_eval_time)
+        assert_raises(ValueError, tpot_obj._fit_init)
+
+
 def test_preprocess_individuals():
     """Assert _preprocess_individuals preprocess DEAP individuals including one evaluated individual"""
     tpot_obj = TPOTClassifier(
@@ -1630,6 +2477,107 @@ def test_check_dataset_5():
     assert np.allclose(ret_features, training_features)
 
 
+def test_check_dataset_6():
+    """Assert that the check_dataset function keeps the feature matrix in float32 when dtype='float32'."""
+    tpot_obj = TPOTClassifier(
+        random_state=42,
+        population_size=1,
+        offspring_size=2,
+        generations=1,
+        verbosity=0,
+        dtype='float32',
+        config_dict='TPOT light'
+    )
+
+    ret_features, ret_target = tpot_obj._check_dataset(training_features, training_target)
+    assert_equal(ret_features.dtype, np.float32)
+    assert np.allclose(ret_features, training_features)
+
+    ret_features = tpot_obj._check_dataset(features_with_nan.astype(np.float32), target=None)
+    assert_equal(ret_features.dtype, np.float32)
+
+
+def test_check_dataset_7():
+    """Assert that the check_dataset function returns valid C-contiguous arrays without copying them."""
+    tpot_obj = TPOTClassifier(
+        random_state=42,
+        population_size=1,
+        offspring_size=2,
+        generations=1,
+        verbosity=0,
+        config_dict='TPOT light'
+    )
+    features = np.ascontiguousarray(training_features)
+    target = np.ascontiguousarray(training_target)
+
+    ret_features, ret_target = tpot_obj._check_dataset(features, target)
+    assert ret_features is features
+    assert ret_target is target
+    assert tpot_obj._check_dataset(features, target=None) is features
+
+    # Fortran-ordered, NaN-containing or integer arrays must take the regular path
+    fortran_features = np.asfortranarray(training_features)
+    ret_features = tpot_obj._check_dataset(fortran_features, target=None)
+    assert ret_features is not fortran_features
+    assert ret_features.flags['C_CONTIGUOUS']
+    assert not tpot_obj._is_valid_array(features_with_nan)
+    assert not tpot_obj._is_valid_array(training_features.astype(np.int64))
+
+
+def test_predict_check_input():
+    """Assert that the TPOT predict function skips input validation when check_input=False."""
+    tpot_obj = TPOTClassifier(
+        random_state=42,
+        population_size=1,
+        offspring_size=2,
+        generations=1,
+        verbosity=0,
+        config_dict='TPOT light'
+    )
+    tpot_obj.fit(training_features, training_target)
+
+    assert np.array_equal(
+        tpot_obj.predict(testing_features, check_input=False),
+        tpot_obj.predict(testing_features)
+    )
+    assert np.allclose(
+        tpot_obj.score(testing_features, testing_target, check_input=False),
+        tpot_obj.score(testing_features, testing_target)
+    )
+    # NaN values are neither detected nor imputed when the input checks are bypassed
+    assert_raises(ValueError, tpot_obj.predict, features_with_nan, check_input=False)
+    assert_equal(tpot_obj._fitted_imputer, None)
+
+
+def test_invalid_dtype():
+    """Assert that _fit_init raises a ValueError when dtype is not float32 or float64."""
+    tpot_obj = TPOTClassifier(dtype='int32')
+    assert_raises(ValueError, tpot_obj._fit_init)
+
+    tpot_obj = TPOTClassifier(dtype='not_a_dtype')
+    assert_raises(ValueError, tpot_obj._fit_init)
+
+
+def test_fit_float32():
+    """Assert that the TPOT fit function provides an optimized pipeline with dtype='float32'."""
+    tpot_obj = TPOTClassifier(
+        random_state=42,
+        population_size=1,
+        offspring_size=2,
+        generations=1,
+        verbosity=0,
+        dtype='float32',
+        config_dict='TPOT light'
+    )
+    tpot_obj.fit(training_features, training_target)
+
+    assert isinstance(tpot_obj._optimized_pipeline, creator.Individual)
+    assert not (tpot_obj._start_datetime is None)
+    assert_equal(tpot_obj.predict(testing_features).shape, (testing_features.shape[0],))
+    score = tpot_obj.score(testing_features, testing_target)
+    assert 0.0 <= score <= 1.0
+
+
 def test_imputer():
     """Assert that the TPOT fit function will not raise a ValueError in a dataset where NaNs are present."""
     tpot_obj = TPOTClassifier(
@@ -1987,6 +2935,61 @@ def test_cxOnePoint():
     assert offspring2[0].ret == Output_Array
 
 
+def _population_with_fitness(n, random_state):
+    """Generate individuals with random fitness values, including duplicates and failed pipelines."""
+    rng = np.random.RandomState(random_state)
+    pop = []
+    for _ in range(n):
+        ind = creator.Individual.from_string('GaussianNB(input_matrix)', tpot_obj._pset)
+        score = -float('inf') if rng.rand() < 0.1 else round(rng.rand(), 1)
+        ind.fitness.values = (rng.randint(1, 6), score)
+        pop.append(ind)
+    return pop
+
+
+def test_sortNondominated():
+    """Assert that sortNondominated() sorts individuals with two objectives into the same fronts as DEAP."""
+    for random_state in range(20):
+        pop = _population_with_fitness(50, random_state)
+        for k in [1, 10, 50]:
+            fronts = sortNondominated(pop, k)
+            expected_fronts = tools.sortNondominated(pop, k)
+            assert_equal([sorted(id(ind) for ind in front) for front in fronts],
+                         [sorted(id(ind) for ind in front) for front in expected_fronts])
+        first_front = sortNondominated(pop, 50, first_front_only=True)
+        assert_equal(len(first_front), 1)
+        assert_equal(sorted(id(ind) for ind in first_front[0]),
+                     sorted(id(ind) for ind in tools.sortNondominated(pop, 50, first_front_only=True)[0]))
+
+
+def test_selNSGA2():
+    """Assert that selNSGA2() selects k individuals, including the first Pareto front."""
+    pop = _population_with_fitness(100, 42)
+    selected = selNSGA2(pop, 30)
+    assert_equal(len(selected), 30)
+    first_front = tools.sortNondominated(pop, 30, first_front_only=True)[0]
+    for ind in first_front:
+        assert ind in selected
+
+
+def test_ParetoFront():
+    """Assert that ParetoFront is updated to the same individuals as DEAP's ParetoFront."""
+    def pareto_eq(ind1, ind2):
+        return np.allclose(ind1.fitness.values, ind2.fitness.values)
+
+    for random_state in range(20):
+        pop = _population_with_fitness(50, random_state)
+        pareto_front = SortedParetoFront(similar=pareto_eq)
+        expected_pareto_front = ParetoFront(similar=pareto_eq)
+        for start in range(0, 50, 10):
+            pareto_front.update(pop[start:start + 10])
+            expected_pareto_front.update(pop[start:start + 10])
+            assert_equal([key.wvalues for key in pareto_front.keys],
+                         [key.wvalues for key in expected_pareto_front.keys])
+            assert_equal([ind.fitness.wvalues for ind in pareto_front.items],
+                         [ind.fitness.wvalues for ind in expected_pareto_front.items])
+
+
 def test_mutNodeReplacement():
     """Assert that mutNodeReplacement() returns the correct type of mutation node in a fixed pipeline."""
 
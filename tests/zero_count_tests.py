@@ -48,3 +48,12 @@ def test_ZeroCount_fit():
     ret_op = op.fit(X)
 
     assert ret_op==op
+
+
+def test_ZeroCount_float32():
+    """Assert that ZeroCount operator keeps float32 inputs in float32."""
+    op = ZeroCount()
+    X_transformed = op.transform(X.astype(np.float32))
+
+    assert X_transformed.dtype == np.float32
+    assert np.allclose(np.array([3, 2, 1, 4]), X_transformed[:, 0])
@@ -29,8 +29,12 @@ import inspect
 import warnings
 import sys
 import imp
+import time
+import pickle
+from timeit import default_timer
 from functools import partial
 from datetime import datetime
+import multiprocessing
 from multiprocessing import cpu_count
 import os
 import re
@@ -39,7 +43,23 @@ import errno
 from tempfile import mkdtemp
 from shutil import rmtree
 
+try:
+    from queue import Empty
+except ImportError:
+    from Queue import Empty
+
+try:
+    from collections.abc import Mapping
+except ImportError:
+    from collections import Mapping
+
+try:
+    string_types = basestring  # Python 2
+except NameError:
+    string_types = str
+
 import numpy as np
+import pandas as pd
 from scipy import sparse
 import deap
 from deap import base, creator, tools, gp
@@ -49,7 +69,7 @@ from sklearn.base import BaseEstimator
 from sklearn.utils import check_X_y, check_consistent_length, check_array
 from sklearn.externals.joblib import Parallel, delayed, Memory
 from sklearn.pipeline import make_pipeline, make_union
-from sklearn.preprocessing import FunctionTransformer, Imputer
+from sklearn.preprocessing import FunctionTransformer
 from sklearn.model_selection import train_test_split
 from sklearn.metrics.scorer import make_scorer, _BaseScorer
 
@@ -59,7 +79,7 @@ from ._version import __version__
 from .operator_utils import TPOTOperatorClassFactory, Operator, ARGType
 from .export_utils import export_pipeline, expr_to_tree, generate_pipeline_code
 from .decorators import _pre_test
-from .builtins import CombineDFs, StackingEstimator
+from .builtins import CombineDFs, StackingEstimator, MedianImputer, column_nan_mask
 
 from .config.classifier_light import classifier_config_dict_light
 from .config.regressor_light import regressor_config_dict_light
@@ -70,7 +90,13 @@ from .config.classifier_sparse import classifier_config_sparse
 
 from .metrics import SCORERS
 from .gp_types import Output_Array
-from .gp_deap import eaMuPlusLambda, mutNodeReplacement, _wrapped_cross_val_score, cxOnePoint
+from .executors import make_executor, _dask_as_completed, _DeadlineReached
+from .callbacks import CallbackDispatcher, MetricsSink
+from .profiling import ProfileCollector
+from .islands import Island, _run_island
+from .surrogate import SurrogateModel
+from .gp_deap import eaMuPlusLambda, varOr, mutNodeReplacement, cxOnePoint, selNSGA2, ParetoFront, initialize_stats_dict
+from .gp_deap import _cross_val_score_before_deadline, _dask_data, _dask_cv_scores, _get_dask_client
 
 # hot patch for Windows: solve the problem of crashing python after Ctrl + C in Windows OS
 # https://github.com/ContinuumIO/anaconda-issues/issues/905
@@ -114,6 +140,212 @@ else:
     from tqdm import tqdm
 
 
+def _predict_block(fitted_pipeline, method, features):
+    """Apply a prediction method of a fitted pipeline to a block of rows.
+
+    Defined at module level so that it can be pickled by the multiprocessing backend.
+
+    Parameters
+    ----------
+    fitted_pipeline: sklearn.pipeline.Pipeline
+        Fitted pipeline
+    method: string
+        Name of the prediction method, e.g. 'predict' or 'predict_proba'
+    features: array-like {n_block_samples, n_features}
+        Block of rows of the feature matrix
+
+    Returns
+    -------
+    array-like: {n_block_samples, ...}
+    """
+    return getattr(fitted_pipeline, method)(features)
+
+
+def _fit_pipeline(sklearn_pipeline, features, target):
+    """Fit a pipeline on a feature set and return it.
+
+    Defined at module level so that it can be pickled by the multiprocessing backend.
+
+    Parameters
+    ----------
+    sklearn_pipeline: sklearn.pipeline.Pipeline
+        Compiled pipeline
+    features: array-like {n_samples, n_features}
+        Feature matrix
+    target: array-like {n_samples}
+        List of class labels for prediction
+
+    Returns
+    -------
+    sklearn_pipeline: sklearn.pipeline.Pipeline
+        The fitted pipeline
+    """
+    with warnings.catch_warnings():
+        warnings.simplefilter('ignore')
+        sklearn_pipeline.fit(features, target)
+    return sklearn_pipeline
+
+
+def _measure_pipeline(fitted_pipeline, features, n_repeats=10):
+    """Measure the predict latency, throughput and pickled size of a fitted pipeline.
+
+    Parameters
+    ----------
+    fitted_pipeline: sklearn.pipeline.Pipeline
+        Fitted pipeline
+    features: array-like {n_samples, n_features}
+        Feature matrix of the batch to predict, whose rows are also predicted one at a time
+    n_repeats: int, optional (default: 10)
+        Number of single rows to predict, and of times to predict the batch
+
+    Returns
+    -------
+    metrics: dict
+        'single_row_latency': median time to predict a single row, in seconds
+        'batch_size': number of rows of the batch
+        'batch_latency': median time to predict the batch, in seconds
+        'throughput': number of rows predicted per second in the batch
+        'model_size': size of the pickled pipeline, in bytes
+    """
+    n_samples = features.shape[0]
+    single_row_times = []
+    batch_times = []
+    with warnings.catch_warnings():
+        warnings.simplefilter('ignore')
+        for i in range(n_repeats):
+            row = features[i % n_samples:i % n_samples + 1]
+            start_time = default_timer()
+            fitted_pipeline.predict(row)
+            single_row_times.append(default_timer() - start_time)
+        for _ in range(n_repeats):
+            start_time = default_timer()
+            fitted_pipeline.predict(features)
+            batch_times.append(default_timer() - start_time)
+    batch_latency = float(np.median(batch_times))
+    return {
+        'single_row_latency': float(np.median(single_row_times)),
+        'batch_size': n_samples,
+        'batch_latency': batch_latency,
+        'throughput': n_samples / batch_latency if batch_latency > 0 else float('inf'),
+        'model_size': len(pickle.dumps(fitted_pipeline, pickle.HIGHEST_PROTOCOL))
+    }
+
+
+class LazyFittedPipelines(Mapping):
+    """Read-only dictionary of pipelines which are fitted on the training set on first access.
+
+    The training set is kept in memory until all the pipelines are fitted. It is not
+    pickled: the pipelines which are not fitted yet are left out of the pickled object.
+    It is not copied either, so the training set must not be modified in place before
+    all the pipelines are fitted.
+    """
+
+    def __init__(self, pipelines, features, target):
+        """Create a LazyFittedPipelines object.
+
+        Parameters
+        ----------
+        pipelines: dictionary
+            Dictionary where the key is the string representation of a pipeline and
+            the value is the corresponding compiled (not fitted) sklearn pipeline
+        features: array-like {n_samples, n_features}
+            Feature matrix the pipelines are fitted on. It is referenced, not copied
+        target: array-like {n_samples}
+            List of class labels for prediction. It is referenced, not copied
+        """
+        self._pipelines = dict(pipelines)
+        self._unfitted = set(self._pipelines.keys())
+        self._features = features
+        self._target = target
+
+    def __getitem__(self, key):
+        if key in self._unfitted:
+            self._pipelines[key] = _fit_pipeline(self._pipelines[key], self._features, self._target)
+            self._set_fitted(key)
+        return self._pipelines[key]
+
+    def __iter__(self):
+        return iter(self._pipelines)
+
+    def __len__(self):
+        return len(self._pipelines)
+
+    def __repr__(self):
+        return '{}({} pipelines, {} not fitted yet)'.format(
+            self.__class__.__name__, len(self._pipelines), len(self._unfitted))
+
+    def __getstate__(self):
+        # Do not pickle the training set along with the fitted pipelines
+        state = self.__dict__.copy()
+        state['_pipelines'] = {key: pipeline for key, pipeline in self._pipelines.items()
+                               if key not in self._unfitted}
+        state['_unfitted'] = set()
+        state['_features'] = None
+        state['_target'] = None
+        return state
+
+    def is_fitted(self, key):
+        """Return whether the pipeline stored under key was already fitted."""
+        return key in self._pipelines and key not in self._unfitted
+
+    def set_fitted(self, key, fitted_pipeline):
+        """Store an already fitted pipeline under key, e.g. TPOT's fitted_pipeline_."""
+        self._pipelines[key] = fitted_pipeline
+        self._set_fitted(key)
+
+    def fit_all(self, n_jobs=1):
+        """Fit all the pipelines which were not fitted yet.
+
+        Parameters
+        ----------
+        n_jobs: int, optional (default: 1)
+            Number of pipelines to fit in parallel
+
+        Returns
+        -------
+        self: object
+        """
+        keys = sorted(self._unfitted)
+        if n_jobs == 1 or len(keys) < 2:
+            for key in keys:
+                self[key]
+        else:
+            parallel = Parallel(n_jobs=n_jobs, verbose=0)
+            fitted_pipelines = parallel(
+                delayed(_fit_pipeline)(self._pipelines[key], self._features, self._target)
+                for key in keys)
+            for key, fitted_pipeline in zip(keys, fitted_pipelines):
+                self.set_fitted(key, fitted_pipeline)
+        return self
+
+    def _set_fitted(self, key):
+        self._unfitted.discard(key)
+        # Do not keep the training set alive once there is nothing left to fit
+        if not self._unfitted:
+            self._features = None
+            self._target = None
+
+
+def _pareto_eq(ind1, ind2):
+    """Determine whether two individuals are equal on the Pareto front.
+
+    Parameters
+    ----------
+    ind1: DEAP individual from the GP population
+        First individual to compare
+    ind2: DEAP individual from the GP population
+        Second individual to compare
+
+    Returns
+    ----------
+    individuals_equal: bool
+        Boolean indicating whether the two individuals are equal on
+        the Pareto front
+
+    """
+    return np.allclose(ind1.fitness.values, ind2.fitness.values)
+
+
 class TPOTBase(BaseEstimator):
     """Automatically creates and optimizes machine learning pipelines using GP."""
 
@@ -124,7 +356,10 @@ class TPOTBase(BaseEstimator):
                  random_state=None, config_dict=None,
                  warm_start=False, memory=None, use_dask=False,
                  periodic_checkpoint_folder=None, early_stop=None,
-                 verbosity=0, disable_update_check=False):
+                 dtype='float64', lazy_pareto_front=False, executor=None,
+                 max_generation_time_mins=None, adaptive_eval_time=None, callbacks=None,
+                 metrics_path=None, profile=None, profile_fraction=0.1, n_islands=1, surrogate_ratio=None,
+                 objectives=None, verbosity=0, disable_update_check=False):
         """Set up the genetic programming algorithm for pipeline optimization.
 
         Parameters
@@ -237,10 +472,12 @@ class TPOTBase(BaseEstimator):
             None:
                 TPOT does not use memory caching.
         use_dask: boolean, default False
-            Whether to use Dask-ML's pipeline optimiziations. This avoid re-fitting
-            the same estimator on the same split of data multiple times. It
-            will also provide more detailed diagnostics when using Dask's
-            distributed scheduler.
+            Whether to evaluate the pipelines with Dask. The data set is sent to
+            the Dask workers once and all the pipelines of a generation are evaluated
+            in a single graph, in which pipelines starting with the same steps share
+            them. This avoid re-fitting the same estimator on the same split of data
+            multiple times. It will also provide more detailed diagnostics when using
+            Dask's distributed scheduler.
 
             See `avoid repeated work <https://dask-ml.readthedocs.io/en/latest/hyper-parameter-search.html#avoid-repeated-work>`__
             for more details.
@@ -254,6 +491,107 @@ class TPOTBase(BaseEstimator):
         early_stop: int or None (default: None)
             How many generations TPOT checks whether there is no improvement in optimization process.
             End optimization process if there is no improvement in the set number of generations.
+        dtype: string or numpy dtype, optional (default: 'float64')
+            Floating point type that the feature matrix is converted to before optimization,
+            prediction and scoring. Only 'float64' and 'float32' are supported.
+            Using 'float32' halves the memory footprint of the data during the whole
+            optimization process, at the cost of numerical precision.
+        lazy_pareto_front: boolean, optional (default: False)
+            If True, the pipelines on the Pareto front are compiled at the end of the
+            optimization process but each one is only fitted on the entire training set
+            the first time it is accessed in pareto_front_fitted_pipelines_. The training
+            set is kept in memory until they are all fitted, and the pipelines not fitted
+            yet are left out when the TPOT object is pickled. The training set is not
+            copied: modifying the arrays passed to fit() in place before all the pipelines
+            are fitted changes the data they are fitted on.
+            If False, they are all fitted at the end of the optimization process,
+            in parallel with n_jobs processes.
+        executor: string, EvaluationExecutor, concurrent.futures.Executor or dask.distributed.Client, optional (default: None)
+            Executor used to evaluate the pipelines in parallel. Each pipeline is submitted
+            to the executor, which returns a future of its cross-validation score.
+            None:
+                TPOT evaluates the pipelines with joblib, using n_jobs processes.
+            String 'processes':
+                TPOT evaluates the pipelines in a pool of n_jobs local processes,
+                sending the data set to each process only once (with every pipeline
+                before Python 3.7).
+            String 'threads':
+                TPOT evaluates the pipelines in a pool of n_jobs threads.
+            concurrent.futures.Executor:
+                TPOT submits the pipelines to the provided executor.
+            dask.distributed.Client:
+                TPOT scatters the data set to all the workers of the cluster once,
+                then submits the pipelines through the client.
+            Other executors can be plugged in by subclassing tpot.executors.EvaluationExecutor.
+            Cannot be combined with use_dask=True.
+        max_generation_time_mins: float, optional (default: None)
+            How many minutes TPOT has to evaluate the pipelines of a generation.
+            The pipelines which are still being evaluated when this budget or max_time_mins
+            is exhausted are cancelled and count as timed out, and the pipelines which
+            were already evaluated keep their scores.
+            If None, only max_time_mins limits the evaluation of a generation.
+        adaptive_eval_time: float, optional (default: None)
+            If not None, the time limit to evaluate a single pipeline adapts to the
+            pipelines evaluated so far: it is adaptive_eval_time times the 90th percentile
+            of their evaluation times, bounded by max_eval_time_mins and never shorter
+            than 10 seconds. The pipelines which timed out count at the time limit they
+            reached. The time limit is calibrated once 10 pipelines have been evaluated,
+            and is updated at each generation.
+            If None, every pipeline has max_eval_time_mins to be evaluated.
+        callbacks: list of tpot.callbacks.Callback, optional (default: None)
+            Callbacks notified of the events of the optimization process: start and end
+            of generations, submission and completion of pipeline evaluations, updates
+            of the Pareto front and timeouts. The callbacks are called from a background
+            thread, so they do not block the optimization process, and can stop it before
+            the next generation by returning True.
+        metrics_path: string, optional (default: None)
+            Path of a file to write the metrics of the optimization process to, for
+            monitoring tools: throughput, queue depth, worker utilization, best score,
+            size of the Pareto front and cache hit rate of each generation, and the
+            telemetry of each evaluated pipeline.
+            If the path ends with '.prom', the file is a Prometheus textfile, which is
+            rewritten with the current value of the metrics; otherwise, one JSON record
+            per generation and per evaluated pipeline is appended to the file.
+            If None, the metrics are not written.
+        profile: string, optional (default: None)
+            Path of a .pstats file to write cProfile statistics of the optimization process
+            to at the end of fit(), e.g. to find out why it is slow with pstats, snakeviz or a
+            flame graph tool. The statistics merge the main process, which generates,
+            compiles and pre-tests the pipelines, and the evaluation of a fraction of the
+            pipelines in the workers. The time spent by the operators of the pipelines is
+            reported apart from the TPOT overhead when verbosity is 1 or higher.
+            Pipeline evaluations are not profiled with use_dask=True.
+            If None, TPOT is not profiled.
+        profile_fraction: float, optional (default: 0.1)
+            Fraction of the pipeline evaluations to profile when profile is not None.
+            Profiling slows down the evaluation of the pipelines.
+        n_islands: int, optional (default: 1)
+            Number of sub-populations, or islands, evolving independently in separate
+            processes. Each island evolves population_size / n_islands pipelines with
+            n_jobs / n_islands evaluation workers, and sends a few of its best pipelines
+            to the next island every few generations. The islands share the pipelines
+            they evaluate, so that a pipeline is not evaluated twice, and do not wait for
+            each other between generations.
+            If 1, the population evolves in the main process. The islands cannot be
+            combined with use_dask or executor, and callbacks, metrics_path, profile and
+            periodic_checkpoint_folder only cover the results gathered from the islands
+            at the end of fit().
+        surrogate_ratio: float, optional (default: None)
+            If not None, generate surrogate_ratio times more offspring than offspring_size
+            in each generation, and only evaluate the offspring_size offspring with the
+            best internal CV scores predicted by a surrogate model. The surrogate model is
+            a random forest predicting the score of a pipeline from its operators and
+            hyperparameters, trained on the pipelines evaluated so far.
+            Must be >= 1.0. If None, all the offspring are evaluated.
+        objectives: list of string, optional (default: None)
+            Objectives to minimize while maximizing the internal CV score of the pipelines,
+            which make up the Pareto front along with the score. Possible inputs are:
+            'operator_count', the number of operators in the pipeline,
+            'fit_time', the mean fit time of the pipeline on a CV fold, in seconds, and
+            'predict_latency', the mean time to score the pipeline on a CV test sample,
+            in seconds, i.e. the prediction latency per sample.
+            The time objectives cannot be combined with use_dask, whose pipelines share
+            their fitted steps. If None, the only objective is 'operator_count'.
         verbosity: int, optional (default: 0)
             How much information TPOT communicates while it's running.
             0 = none, 1 = minimal, 2 = high, 3 = all.
@@ -283,6 +621,18 @@ class TPOTBase(BaseEstimator):
         self.max_eval_time_mins = max_eval_time_mins
         self.periodic_checkpoint_folder = periodic_checkpoint_folder
         self.early_stop = early_stop
+        self.dtype = dtype
+        self.lazy_pareto_front = lazy_pareto_front
+        self.executor = executor
+        self.max_generation_time_mins = max_generation_time_mins
+        self.adaptive_eval_time = adaptive_eval_time
+        self.callbacks = callbacks
+        self.metrics_path = metrics_path
+        self.profile = profile
+        self.profile_fraction = profile_fraction
+        self.n_islands = n_islands
+        self.surrogate_ratio = surrogate_ratio
+        self.objectives = objectives
         self.config_dict = config_dict
         self.warm_start = warm_start
         self.memory = memory
@@ -436,7 +786,8 @@ class TPOTBase(BaseEstimator):
     def _setup_toolbox(self):
         with warnings.catch_warnings():
             warnings.simplefilter('ignore')
-            creator.create('FitnessMulti', base.Fitness, weights=(-1.0, 1.0))
+            # the objectives are minimized and the internal CV score, always last, is maximized
+            creator.create('FitnessMulti', base.Fitness, weights=(-1.0,) * len(self._objectives) + (1.0,))
             creator.create('Individual', gp.PrimitiveTree, fitness=creator.FitnessMulti, statistics=dict)
 
         self._toolbox = base.Toolbox()
@@ -444,7 +795,7 @@ class TPOTBase(BaseEstimator):
         self._toolbox.register('individual', tools.initIterate, creator.Individual, self._toolbox.expr)
         self._toolbox.register('population', tools.initRepeat, list, self._toolbox.individual)
         self._toolbox.register('compile', self._compile_to_sklearn)
-        self._toolbox.register('select', tools.selNSGA2)
+        self._toolbox.register('select', selNSGA2)
         self._toolbox.register('mate', self._mate_operator)
         self._toolbox.register('expr_mut', self._gen_grow_safe, min_=1, max_=4)
         self._toolbox.register('mutate', self._random_mutation_operator)
@@ -469,6 +820,29 @@ class TPOTBase(BaseEstimator):
         # dont save periodic pipelines more often than this
         self._output_best_pipeline_period_seconds = 30
 
+        # dont split feature matrices into smaller row blocks than this for parallel prediction
+        self._min_rows_per_predict_block = 1000
+
+        # wait this long past the evaluation deadline for pipelines to stop by themselves before cancelling them
+        self._deadline_grace_seconds = 2
+
+        # evaluation times of the pipelines successfully evaluated or timed out, for adaptive_eval_time
+        self._eval_times = []
+        # dont adapt the time limit of pipeline evaluations before this many pipelines are evaluated
+        self._min_evals_for_adaptive_eval_time = 10
+        # the adapted time limit of pipeline evaluations never falls below this many seconds
+        self._min_adaptive_eval_timeout = 10
+
+        # measure the pipelines on the Pareto front on a batch of this many training samples,
+        # predicted this many times
+        self._metrics_batch_size = 1000
+        self._metrics_repeats = 10
+
+        # exchange individuals between the islands every this many generations
+        self._migration_interval = 5
+        # send this fraction of the population of an island to the next island at each migration
+        self._migration_fraction = 0.1
+
         # Try crossover and mutation at most this many times for
         # any one given individual (or pair of individuals)
         self._max_mut_loops = 50
@@ -527,14 +901,82 @@ class TPOTBase(BaseEstimator):
                 'The subsample ratio of the training instance must be in the range (0.0, 1.0].'
             )
 
+        if self.adaptive_eval_time is not None and not self.adaptive_eval_time > 0:
+            raise ValueError(
+                'adaptive_eval_time must be a positive number or None.'
+            )
+
+        try:
+            self._dtype = np.dtype(self.dtype)
+        except TypeError:
+            self._dtype = None
+        if self._dtype not in [np.float32, np.float64]:
+            raise ValueError(
+                'The dtype of the feature matrix must be either float32 or float64.'
+            )
+
         if self.n_jobs == -1:
             self._n_jobs = cpu_count()
         else:
             self._n_jobs = self.n_jobs
 
+        if self.use_dask and self.executor is not None:
+            raise ValueError(
+                'The use_dask and executor parameters cannot be combined. Please pass '
+                'the dask.distributed.Client as the executor and set use_dask to False.'
+            )
+        self._executor = make_executor(self.executor, self._n_jobs)
+        self._executor_started = False
+
+        callbacks = list(self.callbacks or [])
+        if self.metrics_path is not None:
+            callbacks.append(MetricsSink(self.metrics_path))
+        self._callbacks = CallbackDispatcher(callbacks)
+
+        if self.profile is not None and not 0. < self.profile_fraction <= 1.:
+            raise ValueError(
+                'The fraction of pipeline evaluations to profile must be in the range (0.0, 1.0].'
+            )
+        self._profile = ProfileCollector() if self.profile is not None else None
+
+        if self.n_islands < 1 or self.n_islands > self.population_size:
+            raise ValueError(
+                'The number of islands must be between 1 and the population size.'
+            )
+        if self.n_islands > 1 and (self.use_dask or self.executor is not None):
+            raise ValueError(
+                'The islands evaluate pipelines with their own workers, so n_islands cannot be '
+                'combined with use_dask or executor.'
+            )
+        # connection to the other islands, when evolving an island of the island model
+        self._island = None
+        self._unevaluated_individuals = {}
+
+        self._objectives = list(self.objectives or ['operator_count'])
+        for objective in self._objectives:
+            if objective not in ['operator_count', 'fit_time', 'predict_latency']:
+                raise ValueError(
+                    'Unknown objective {}: the objectives must be operator_count, fit_time '
+                    'or predict_latency.'.format(objective)
+                )
+        if self.use_dask and set(self._objectives) & set(['fit_time', 'predict_latency']):
+            raise ValueError(
+                'The fit_time and predict_latency objectives cannot be combined with use_dask.'
+            )
+        self._generation = 0
+        self._notified_pareto_front = None
+
         self._setup_pset()
         self._setup_toolbox()
 
+        if self.surrogate_ratio is not None:
+            if self.surrogate_ratio < 1.:
+                raise ValueError(
+                    'The ratio of generated to evaluated offspring must be >= 1.0.'
+                )
+            self._surrogate = SurrogateModel(self._pset, random_state=self.random_state)
+            self._toolbox.register('screen', self._screen_offspring)
+
 
     def fit(self, features, target, sample_weight=None, groups=None):
         """Fit an optimized machine learning pipeline.
@@ -602,31 +1044,15 @@ class TPOTBase(BaseEstimator):
         # assign population, self._pop can only be not None if warm_start is enabled
         if self._pop:
             pop = self._pop
-        else:
+        elif self.n_islands == 1:
             pop = self._toolbox.population(n=self.population_size)
-
-        def pareto_eq(ind1, ind2):
-            """Determine whether two individuals are equal on the Pareto front.
-
-            Parameters
-            ----------
-            ind1: DEAP individual from the GP population
-                First individual to compare
-            ind2: DEAP individual from the GP population
-                Second individual to compare
-
-            Returns
-            ----------
-            individuals_equal: bool
-                Boolean indicating whether the two individuals are equal on
-                the Pareto front
-
-            """
-            return np.allclose(ind1.fitness.values, ind2.fitness.values)
+        else:
+            # the islands generate their own populations
+            pop = []
 
         # Generate new pareto front if it doesn't already exist for warm start
         if not self.warm_start or not self._pareto_front:
-            self._pareto_front = tools.ParetoFront(similar=pareto_eq)
+            self._pareto_front = ParetoFront(similar=_pareto_eq)
 
         # Set lambda_ (offspring size in GP) equal to population_size by default
         if not self.offspring_size:
@@ -643,23 +1069,30 @@ class TPOTBase(BaseEstimator):
         self._pbar = tqdm(total=total_evals, unit='pipeline', leave=False,
                           disable=not (self.verbosity >= 2), desc='Optimization Progress')
 
+        self._callbacks.start()
+        if self._profile is not None:
+            self._profile.start()
+
         try:
             with warnings.catch_warnings():
                 self._setup_memory()
                 warnings.simplefilter('ignore')
-                pop, _ = eaMuPlusLambda(
-                    population=pop,
-                    toolbox=self._toolbox,
-                    mu=self.population_size,
-                    lambda_=self._lambda,
-                    cxpb=self.crossover_rate,
-                    mutpb=self.mutation_rate,
-                    ngen=self.generations,
-                    pbar=self._pbar,
-                    halloffame=self._pareto_front,
-                    verbose=self.verbosity,
-                    per_generation_function=self._check_periodic_pipeline
-                )
+                if self.n_islands > 1:
+                    pop = self._evolve_islands(pop, features, target, sample_weight, groups)
+                else:
+                    pop, _ = eaMuPlusLambda(
+                        population=pop,
+                        toolbox=self._toolbox,
+                        mu=self.population_size,
+                        lambda_=self._lambda,
+                        cxpb=self.crossover_rate,
+                        mutpb=self.mutation_rate,
+                        ngen=self.generations,
+                        pbar=self._pbar,
+                        halloffame=self._pareto_front,
+                        verbose=self.verbosity,
+                        per_generation_function=self._check_periodic_pipeline
+                    )
 
             # store population for the next call
             if self.warm_start:
@@ -681,6 +1114,10 @@ class TPOTBase(BaseEstimator):
                     if not isinstance(self._pbar, type(None)):
                         self._pbar.close()
 
+                    self._shutdown_executor()
+                    self._write_profile()
+                    self._notify_pareto_update()
+                    self._callbacks.close()
                     self._update_top_pipeline()
                     self._summary_of_best_pipeline(features, target)
                     # Delete the temporary cache before exiting
@@ -694,6 +1131,26 @@ class TPOTBase(BaseEstimator):
             return self
 
 
+    def _write_profile(self):
+        """Write the cProfile statistics collected during fit() to the profile file."""
+        if getattr(self, '_profile', None) is None:
+            return
+        summary = self._profile.dump(self.profile)
+        self._profile = None
+        if self.verbosity >= 1:
+            print(
+                'Profiled {} pipeline evaluations: {:.2f}s in the operators of the pipelines, '
+                '{:.2f}s of overhead evaluating them and {:.2f}s of overhead in the optimization '
+                'process. Statistics saved to {}'.format(
+                    summary['n_pipelines'],
+                    summary['estimator_time'],
+                    summary['evaluation_overhead'],
+                    summary['optimization_overhead'],
+                    self.profile
+                ),
+                file=self._file
+            )
+
     def _setup_memory(self):
         """Setup Memory object for memory caching.
         """
@@ -732,9 +1189,9 @@ class TPOTBase(BaseEstimator):
         if self._pareto_front:
             self._optimized_pipeline_score = -float('inf')
             for pipeline, pipeline_scores in zip(self._pareto_front.items, reversed(self._pareto_front.keys)):
-                if pipeline_scores.wvalues[1] > self._optimized_pipeline_score:
+                if pipeline_scores.wvalues[-1] > self._optimized_pipeline_score:
                     self._optimized_pipeline = pipeline
-                    self._optimized_pipeline_score = pipeline_scores.wvalues[1]
+                    self._optimized_pipeline_score = pipeline_scores.wvalues[-1]
 
             if not self._optimized_pipeline:
                 raise RuntimeError('There was an error in the TPOT optimization '
@@ -744,7 +1201,7 @@ class TPOTBase(BaseEstimator):
                                    'TPOTClassifier object. Please make sure you '
                                    'passed the data to TPOT correctly.')
             else:
-                pareto_front_wvalues = [pipeline_scores.wvalues[1] for pipeline_scores in self._pareto_front.keys]
+                pareto_front_wvalues = [pipeline_scores.wvalues[-1] for pipeline_scores in self._pareto_front.keys]
                 if not self._last_optimized_pareto_front:
                     self._last_optimized_pareto_front = pareto_front_wvalues
                 elif self._last_optimized_pareto_front == pareto_front_wvalues:
@@ -795,22 +1252,90 @@ class TPOTBase(BaseEstimator):
                 optimized_pipeline_str = self.clean_pipeline_string(self._optimized_pipeline)
                 print('Best pipeline:', optimized_pipeline_str)
 
-            # Store and fit the entire Pareto front as fitted models for convenience
-            self.pareto_front_fitted_pipelines_ = {}
+            # Store the entire Pareto front as models fitted on first access for convenience
+            self.pareto_front_fitted_pipelines_ = LazyFittedPipelines(
+                {str(pipeline): self._toolbox.compile(expr=pipeline) for pipeline in self._pareto_front.items},
+                features,
+                target
+            )
+            # The best pipeline is on the Pareto front and was fitted above
+            if str(self._optimized_pipeline) in self.pareto_front_fitted_pipelines_:
+                self.pareto_front_fitted_pipelines_.set_fitted(str(self._optimized_pipeline), self.fitted_pipeline_)
+
+            if not self.lazy_pareto_front:
+                self.pareto_front_fitted_pipelines_.fit_all(n_jobs=self._n_jobs)
 
-            for pipeline in self._pareto_front.items:
-                self.pareto_front_fitted_pipelines_[str(pipeline)] = self._toolbox.compile(expr=pipeline)
-                with warnings.catch_warnings():
-                    warnings.simplefilter('ignore')
-                    self.pareto_front_fitted_pipelines_[str(pipeline)].fit(features, target)
+            # The Pareto front is measured on a batch of training samples on first access
+            self._pareto_front_metrics = None
+            self._metrics_features = features[:self._metrics_batch_size].copy()
+            if self.verbosity >= 3:
+                self._print_pareto_front_metrics()
 
-    def predict(self, features):
+    @property
+    def pareto_front_metrics_(self):
+        """Predict latency, throughput and pickled size of each pipeline on the Pareto front.
+
+        The pipelines are fitted, if they were not yet, and measured on the first access.
+
+        Returns
+        -------
+        pareto_front_metrics: dict
+            Dictionary where the key is the string representation of a pipeline of
+            pareto_front_fitted_pipelines_ and the value is a dict with its
+            'single_row_latency', 'batch_size', 'batch_latency', 'throughput' and
+            'model_size', see _measure_pipeline
+        """
+        if getattr(self, '_pareto_front_metrics', None) is None:
+            if getattr(self, '_metrics_features', None) is None:
+                raise AttributeError('A pipeline has not yet been optimized. Please call fit() first.')
+            self._pareto_front_metrics = {
+                key: _measure_pipeline(pipeline, self._metrics_features, self._metrics_repeats)
+                for key, pipeline in self.pareto_front_fitted_pipelines_.items()
+            }
+            self._metrics_features = None
+        return self._pareto_front_metrics
+
+    def _print_pareto_front_metrics(self):
+        """Print the internal CV score and the metrics of each pipeline on the Pareto front."""
+        print('')
+        print('Final Pareto front deployment metrics:')
+        print('Score\tSingle-row latency (ms)\tThroughput (rows/s)\tSize (KB)\tPipeline')
+        # the pipelines skipped because of the deadline are on the front but not in evaluated_individuals_
+        scores = {str(pipeline): pipeline.fitness.values[-1] for pipeline in self._pareto_front.items}
+        pareto_front_metrics = sorted(
+            self.pareto_front_metrics_.items(),
+            key=lambda item: scores[item[0]],
+            reverse=True
+        )
+        for pipeline_str, metrics in pareto_front_metrics:
+            print('{}\t{:.3f}\t{:.1f}\t{:.1f}\t{}'.format(
+                scores[pipeline_str],
+                metrics['single_row_latency'] * 1000,
+                metrics['throughput'],
+                metrics['model_size'] / 1024.,
+                pipeline_str
+            ))
+
+    def predict(self, features, check_input=True, n_jobs=1, backend='threading'):
         """Use the optimized pipeline to predict the target for a feature set.
 
         Parameters
         ----------
         features: array-like {n_samples, n_features}
             Feature matrix
+        check_input: boolean, optional (default: True)
+            Allow to bypass the validation and imputation of the feature matrix.
+            Do not use this parameter unless you know what you do.
+        n_jobs: int, optional (default: 1)
+            Number of row blocks of the feature matrix to predict in parallel.
+            Assigning this to -1 will use as many cores as available on the computer,
+            and to -2 all the cores but one, and so on, like joblib.
+            By default, the feature matrix is predicted in the calling thread.
+            Feature matrices with less than 1000 rows per job are never split.
+        backend: string, optional (default: 'threading')
+            joblib backend used to predict the row blocks in parallel, either 'threading'
+            or 'multiprocessing'. With 'multiprocessing', the fitted pipeline is pickled
+            once per block and each worker receives exactly one block.
 
         Returns
         ----------
@@ -821,9 +1346,10 @@ class TPOTBase(BaseEstimator):
         if not self.fitted_pipeline_:
             raise RuntimeError('A pipeline has not yet been optimized. Please call fit() first.')
 
-        features = self._check_dataset(features, target=None, sample_weight=None)
+        if check_input:
+            features = self._check_dataset(features, target=None, sample_weight=None)
 
-        return self.fitted_pipeline_.predict(features)
+        return self._predict_in_blocks('predict', features, n_jobs, backend)
 
     def fit_predict(self, features, target, sample_weight=None, groups=None):
         """Call fit and predict in sequence.
@@ -851,7 +1377,7 @@ class TPOTBase(BaseEstimator):
 
         return self.predict(features)
 
-    def score(self, testing_features, testing_target):
+    def score(self, testing_features, testing_target, check_input=True):
         """Return the score on the given testing data using the user-specified scoring function.
 
         Parameters
@@ -860,6 +1386,9 @@ class TPOTBase(BaseEstimator):
             Feature matrix of the testing set
         testing_target: array-like {n_samples}
             List of class labels for prediction in the testing set
+        check_input: boolean, optional (default: True)
+            Allow to bypass the validation and imputation of the testing set.
+            Do not use this parameter unless you know what you do.
 
         Returns
         -------
@@ -870,24 +1399,38 @@ class TPOTBase(BaseEstimator):
         if self.fitted_pipeline_ is None:
             raise RuntimeError('A pipeline has not yet been optimized. Please call fit() first.')
 
-        testing_features, testing_target = self._check_dataset(testing_features, testing_target, sample_weight=None)
+        if check_input:
+            testing_features, testing_target = self._check_dataset(testing_features, testing_target, sample_weight=None)
 
         # If the scoring function is a string, we must adjust to use the sklearn
         # scoring interface
         score = SCORERS[self.scoring_function](
             self.fitted_pipeline_,
-            testing_features.astype(np.float64),
-            testing_target.astype(np.float64)
+            testing_features.astype(self.dtype, copy=False),
+            testing_target.astype(np.float64, copy=False)
         )
         return score
 
-    def predict_proba(self, features):
+    def predict_proba(self, features, check_input=True, n_jobs=1, backend='threading'):
         """Use the optimized pipeline to estimate the class probabilities for a feature set.
 
         Parameters
         ----------
         features: array-like {n_samples, n_features}
             Feature matrix of the testing set
+        check_input: boolean, optional (default: True)
+            Allow to bypass the validation and imputation of the feature matrix.
+            Do not use this parameter unless you know what you do.
+        n_jobs: int, optional (default: 1)
+            Number of row blocks of the feature matrix to predict in parallel.
+            Assigning this to -1 will use as many cores as available on the computer,
+            and to -2 all the cores but one, and so on, like joblib.
+            By default, the feature matrix is predicted in the calling thread.
+            Feature matrices with less than 1000 rows per job are never split.
+        backend: string, optional (default: 'threading')
+            joblib backend used to predict the row blocks in parallel, either 'threading'
+            or 'multiprocessing'. With 'multiprocessing', the fitted pipeline is pickled
+            once per block and each worker receives exactly one block.
 
         Returns
         -------
@@ -901,10 +1444,138 @@ class TPOTBase(BaseEstimator):
             if not (hasattr(self.fitted_pipeline_, 'predict_proba')):
                 raise RuntimeError('The fitted pipeline does not have the predict_proba() function.')
 
-            features = self._check_dataset(features, target=None, sample_weight=None)
+            if check_input:
+                features = self._check_dataset(features, target=None, sample_weight=None)
+
+            return self._predict_in_blocks('predict_proba', features, n_jobs, backend)
 
-            return self.fitted_pipeline_.predict_proba(features)
+    def _predict_in_blocks(self, method, features, n_jobs=None, backend='threading'):
+        """Apply a prediction method of the fitted pipeline to row blocks of a feature set in parallel.
 
+        Parameters
+        ----------
+        method: string
+            Name of the prediction method of the fitted pipeline, e.g. 'predict'
+        features: array-like {n_samples, n_features}
+            Checked feature matrix
+        n_jobs: int or None
+            Number of row blocks to predict in parallel, negative like joblib, None for 1
+        backend: string
+            joblib backend, 'threading' or 'multiprocessing'
+
+        Returns
+        -------
+        array-like: {n_samples, ...}
+            Predictions of all the row blocks concatenated in order
+        """
+        if n_jobs is None:
+            n_jobs = 1
+        elif n_jobs < 0:
+            # like joblib, -1 means all the cores, -2 all the cores but one, etc.
+            n_jobs = max(cpu_count() + 1 + n_jobs, 1)
+
+        n_blocks = min(n_jobs, features.shape[0] // self._min_rows_per_predict_block)
+        if n_blocks < 2:
+            return getattr(self.fitted_pipeline_, method)(features)
+
+        block_bounds = np.linspace(0, features.shape[0], n_blocks + 1).astype(int)
+        parallel = Parallel(n_jobs=n_blocks, backend=backend, verbose=0)
+        block_predictions = parallel(
+            delayed(_predict_block)(self.fitted_pipeline_, method, features[start:stop])
+            for start, stop in zip(block_bounds[:-1], block_bounds[1:]))
+
+        return np.concatenate(block_predictions)
+
+
+    def predict_iter(self, features, batch_size=10000, sep=','):
+        """Use the optimized pipeline to predict the target for a stream of feature batches.
+
+        Only one batch is validated, imputed and held in memory at a time, which allows
+        to score data sets that do not fit in memory.
+
+        Parameters
+        ----------
+        features: iterable of array-like, array-like {n_samples, n_features} or string
+            Either an iterable (e.g. a generator) of feature matrices, a single feature
+            matrix (e.g. a numpy.memmap) which is split into batches of batch_size rows,
+            or the path to a delimited text file which is read batch_size rows at a time
+        batch_size: int, optional (default: 10000)
+            Number of rows per batch when features is a feature matrix or a file path
+        sep: string, optional (default: ',')
+            Character used to separate columns when features is a file path
+
+        Returns
+        ----------
+        generator of array-like: {n_batch_samples}
+            Predicted target for the samples in each batch, in the order of the batches
+
+        """
+        if not self.fitted_pipeline_:
+            raise RuntimeError('A pipeline has not yet been optimized. Please call fit() first.')
+
+        return (self.predict(batch) for batch in self._iter_batches(features, batch_size, sep))
+
+    def predict_proba_iter(self, features, batch_size=10000, sep=','):
+        """Use the optimized pipeline to estimate the class probabilities for a stream of feature batches.
+
+        Parameters
+        ----------
+        features: iterable of array-like, array-like {n_samples, n_features} or string
+            Either an iterable (e.g. a generator) of feature matrices, a single feature
+            matrix (e.g. a numpy.memmap) which is split into batches of batch_size rows,
+            or the path to a delimited text file which is read batch_size rows at a time
+        batch_size: int, optional (default: 10000)
+            Number of rows per batch when features is a feature matrix or a file path
+        sep: string, optional (default: ',')
+            Character used to separate columns when features is a file path
+
+        Returns
+        -------
+        generator of array-like: {n_batch_samples, n_target}
+            The class probabilities of the samples in each batch, in the order of the batches
+
+        """
+        if not self.fitted_pipeline_:
+            raise RuntimeError('A pipeline has not yet been optimized. Please call fit() first.')
+        elif not (hasattr(self.fitted_pipeline_, 'predict_proba')):
+            raise RuntimeError('The fitted pipeline does not have the predict_proba() function.')
+
+        return (self.predict_proba(batch) for batch in self._iter_batches(features, batch_size, sep))
+
+    def _iter_batches(self, features, batch_size, sep=','):
+        """Split a feature set into batches of rows.
+
+        Parameters
+        ----------
+        features: iterable of array-like, array-like {n_samples, n_features} or string
+            Iterable of feature matrices, a feature matrix or the path to a delimited text file
+        batch_size: int
+            Number of rows per batch when features is a feature matrix or a file path
+        sep: string, optional (default: ',')
+            Character used to separate columns when features is a file path
+
+        Returns
+        -------
+        generator of array-like {n_batch_samples, n_features}
+        """
+        if batch_size < 1:
+            raise ValueError('batch_size must be a positive integer.')
+
+        if isinstance(features, string_types):
+            for batch in pd.read_csv(features, sep=sep, dtype=self.dtype, chunksize=batch_size):
+                yield batch
+        elif isinstance(features, pd.DataFrame):
+            for start in range(0, features.shape[0], batch_size):
+                yield features.iloc[start:start + batch_size]
+        elif isinstance(features, np.ndarray) or sparse.issparse(features):
+            if sparse.issparse(features):
+                # not all the sparse formats support slicing rows, e.g. COO
+                features = features.tocsr()
+            for start in range(0, features.shape[0], batch_size):
+                yield features[start:start + batch_size]
+        else:
+            for batch in features:
+                yield batch
 
     def clean_pipeline_string(self, individual):
         """Provide a string of the individual without the parameter prefixes.
@@ -936,6 +1607,7 @@ class TPOTBase(BaseEstimator):
         Currently used in the per generation hook in the optimization loop.
         """
         self._update_top_pipeline()
+        self._notify_pareto_update()
         if self.periodic_checkpoint_folder is not None:
             total_since_last_pipeline_save = (datetime.now() - self._last_pipeline_write).total_seconds()
             if total_since_last_pipeline_save > self._output_best_pipeline_period_seconds:
@@ -947,6 +1619,228 @@ class TPOTBase(BaseEstimator):
                 raise StopIteration("The optimized pipeline was not improved after evaluating {} more generations. "
                                     "Will end the optimization process.\n".format(self.early_stop))
 
+    def _notify_pareto_update(self):
+        """Notify the callbacks if the Pareto front changed since the last notification."""
+        if not self._callbacks.active:
+            return
+        pareto_front = [
+            (str(pipeline),) + tuple(pipeline_scores.wvalues)
+            for pipeline, pipeline_scores in zip(self._pareto_front.items, self._pareto_front.keys)
+        ]
+        if pareto_front and pareto_front != self._notified_pareto_front:
+            self._notified_pareto_front = pareto_front
+            # the Pareto front is updated after the evaluation of a generation
+            self._callbacks.emit('on_pareto_update', generation=self._generation - 1, pareto_front=pareto_front)
+
+    def _individual_from_string(self, individual_str):
+        """Rebuild an individual from its string representation, with its fitness and statistics if it was evaluated."""
+        ind = creator.Individual.from_string(individual_str, self._pset)
+        ind[0].ret = Output_Array
+        stats = self.evaluated_individuals_.get(individual_str)
+        if stats is not None:
+            ind.fitness.values = self._fitness_values(stats)
+            for key in ['generation', 'mutation_count', 'crossover_count', 'predecessor']:
+                ind.statistics[key] = stats[key]
+        else:
+            initialize_stats_dict(ind)
+        return ind
+
+    def _evolve_islands(self, pop, features, target, sample_weight=None, groups=None):
+        """Evolve the population as islands in separate processes and gather their results.
+
+        Parameters
+        ----------
+        pop: list
+            Population to start from with warm_start, split between the islands, or an empty list
+        features: numpy.ndarray {n_samples, n_features}
+            A numpy matrix containing the training and testing features for the pipelines' evaluation
+        target: numpy.ndarray {n_samples}
+            A numpy matrix containing the training and testing target for the pipelines' evaluation
+        sample_weight: array-like {n_samples}, optional
+            List of sample weights to balance (or un-balanace) the dataset target as needed
+        groups: array-like {n_samples, }, optional
+            Group labels for the samples used while splitting the dataset into train/test set
+
+        Returns
+        -------
+        pop: list
+            Final populations of the islands
+        """
+        manager = multiprocessing.Manager()
+        shared_cache = manager.dict(self.evaluated_individuals_)
+        inboxes = [manager.Queue() for _ in range(self.n_islands)]
+        results = manager.Queue()
+
+        params = self.get_params()
+        processes = []
+        for index in range(self.n_islands):
+            population_size = len(range(index, self.population_size, self.n_islands))
+            offspring_size = max(len(range(index, self._lambda, self.n_islands)), 1)
+            island_params = dict(
+                params,
+                population_size=population_size,
+                offspring_size=offspring_size,
+                n_jobs=max(self._n_jobs // self.n_islands, 1),
+                random_state=None if self.random_state is None else self.random_state + index,
+                n_islands=1,
+                warm_start=False,
+                periodic_checkpoint_folder=None,
+                callbacks=None,
+                metrics_path=None,
+                profile=None,
+                verbosity=0,
+                disable_update_check=True
+            )
+            island = Island(index, inboxes, shared_cache, results,
+                            max(int(population_size * self._migration_fraction), 1),
+                            [str(ind) for ind in pop[index::self.n_islands]])
+            processes.append(multiprocessing.Process(
+                target=_run_island,
+                args=(type(self), island_params, island, features, target, sample_weight, groups),
+                name='tpot-island-{}'.format(index)
+            ))
+
+        n_evaluated = len(shared_cache)
+        island_results = []
+        interrupted = None
+        try:
+            for process in processes:
+                process.start()
+            while len(island_results) < self.n_islands:
+                try:
+                    island_results.append(results.get(timeout=1))
+                except Empty:
+                    if not any(process.is_alive() for process in processes) and results.empty():
+                        break
+                except (KeyboardInterrupt, SystemExit) as e:
+                    # the islands are interrupted too, and send the results they have so far
+                    interrupted = e
+                    break
+                self._update_pbar(pbar_num=max(min(len(shared_cache) - n_evaluated, self._pbar.total) - self._pbar.n, 0))
+            if interrupted is not None:
+                deadline = time.time() + self._deadline_grace_seconds
+                while len(island_results) < self.n_islands and time.time() < deadline:
+                    try:
+                        island_results.append(results.get(timeout=0.1))
+                    except Empty:
+                        pass
+        finally:
+            for process in processes:
+                if process.is_alive():
+                    process.terminate()
+                process.join()
+
+        pop = []
+        for index, evaluated_individuals, population, pareto_front, error in sorted(island_results, key=lambda result: result[0]):
+            if error is not None:
+                manager.shutdown()
+                raise RuntimeError('Island {} failed:\n{}'.format(index, error))
+            self.evaluated_individuals_.update(evaluated_individuals)
+            self._pareto_front.update([self._individual_from_string(ind) for ind in pareto_front])
+            pop += [self._individual_from_string(ind) for ind in population]
+        manager.shutdown()
+
+        if interrupted is not None:
+            raise interrupted
+        return pop
+
+    def _evolve_island(self, island, features, target, sample_weight=None, groups=None):
+        """Evolve an island of the island model, in the process of the island.
+
+        Parameters
+        ----------
+        island: Island
+            Connection of the island to the other islands
+        features: numpy.ndarray {n_samples, n_features}
+            A numpy matrix containing the training and testing features for the pipelines' evaluation
+        target: numpy.ndarray {n_samples}
+            A numpy matrix containing the training and testing target for the pipelines' evaluation
+        sample_weight: array-like {n_samples}, optional
+            List of sample weights to balance (or un-balanace) the dataset target as needed
+        groups: array-like {n_samples, }, optional
+            Group labels for the samples used while splitting the dataset into train/test set
+
+        Returns
+        -------
+        pop: list
+            Final population of the island
+        """
+        self._fit_init()
+        self._island = island
+
+        if self.random_state is not None:
+            random.seed(self.random_state)
+            np.random.seed(self.random_state)
+
+        self._start_datetime = datetime.now()
+        self._last_pipeline_write = self._start_datetime
+        self._toolbox.register('evaluate', self._evaluate_individuals, features=features, target=target, sample_weight=sample_weight, groups=groups)
+        self._toolbox.register('migrate', self._migrate)
+        self._pareto_front = ParetoFront(similar=_pareto_eq)
+        self._pbar = tqdm(total=1, disable=True)
+
+        island.pull(island.initial_population, self.evaluated_individuals_)
+        pop = [self._individual_from_string(ind) for ind in island.initial_population]
+        pop += self._toolbox.population(n=self.population_size - len(pop))
+
+        try:
+            with warnings.catch_warnings():
+                self._setup_memory()
+                warnings.simplefilter('ignore')
+                pop, _ = eaMuPlusLambda(
+                    population=pop,
+                    toolbox=self._toolbox,
+                    mu=self.population_size,
+                    lambda_=self.offspring_size,
+                    cxpb=self.crossover_rate,
+                    mutpb=self.mutation_rate,
+                    ngen=self.generations,
+                    pbar=self._pbar,
+                    halloffame=self._pareto_front,
+                    verbose=0
+                )
+        except (KeyboardInterrupt, SystemExit, StopIteration):
+            pass
+        finally:
+            self._shutdown_executor()
+            self._cleanup_memory()
+        return pop
+
+    def _migrate(self, population, gen):
+        """Exchange individuals with the other islands every few generations.
+
+        The best individuals of the population, according to the selection operator, are
+        sent to the next island, and the individuals received from the previous island
+        replace the worst individuals of the population.
+
+        Parameters
+        ----------
+        population: list
+            Population of the island after the selection of a generation
+        gen: int
+            Generation of the island
+
+        Returns
+        -------
+        population: list
+            Population of the island after the migration
+        """
+        if self._island is None or gen % self._migration_interval:
+            return population
+
+        emigrants = self._toolbox.select(population, self._island.migration_size)
+        self._island.send([str(ind) for ind in emigrants])
+
+        population_strs = set(str(ind) for ind in population)
+        immigrant_strs = [ind for ind in self._island.receive() if ind not in population_strs]
+        # the emigrants were evaluated, so their scores are in the shared cache
+        self._island.pull(immigrant_strs, self.evaluated_individuals_)
+        immigrants = [self._individual_from_string(ind) for ind in immigrant_strs
+                      if ind in self.evaluated_individuals_][:len(population)]
+        if not immigrants:
+            return population
+        return self._toolbox.select(population, len(population) - len(immigrants)) + immigrants
+
     def _save_periodic_pipeline(self):
         try:
             self._create_periodic_checkpoint_folder()
@@ -969,6 +1863,81 @@ class TPOTBase(BaseEstimator):
             else:
                 raise ValueError('Failed creating the periodic_checkpoint_folder:\n{}'.format(e))
 
+    def profile_report(self, by='operator'):
+        """Aggregate the telemetry of the operators of the pipelines evaluated during the optimization process.
+
+        Parameters
+        ----------
+        by: string, optional (default: 'operator')
+            'operator': one row per operator class.
+            'hyperparameter': one row per operator class, hyperparameter of the
+            config_dict and value of this hyperparameter.
+
+        Returns
+        -------
+        report: pandas.DataFrame
+            Statistics of the operators over all their evaluations, i.e. their occurrences in
+            the evaluated pipelines, sorted by decreasing total time:
+            'evaluations': number of evaluations
+            'mean_fit_time': mean time spent fitting the operator over all CV folds, in seconds
+            'mean_predict_time': mean time spent transforming or predicting with the operator
+                over all CV folds, in seconds
+            'total_time': total time spent in the operator, in seconds
+            'mean_peak_rss_increase': mean increase of the peak memory of the worker during
+                the calls to the operator, in megabytes
+            'failure_rate': fraction of the evaluations in which the operator raised an
+                exception or timed out
+            The times and the peak memory increase of the operators which are cloned by
+            the pipeline before being fitted, i.e. the transformers of the pipelines when
+            memory is set, are not measured and are left out of the means and totals.
+        """
+        if by not in ['operator', 'hyperparameter']:
+            raise ValueError('by must be either \'operator\' or \'hyperparameter\'.')
+        if not self.evaluated_individuals_:
+            raise RuntimeError('A pipeline has not yet been optimized. Please call fit() first.')
+
+        # hyperparameters of each operator class in config_dict
+        hyperparameters = {}
+        for operator_path, operator_params in self._config_dict.items():
+            hyperparameters.setdefault(operator_path.split('.')[-1], set()).update(operator_params or {})
+
+        rows = []
+        for stats in self.evaluated_individuals_.values():
+            for step_stats in stats.get('step_stats') or []:
+                row = {
+                    'operator': step_stats['operator'],
+                    'fit_time': step_stats['fit_time'],
+                    'predict_time': step_stats['predict_time'],
+                    'peak_rss_increase': step_stats['peak_rss_increase'],
+                    'failed': step_stats['failure'] is not None
+                }
+                if by == 'operator':
+                    rows.append(row)
+                else:
+                    for param, value in step_stats['params'].items():
+                        if param in hyperparameters.get(step_stats['operator'], ()):
+                            rows.append(dict(row, hyperparameter=param, value=str(value)))
+
+        keys = ['operator'] if by == 'operator' else ['operator', 'hyperparameter', 'value']
+        columns = ['evaluations', 'mean_fit_time', 'mean_predict_time', 'total_time',
+                   'mean_peak_rss_increase', 'failure_rate']
+        if not rows:
+            return pd.DataFrame(columns=keys + columns).set_index(keys)
+
+        # the times of the operators which are not measured are None
+        steps = pd.DataFrame(rows).astype({'fit_time': float, 'predict_time': float, 'peak_rss_increase': float})
+        steps['total_time'] = steps['fit_time'] + steps['predict_time']
+        groups = steps.groupby(keys)
+        report = pd.DataFrame({
+            'evaluations': groups.size(),
+            'mean_fit_time': groups['fit_time'].mean(),
+            'mean_predict_time': groups['predict_time'].mean(),
+            'total_time': groups['total_time'].sum(),
+            'mean_peak_rss_increase': groups['peak_rss_increase'].mean(),
+            'failure_rate': groups['failed'].mean()
+        }, columns=columns)
+        return report.sort_values('total_time', ascending=False)
+
     def export(self, output_file_name, skip_if_repeated=False):
         """Export the optimized pipeline as Python code.
 
@@ -1001,13 +1970,15 @@ class TPOTBase(BaseEstimator):
 
         return True
 
-    def _impute_values(self, features):
+    def _impute_values(self, features, nan_mask=None):
         """Impute missing values in a feature set.
 
         Parameters
         ----------
         features: array-like {n_samples, n_features}
             A feature matrix
+        nan_mask: numpy.ndarray {n_features}, optional
+            Columns of the feature matrix that contain missing values
 
         Returns
         -------
@@ -1017,10 +1988,58 @@ class TPOTBase(BaseEstimator):
             print('Imputing missing values in feature set')
 
         if self._fitted_imputer is None:
-            self._fitted_imputer = Imputer(strategy="median")
-            self._fitted_imputer.fit(features)
+            self._fitted_imputer = MedianImputer()
+            self._fitted_imputer.fit(features, nan_mask=nan_mask)
 
-        return self._fitted_imputer.transform(features)
+        return self._fitted_imputer.transform(features, nan_mask=nan_mask)
+
+    def _is_valid_array(self, features):
+        """Check if a feature matrix can be used without validation or copy.
+
+        Parameters
+        ----------
+        features: array-like {n_samples, n_features}
+            Feature matrix
+
+        Returns
+        -------
+        True if features is a non-empty, C-contiguous 2-D numpy array of the
+        requested dtype which contains only finite values, False otherwise
+        """
+        if not (isinstance(features, np.ndarray) and
+                features.ndim == 2 and
+                features.size > 0 and
+                features.dtype == np.dtype(self.dtype) and
+                features.flags['C_CONTIGUOUS']):
+            return False
+        # The sum of an array is NaN or inf as soon as one of its elements is,
+        # which is much cheaper than building a boolean mask with np.isnan.
+        # A sum that overflows only sends us down the regular path.
+        with np.errstate(over='ignore', invalid='ignore'):
+            return bool(np.isfinite(np.sum(features)))
+
+    def _is_valid_target(self, features, target):
+        """Check if a target can be used without validation or copy.
+
+        Parameters
+        ----------
+        features: numpy.ndarray {n_samples, n_features}
+            Feature matrix that was already checked by _is_valid_array
+        target: array-like {n_samples}
+            List of class labels for prediction
+
+        Returns
+        -------
+        True if target is a 1-D numeric numpy array which contains only finite
+        values and matches the number of samples in features, False otherwise
+        """
+        if not (isinstance(target, np.ndarray) and
+                target.ndim == 1 and
+                target.shape[0] == features.shape[0] and
+                np.issubdtype(target.dtype, np.number)):
+            return False
+        with np.errstate(over='ignore', invalid='ignore'):
+            return bool(np.isfinite(np.sum(target)))
 
     def _check_dataset(self, features, target, sample_weight=None):
         """Check if a dataset has a valid feature set and labels.
@@ -1048,6 +2067,14 @@ class TPOTBase(BaseEstimator):
             except ValueError as e:
                 raise ValueError('sample_weight dimensions did not match target: %s' % e)
 
+        # Arrays that are already C-contiguous, of the requested dtype and free of
+        # NaN/inf values are valid as they are, so return them without a copy
+        if self._is_valid_array(features) and (target is None or self._is_valid_target(features, target)):
+            if target is not None:
+                return features, target
+            else:
+                return features
+
         # If features is a sparse matrix, do not apply imputation
         if sparse.issparse(features):
             if self.config_dict in [None, "TPOT light", "TPOT MDR"]:
@@ -1061,16 +2088,17 @@ class TPOTBase(BaseEstimator):
                     'customized config dictionary supports sparse matriies.'
                 )
         else:
-            if np.any(np.isnan(features)):
+            nan_mask = column_nan_mask(features)
+            if np.any(nan_mask):
                 self._imputed = True
-                features = self._impute_values(features)
+                features = self._impute_values(features, nan_mask)
 
         try:
             if target is not None:
-                X, y = check_X_y(features, target, accept_sparse=True, dtype=np.float64)
+                X, y = check_X_y(features, target, accept_sparse=True, dtype=self.dtype)
                 return X, y
             else:
-                X = check_array(features, order="C",  accept_sparse=True, dtype=np.float64)
+                X = check_array(features, order="C",  accept_sparse=True, dtype=self.dtype)
                 return X
         except (AssertionError, ValueError):
             raise ValueError(
@@ -1133,8 +2161,26 @@ class TPOTBase(BaseEstimator):
             if total_mins_elapsed >= self.max_time_mins:
                 raise KeyboardInterrupt('{} minutes have elapsed. TPOT will close down.'.format(total_mins_elapsed))
 
-    def _combine_individual_stats(self, operator_count, cv_score, individual_stats):
-        """Combine the stats with operator count and cv score and preprare to be written to _evaluated_individuals
+    def _evaluation_deadline(self):
+        """Return the time.time() at which the evaluations of the current generation must be over, or None."""
+        deadlines = []
+        if self.max_time_mins:
+            elapsed_seconds = (datetime.now() - self._start_datetime).total_seconds()
+            deadlines.append(time.time() + self.max_time_mins * 60. - elapsed_seconds)
+        if self.max_generation_time_mins:
+            deadlines.append(time.time() + self.max_generation_time_mins * 60.)
+        return min(deadlines) if deadlines else None
+
+    def _eval_timeout(self):
+        """Return the time limit in seconds to evaluate a single pipeline."""
+        timeout = self.max_eval_time_mins * 60
+        if self.adaptive_eval_time and len(self._eval_times) >= self._min_evals_for_adaptive_eval_time:
+            adaptive_timeout = self.adaptive_eval_time * np.percentile(self._eval_times, 90)
+            timeout = min(timeout, max(adaptive_timeout, self._min_adaptive_eval_timeout))
+        return max(int(timeout), 1)
+
+    def _combine_individual_stats(self, operator_count, cv_score, individual_stats, eval_stats=None):
+        """Combine the stats with operator count, cv score and telemetry and preprare to be written to _evaluated_individuals
 
         Parameters
         ----------
@@ -1148,6 +2194,9 @@ class TPOTBase(BaseEstimator):
             'mutation_count': number of mutation operations applied to the individual and its predecessor cumulatively
             'crossover_count': number of crossover operations applied to the individual and its predecessor cumulatively
             'predecessor': string representation of the individual
+        eval_stats: dictionary, optional
+            dict containing the telemetry of the evaluation of the individual, see
+            _cross_val_score_before_deadline. Missing values are set to None.
 
         Returns
         -------
@@ -1155,11 +2204,27 @@ class TPOTBase(BaseEstimator):
             dict containing the combined statistics:
             'operator_count': number of operators in the pipeline
             'internal_cv_score': internal cross validation score
+            'wall_time', 'cpu_time', 'peak_rss_increase', 'fold_fit_times', 'fold_score_times',
+            'step_stats', 'worker' and 'failure': telemetry of the evaluation
+            'fit_time': mean fit time of the pipeline on a CV fold
+            'predict_latency': mean score time of the pipeline per CV test sample
             and all the statistics contained in the 'individual_stats' parameter
         """
         stats = deepcopy(individual_stats)  # Deepcopy, since the string reference to predecessor should be cloned
         stats['operator_count'] = operator_count
         stats['internal_cv_score'] = cv_score
+        eval_stats = eval_stats or {}
+        for key in ['wall_time', 'cpu_time', 'peak_rss_increase', 'fold_fit_times', 'fold_score_times', 'step_stats', 'worker', 'failure']:
+            stats[key] = eval_stats.get(key)
+        stats['fit_time'] = None
+        stats['predict_latency'] = None
+        if eval_stats.get('fold_fit_times'):
+            stats['fit_time'] = float(np.mean(eval_stats['fold_fit_times']))
+        if eval_stats.get('fold_score_times') and eval_stats.get('fold_test_sizes'):
+            stats['predict_latency'] = float(np.mean([
+                score_time / test_size
+                for score_time, test_size in zip(eval_stats['fold_score_times'], eval_stats['fold_test_sizes'])
+            ]))
         return stats
 
     def _evaluate_individuals(self, individuals, features, target, sample_weight=None, groups=None):
@@ -1187,43 +2252,63 @@ class TPOTBase(BaseEstimator):
 
         """
 
+        # Stop before starting a new generation if there is no time left for it
+        self._stop_by_max_time_mins()
+        if self._callbacks.stop_requested:
+            raise StopIteration('A callback requested to stop the optimization process.')
+        deadline = self._evaluation_deadline()
+        start_time = time.time()
+        # pipelines of this generation which were not evaluated before the deadline
+        self._unevaluated_individuals = {}
+
+        # pipelines which were already evaluated, here or on another island, are looked up instead of being evaluated again
+        if self._island is not None:
+            self._island.pull([str(individual) for individual in individuals], self.evaluated_individuals_)
+        n_cached = len(set(str(individual) for individual in individuals) & set(self.evaluated_individuals_))
         operator_counts, eval_individuals_str, sklearn_pipeline_list, stats_dicts = self._preprocess_individuals(individuals)
+        self._callbacks.emit(
+            'on_generation_start',
+            generation=self._generation,
+            n_pipelines=len(sklearn_pipeline_list),
+            n_cached=n_cached,
+            n_workers=self._n_workers()
+        )
 
         # Make the partial function that will be called below
+        # The timeout of each pipeline is cut short if it starts close to the deadline
         partial_wrapped_cross_val_score = partial(
-            _wrapped_cross_val_score,
+            _cross_val_score_before_deadline,
             features=features,
             target=target,
             cv=self.cv,
             scoring_function=self.scoring_function,
             sample_weight=sample_weight,
             groups=groups,
-            timeout=max(int(self.max_eval_time_mins * 60), 1),
-            use_dask=self.use_dask
+            timeout=self._eval_timeout(),
+            deadline=deadline,
+            profile_fraction=self._profile_fraction()
         )
 
+        # the time spent waiting for the evaluations is not TPOT overhead
+        if self._profile is not None:
+            self._profile.pause()
+
         result_score_list = []
+        if self._executor is not None:
+            result_score_list = self._evaluate_with_executor(
+                sklearn_pipeline_list, features, target, sample_weight, groups, deadline, eval_individuals_str
+            )
         # Don't use parallelization if n_jobs==1
-        if self._n_jobs == 1 and not self.use_dask:
-            for sklearn_pipeline in sklearn_pipeline_list:
-                self._stop_by_max_time_mins()
+        elif self._n_jobs == 1 and not self.use_dask:
+            for sklearn_pipeline, individual_str in zip(sklearn_pipeline_list, eval_individuals_str):
+                self._notify_submitted([individual_str])
                 val = partial_wrapped_cross_val_score(sklearn_pipeline=sklearn_pipeline)
-                result_score_list = self._update_val(val, result_score_list)
+                result_score_list = self._update_val(val, result_score_list, individual_str)
         else:
             if self.use_dask:
-                import dask
-
-                result_score_list = [
-                    partial_wrapped_cross_val_score(sklearn_pipeline=sklearn_pipeline)
-                    for sklearn_pipeline in sklearn_pipeline_list
-                ]
-
-                self.dask_graphs_ = result_score_list
-                with warnings.catch_warnings():
-                    warnings.simplefilter('ignore')
-                    result_score_list = list(dask.compute(*result_score_list))
-
-                self._update_pbar(len(result_score_list))
+                result_score_list = self._evaluate_with_dask(
+                    sklearn_pipeline_list, features, target, sample_weight, groups, deadline, eval_individuals_str
+                )
 
             else:
                 # chunk size for pbar update
@@ -1231,23 +2316,263 @@ class TPOTBase(BaseEstimator):
                 chunk_size = min(cpu_count()*2, self._n_jobs*4)
 
                 for chunk_idx in range(0, len(sklearn_pipeline_list), chunk_size):
-                    self._stop_by_max_time_mins()
-
+                    chunk_individuals_str = eval_individuals_str[chunk_idx:chunk_idx + chunk_size]
+                    self._notify_submitted(chunk_individuals_str)
                     parallel = Parallel(n_jobs=self._n_jobs, verbose=0, pre_dispatch='2*n_jobs')
                     tmp_result_scores = parallel(
                         delayed(partial_wrapped_cross_val_score)(sklearn_pipeline=sklearn_pipeline)
                         for sklearn_pipeline in sklearn_pipeline_list[chunk_idx:chunk_idx + chunk_size])
                     # update pbar
-                    for val in tmp_result_scores:
-                        result_score_list = self._update_val(val, result_score_list)
+                    for val, individual_str in zip(tmp_result_scores, chunk_individuals_str):
+                        result_score_list = self._update_val(val, result_score_list, individual_str)
+
+        if self._profile is not None:
+            self._profile.resume()
 
         self._update_evaluated_individuals_(result_score_list, eval_individuals_str, operator_counts, stats_dicts)
+        if self._island is not None:
+            self._island.push(eval_individuals_str, self.evaluated_individuals_)
+
+        if self._callbacks.active:
+            self._callbacks.emit(
+                'on_generation_end',
+                generation=self._generation,
+                n_pipelines=len(sklearn_pipeline_list),
+                n_cached=n_cached,
+                duration=time.time() - start_time,
+                best_score=max([stats['internal_cv_score'] for stats in self.evaluated_individuals_.values()] or [None])
+            )
+        self._generation += 1
 
-        """Look up the operator count and cross validation score to use in the optimization"""
-        return [(self.evaluated_individuals_[str(individual)]['operator_count'],
-                 self.evaluated_individuals_[str(individual)]['internal_cv_score'])
+        """Look up the objectives and cross validation score to use in the optimization"""
+        return [self._fitness_values(self.evaluated_individuals_.get(str(individual)) or
+                                     self._unevaluated_individuals[str(individual)])
                 for individual in individuals]
 
+    def _fitness_values(self, stats):
+        """Return the fitness values of an evaluated pipeline: its objectives, then its internal CV score.
+
+        Parameters
+        ----------
+        stats: dictionary
+            dict containing the statistics of the pipeline in evaluated_individuals_
+
+        Returns
+        -------
+        fitness_values: tuple
+            The value of each objective, or inf if it was not measured (e.g. the
+            pipeline failed), followed by the internal CV score
+        """
+        values = []
+        for objective in self._objectives:
+            value = stats.get(objective)
+            values.append(float('inf') if value is None else value)
+        return tuple(values) + (stats['internal_cv_score'],)
+
+    def _evaluate_with_executor(self, sklearn_pipeline_list, features, target, sample_weight=None, groups=None,
+                                deadline=None, eval_individuals_str=None):
+        """Evaluate pipelines with the executor set up from the executor parameter.
+
+        The executor is started with the data set the first time it is used during fit().
+
+        Parameters
+        ----------
+        sklearn_pipeline_list: list
+            A list of scikit-learn pipelines to evaluate
+        features: numpy.ndarray {n_samples, n_features}
+            A numpy matrix containing the training and testing features for the pipelines' evaluation
+        target: numpy.ndarray {n_samples}
+            A numpy matrix containing the training and testing target for the pipelines' evaluation
+        sample_weight: array-like {n_samples}, optional
+            List of sample weights to balance (or un-balanace) the dataset target as needed
+        groups: array-like {n_samples, }, optional
+            Group labels for the samples used while splitting the dataset into train/test set
+        deadline: float or None, optional
+            time.time() at which the evaluations must be over
+        eval_individuals_str: list, optional
+            A list of strings of the pipelines, to notify the callbacks
+
+        Returns
+        -------
+        result_score_list: list
+            A list of CV scores, in the order of sklearn_pipeline_list
+        """
+        if not self._executor_started:
+            self._executor.start(
+                partial(
+                    _cross_val_score_before_deadline,
+                    cv=self.cv,
+                    scoring_function=self.scoring_function,
+                    profile_fraction=self._profile_fraction()
+                ),
+                features=features,
+                target=target,
+                sample_weight=sample_weight,
+                groups=groups
+            )
+            self._executor_started = True
+
+        timeout = self._eval_timeout()
+        futures = [
+            self._executor.submit(sklearn_pipeline, timeout=timeout, deadline=deadline)
+            for sklearn_pipeline in sklearn_pipeline_list
+        ]
+        self._notify_submitted(eval_individuals_str)
+        return self._gather_scores(futures, self._executor.as_completed(futures, self._time_until(deadline)),
+                                   eval_individuals_str)
+
+    def _time_until(self, deadline):
+        """Return how many seconds to wait for evaluations to complete before cancelling them, or None."""
+        if deadline is None:
+            return None
+        return max(deadline - time.time(), 0) + self._deadline_grace_seconds
+
+    def _gather_scores(self, futures, completed_futures, eval_individuals_str=None):
+        """Gather the CV scores of pipelines evaluated in futures.
+
+        Parameters
+        ----------
+        futures: list
+            Futures of the CV scores of the pipelines
+        completed_futures: iterator
+            Iterator over the futures as they complete, which stops at the evaluation deadline
+        eval_individuals_str: list, optional
+            A list of strings of the pipelines, to notify the callbacks
+
+        Returns
+        -------
+        result_score_list: list
+            A list of CV scores, in the order of futures. The pipelines which are
+            not evaluated when completed_futures stops are cancelled and count as timed out
+            for this generation, with the failure "Deadline".
+        """
+        future_positions = {future: position for position, future in enumerate(futures)}
+        eval_individuals_str = eval_individuals_str or [None] * len(futures)
+
+        # scores are collected in completion order to update the pbar as soon as possible
+        result_score_list = []
+        completed_positions = []
+        try:
+            for future in completed_futures:
+                try:
+                    val = future.result()
+                except Exception as e:
+                    # the pipeline could not be sent to or run by a worker
+                    val = (-float('inf'), {'failure': type(e).__name__})
+                position = future_positions[future]
+                completed_positions.append(position)
+                result_score_list = self._update_val(val, result_score_list, eval_individuals_str[position])
+        finally:
+            for future in futures:
+                if not future.done():
+                    future.cancel()
+
+        for position in sorted(set(range(len(futures))) - set(completed_positions)):
+            completed_positions.append(position)
+            result_score_list = self._update_val(('Timeout', {'failure': 'Deadline'}), result_score_list,
+                                                 eval_individuals_str[position])
+
+        ordered_score_list = [None] * len(futures)
+        for position, val in zip(completed_positions, result_score_list):
+            ordered_score_list[position] = val
+        return ordered_score_list
+
+    def _evaluate_with_dask(self, sklearn_pipeline_list, features, target, sample_weight=None, groups=None,
+                            deadline=None, eval_individuals_str=None):
+        """Evaluate pipelines with a single dask graph for the whole generation.
+
+        The data set is sent to the dask workers the first time it is used during fit().
+        If a dask.distributed client is running, the graph is computed on its cluster,
+        otherwise with the current dask scheduler. The progress bar is updated as soon as
+        each pipeline is evaluated.
+
+        Parameters
+        ----------
+        sklearn_pipeline_list: list
+            A list of scikit-learn pipelines to evaluate
+        features: numpy.ndarray {n_samples, n_features}
+            A numpy matrix containing the training and testing features for the pipelines' evaluation
+        target: numpy.ndarray {n_samples}
+            A numpy matrix containing the training and testing target for the pipelines' evaluation
+        sample_weight: array-like {n_samples}, optional
+            List of sample weights to balance (or un-balanace) the dataset target as needed
+        groups: array-like {n_samples, }, optional
+            Group labels for the samples used while splitting the dataset into train/test set
+        deadline: float or None, optional
+            time.time() at which the evaluations must be over
+        eval_individuals_str: list, optional
+            A list of strings of the pipelines, to notify the callbacks
+
+        Returns
+        -------
+        result_score_list: list
+            A list of CV scores, in the order of sklearn_pipeline_list
+        """
+        if getattr(self, '_dask_data', None) is None or self._dask_data[0] is not features:
+            self._dask_data = (features, _dask_data(features, target, sample_weight))
+
+        score_graphs = _dask_cv_scores(
+            sklearn_pipeline_list,
+            features,
+            target,
+            cv=self.cv,
+            scoring_function=self.scoring_function,
+            data=self._dask_data[1],
+            sample_weight=sample_weight,
+            groups=groups
+        )
+        self.dask_graphs_ = score_graphs
+        eval_individuals_str = eval_individuals_str or [None] * len(score_graphs)
+
+        client = _get_dask_client()
+        if client is not None:
+            futures = client.compute(score_graphs)
+            self._notify_submitted(eval_individuals_str)
+            return self._gather_scores(futures, _dask_as_completed(futures, self._time_until(deadline)),
+                                       eval_individuals_str)
+
+        import dask
+        from dask.callbacks import Callback
+
+        individual_strs = {score_graph.key: individual_str
+                           for score_graph, individual_str in zip(score_graphs, eval_individuals_str)}
+        completed_scores = {}
+        cancel_time = None if deadline is None else deadline + self._deadline_grace_seconds
+
+        def _posttask(key, result, dsk, state, worker_id):
+            if key in individual_strs:
+                completed_scores[key] = result
+                self._update_pbar()
+                self._notify_completed(result, individual_strs[key])
+            if cancel_time is not None and time.time() > cancel_time:
+                raise _DeadlineReached()
+
+        self._notify_submitted(eval_individuals_str)
+
+        try:
+            with warnings.catch_warnings(), Callback(posttask=_posttask):
+                warnings.simplefilter('ignore')
+                dask.compute(*score_graphs)
+        except _DeadlineReached:
+            pass
+
+        result_score_list = []
+        for score_graph, individual_str in zip(score_graphs, eval_individuals_str):
+            if score_graph.key in completed_scores:
+                result_score_list.append(completed_scores[score_graph.key])
+            else:
+                result_score_list = self._update_val(('Timeout', {'failure': 'Deadline'}), result_score_list,
+                                                     individual_str)
+        return result_score_list
+
+    def _shutdown_executor(self):
+        """Release the workers and the data set held by a started executor or by dask."""
+        if getattr(self, '_executor_started', False):
+            self._executor.shutdown()
+            self._executor_started = False
+        # drop the handles of the data set sent to the dask workers
+        self._dask_data = None
+
     def _preprocess_individuals(self, individuals):
         """Preprocess DEAP individuals before pipeline evaluation.
 
@@ -1292,7 +2617,8 @@ class TPOTBase(BaseEstimator):
             if sklearn_pipeline_str.count('PolynomialFeatures') > 1:
                 self.evaluated_individuals_[individual_str] = self._combine_individual_stats(5000.,
                                                                                              -float('inf'),
-                                                                                             individual.statistics)
+                                                                                             individual.statistics,
+                                                                                             {'failure': 'Invalid'})
                 self._update_pbar(pbar_msg='Invalid pipeline encountered. Skipping its evaluation.')
             # Check if the individual was evaluated before
             elif individual_str in self.evaluated_individuals_:
@@ -1319,7 +2645,8 @@ class TPOTBase(BaseEstimator):
                 except Exception:
                     self.evaluated_individuals_[individual_str] = self._combine_individual_stats(5000.,
                                                                                                  -float('inf'),
-                                                                                                 individual.statistics)
+                                                                                                 individual.statistics,
+                                                                                                 {'failure': 'Invalid'})
                     self._update_pbar()
                     continue
                 eval_individuals_str.append(individual_str)
@@ -1333,7 +2660,7 @@ class TPOTBase(BaseEstimator):
         Parameters
         ----------
         result_score_list: list
-            A list of CV scores for evaluated pipelines
+            A list of CV scores for evaluated pipelines, or of tuples of the CV score and the telemetry of the evaluation
         eval_individuals_str: list
             A list of strings for evaluated pipelines
         operator_counts: dict
@@ -1347,10 +2674,20 @@ class TPOTBase(BaseEstimator):
         None
         """
         for result_score, individual_str in zip(result_score_list, eval_individuals_str):
+            eval_stats = None
+            if isinstance(result_score, tuple):
+                result_score, eval_stats = result_score
             if type(result_score) in [float, np.float64, np.float32]:
-                self.evaluated_individuals_[individual_str] = self._combine_individual_stats(operator_counts[individual_str],
-                                                                                             result_score,
-                                                                                             stats_dicts[individual_str])
+                stats = self._combine_individual_stats(operator_counts[individual_str],
+                                                       result_score,
+                                                       stats_dicts[individual_str],
+                                                       eval_stats)
+                # pipelines which did not get the time to be evaluated before the deadline
+                # are not cached, so that they can be evaluated in a later generation
+                if stats['failure'] == 'Deadline':
+                    self._unevaluated_individuals[individual_str] = stats
+                else:
+                    self.evaluated_individuals_[individual_str] = stats
             else:
                 raise ValueError('Scoring function does not return a float.')
 
@@ -1374,6 +2711,43 @@ class TPOTBase(BaseEstimator):
             if not self._pbar.disable:
                 self._pbar.update(pbar_num)
 
+    def _screen_offspring(self, population, lambda_, cxpb, mutpb):
+        """Generate offspring and keep the most promising ones according to the surrogate model.
+
+        Parameters
+        ----------
+        population: list
+            Population to vary
+        lambda_: int
+            Number of offspring to keep
+        cxpb: float
+            Probability of mating two individuals
+        mutpb: float
+            Probability of mutating an individual
+
+        Returns
+        -------
+        offspring: list
+            The lambda_ offspring with the best predicted internal CV scores, in the
+            order they were generated in
+        """
+        n_candidates = int(np.ceil(lambda_ * self.surrogate_ratio))
+        offspring = varOr(population, self._toolbox, n_candidates, cxpb, mutpb)
+        if n_candidates == lambda_:
+            return offspring
+
+        scores = self._surrogate.fit(self.evaluated_individuals_).predict(offspring)
+        if scores is None:
+            # not enough pipelines were evaluated to train the surrogate model yet
+            return offspring[:lambda_]
+        # the pipelines evaluated before are not evaluated again, so their actual score is used
+        for i, ind in enumerate(offspring):
+            stats = self.evaluated_individuals_.get(str(ind))
+            if stats is not None:
+                scores[i] = stats['internal_cv_score']
+        best = np.argsort(-scores, kind='mergesort')[:lambda_]
+        return [offspring[i] for i in sorted(best)]
+
     @_pre_test
     def _mate_operator(self, ind1, ind2):
         for _ in range(self._max_mut_loops):
@@ -1504,30 +2878,71 @@ class TPOTBase(BaseEstimator):
                 operator_count += 1
         return operator_count
 
-    def _update_val(self, val, result_score_list):
+    def _update_val(self, val, result_score_list, individual_str=None):
         """Update values in the list of result scores and self._pbar during pipeline evaluation.
 
         Parameters
         ----------
-        val: float or "Timeout"
-            CV scores
+        val: float, "Timeout" or tuple
+            CV scores, or tuple of the CV score and the telemetry of the evaluation
         result_score_list: list
             A list of CV scores
+        individual_str: string, optional
+            String of the evaluated pipeline, to notify the callbacks
 
         Returns
         -------
         result_score_list: list
-            A updated list of CV scores
+            A updated list of CV scores, with their telemetry if val is a tuple
         """
+        eval_stats = None
+        if isinstance(val, tuple):
+            val, eval_stats = val
+            if 'profile_stats' in eval_stats:
+                if self._profile is not None:
+                    self._profile.add(eval_stats)
+                del eval_stats['profile_stats']
+            # timed out pipelines count at the time limit they reached, so that
+            # the adapted time limit does not shrink from one generation to the next
+            if (type(val) in [float, np.float64, np.float32] and np.isfinite(val)) \
+                    or eval_stats.get('failure') == 'Timeout':
+                self._eval_times.append(eval_stats['wall_time'])
         self._update_pbar()
         if val == 'Timeout':
             self._update_pbar(pbar_msg=('Skipped pipeline #{0} due to time out. '
                                         'Continuing to the next pipeline.'.format(self._pbar.n)))
-            result_score_list.append(-float('inf'))
-        else:
-            result_score_list.append(val)
+            self._callbacks.emit('on_timeout', generation=self._generation, pipeline=individual_str)
+            val = -float('inf')
+        self._notify_completed(val, individual_str, eval_stats)
+        result_score_list.append(val if eval_stats is None else (val, eval_stats))
         return result_score_list
 
+    def _profile_fraction(self):
+        """Return the probability to profile the evaluation of a pipeline."""
+        return self.profile_fraction if self._profile is not None else 0.
+
+    def _n_workers(self):
+        """Return the number of workers evaluating pipelines in parallel, or None if it is unknown."""
+        if self._executor is not None:
+            return getattr(self._executor, 'n_jobs', None)
+        if self.use_dask:
+            return None
+        return self._n_jobs
+
+    def _notify_submitted(self, eval_individuals_str):
+        """Notify the callbacks that the evaluation of pipelines was dispatched to the workers."""
+        for individual_str in eval_individuals_str or []:
+            self._callbacks.emit('on_evaluation_submitted', generation=self._generation, pipeline=individual_str)
+
+    def _notify_completed(self, val, individual_str, eval_stats=None):
+        """Notify the callbacks that the evaluation of a pipeline is completed."""
+        if not self._callbacks.active:
+            return
+        info = dict(eval_stats or {})
+        info.pop('step_stats', None)
+        info.update(generation=self._generation, pipeline=individual_str, score=val)
+        self._callbacks.emit('on_evaluation_completed', **info)
+
     @_pre_test
     def _generate(self, pset, min_, max_, condition, type_=None):
         """Generate a Tree as a list of lists.
@@ -28,3 +28,4 @@ from .combine_dfs import CombineDFs
 from .stacking_estimator import StackingEstimator
 from .one_hot_encoder import OneHotEncoder, auto_select_categorical_features, _transform_selected
 from .feature_transformers import CategoricalSelector, ContinuousSelector
+from .median_imputer import MedianImputer, column_nan_mask
@@ -0,0 +1,140 @@
+# -*- coding: utf-8 -*-
+
+"""This file is part of the TPOT library.
+
+TPOT was primarily developed at the University of Pennsylvania by:
+    - Randal S. Olson (rso@randalolson.com)
+    - Weixuan Fu (weixuanf@upenn.edu)
+    - Daniel Angell (dpa34@drexel.edu)
+    - and many more generous open source contributors
+
+TPOT is free software: you can redistribute it and/or modify
+it under the terms of the GNU Lesser General Public License as
+published by the Free Software Foundation, either version 3 of
+the License, or (at your option) any later version.
+
+TPOT is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+GNU Lesser General Public License for more details.
+
+You should have received a copy of the GNU Lesser General Public
+License along with TPOT. If not, see <http://www.gnu.org/licenses/>.
+
+"""
+
+import numpy as np
+from sklearn.base import BaseEstimator, TransformerMixin
+from sklearn.utils import check_array
+from sklearn.utils.validation import FLOAT_DTYPES
+
+
+def column_nan_mask(X, max_chunk_bytes=2 ** 23):
+    """Find the columns of a feature matrix that contain missing values.
+
+    The matrix is scanned in row chunks so that the temporary boolean matrix built by
+    np.isnan never exceeds max_chunk_bytes, regardless of the size of X.
+
+    Parameters
+    ----------
+    X: array-like {n_samples, n_features}
+        Feature matrix
+    max_chunk_bytes: int, optional (default: 8 MiB)
+        Upper bound on the memory allocated for each chunk of the scan
+
+    Returns
+    -------
+    nan_mask: numpy.ndarray {n_features}
+        Boolean mask which is True for the columns that contain at least one NaN
+    """
+    X = np.asarray(X)
+    if X.ndim == 1:
+        X = X.reshape(-1, 1)
+    n_samples, n_features = X.shape
+    nan_mask = np.zeros(n_features, dtype=bool)
+    chunk_rows = max(1, max_chunk_bytes // max(1, n_features))
+
+    for start in range(0, n_samples, chunk_rows):
+        nan_mask |= np.isnan(X[start:start + chunk_rows]).any(axis=0)
+
+    return nan_mask
+
+
+class MedianImputer(BaseEstimator, TransformerMixin):
+    """Replace missing values with the median of their column at fit time.
+
+    The medians are computed one column at a time, so that fit only needs the memory of
+    one extra column, and only the columns with missing values are filled by transform.
+    """
+
+    def fit(self, X, y=None, nan_mask=None):
+        """Compute the medians of the columns of X.
+
+        Parameters
+        ----------
+        X: array-like {n_samples, n_features}
+            Feature matrix
+        y: None
+            Unused
+        nan_mask: numpy.ndarray {n_features}, optional
+            Columns of X that contain missing values, as returned by column_nan_mask
+
+        Returns
+        -------
+        self: object
+            Returns a copy of the estimator
+        """
+        X = check_array(X, dtype=FLOAT_DTYPES, force_all_finite=False)
+        if nan_mask is None:
+            nan_mask = column_nan_mask(X)
+        nan_mask = np.asarray(nan_mask, dtype=bool)
+
+        self.n_features_ = X.shape[1]
+        self.statistics_ = np.empty(X.shape[1])
+        for col in range(X.shape[1]):
+            # partitioning a copy of the column bounds the extra memory to one column
+            column = np.array(X[:, col])
+            if nan_mask[col]:
+                column = column[~np.isnan(column)]
+            self.statistics_[col] = np.median(column, overwrite_input=True) if column.size else np.nan
+        # Same as sklearn's Imputer: columns without any observed value at fit time are dropped
+        self.dropped_columns_ = np.flatnonzero(np.isnan(self.statistics_))
+        return self
+
+    def transform(self, X, nan_mask=None):
+        """Replace the missing values of X with the medians of their column at fit time.
+
+        Parameters
+        ----------
+        X: array-like {n_samples, n_features}
+            Feature matrix
+        nan_mask: numpy.ndarray {n_features}, optional
+            Columns of X that contain missing values, as returned by column_nan_mask
+
+        Returns
+        -------
+        X_transformed: numpy.ndarray {n_samples, n_features - len(dropped_columns_)}
+            The imputed feature set. X is copied once when it has missing values or
+            columns to drop, so that it is not modified, and is returned as is otherwise.
+        """
+        X = check_array(X, dtype=FLOAT_DTYPES, force_all_finite=False)
+        if X.shape[1] != self.n_features_:
+            raise ValueError('X has {} features per sample, expected {}'.format(X.shape[1], self.n_features_))
+        if nan_mask is None:
+            nan_mask = column_nan_mask(X)
+        nan_mask = np.asarray(nan_mask, dtype=bool)
+        statistics = self.statistics_
+
+        if len(self.dropped_columns_):
+            # np.delete copies X, the missing values are filled in the copy
+            X = np.delete(X, self.dropped_columns_, axis=1)
+            nan_mask = np.delete(nan_mask, self.dropped_columns_)
+            statistics = np.delete(statistics, self.dropped_columns_)
+        elif np.any(nan_mask):
+            X = X.copy()
+
+        for col in np.flatnonzero(nan_mask):
+            column = X[:, col]
+            column[np.isnan(column)] = statistics[col]
+
+        return X
@@ -82,11 +82,16 @@ class StackingEstimator(BaseEstimator, TransformerMixin):
         """
         X = check_array(X)
         X_transformed = np.copy(X)
+        # keep the synthetic features in the dtype of X so that float32 inputs are not upcast
+        if np.issubdtype(X.dtype, np.floating):
+            synthetic_dtype = X.dtype
+        else:
+            synthetic_dtype = np.float64
         # add class probabilities as a synthetic feature
         if issubclass(self.estimator.__class__, ClassifierMixin) and hasattr(self.estimator, 'predict_proba'):
-            X_transformed = np.hstack((self.estimator.predict_proba(X), X))
+            X_transformed = np.hstack((self.estimator.predict_proba(X).astype(synthetic_dtype, copy=False), X))
 
         # add class prodiction as a synthetic feature
-        X_transformed = np.hstack((np.reshape(self.estimator.predict(X), (-1, 1)), X_transformed))
+        X_transformed = np.hstack((np.reshape(self.estimator.predict(X), (-1, 1)).astype(synthetic_dtype, copy=False), X_transformed))
 
         return X_transformed
@@ -56,7 +56,8 @@ class ZeroCount(BaseEstimator, TransformerMixin):
 
         X_transformed = np.copy(X)
 
-        non_zero_vector = np.count_nonzero(X_transformed, axis=1)
+        # Keep the counts in the dtype of X so that float32 inputs are not upcast
+        non_zero_vector = np.count_nonzero(X_transformed, axis=1).astype(X.dtype)
         non_zero = np.reshape(non_zero_vector, (-1, 1))
         zero_col = np.reshape(n_features - non_zero_vector, (-1, 1))
 
@@ -0,0 +1,317 @@
+# -*- coding: utf-8 -*-
+
+"""This file is part of the TPOT library.
+
+TPOT was primarily developed at the University of Pennsylvania by:
+    - Randal S. Olson (rso@randalolson.com)
+    - Weixuan Fu (weixuanf@upenn.edu)
+    - Daniel Angell (dpa34@drexel.edu)
+    - and many more generous open source contributors
+
+TPOT is free software: you can redistribute it and/or modify
+it under the terms of the GNU Lesser General Public License as
+published by the Free Software Foundation, either version 3 of
+the License, or (at your option) any later version.
+
+TPOT is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+GNU Lesser General Public License for more details.
+
+You should have received a copy of the GNU Lesser General Public
+License along with TPOT. If not, see <http://www.gnu.org/licenses/>.
+
+"""
+
+import json
+import math
+import os
+import threading
+import time
+import traceback
+
+try:
+    from queue import Queue
+except ImportError:
+    from Queue import Queue
+
+
+class Callback(object):
+    """Base class of the callbacks notified of the events of the TPOT optimization process.
+
+    Override the methods of the events of interest. Each method receives a dict describing
+    the event, with at least the 'time' (time.time()) at which it happened, and can return
+    True to stop the optimization process before the next generation, e.g. to implement a
+    custom stopping rule.
+
+    The methods are called from a background thread, in the order of the events, so that
+    they do not block the optimization process.
+    """
+
+    def on_generation_start(self, info):
+        """Called before evaluating the pipelines of a generation.
+
+        info: dict with 'generation', 'n_pipelines', the number of pipelines to evaluate,
+        'n_cached', the number of pipelines which were already evaluated, and 'n_workers',
+        the number of workers evaluating pipelines in parallel, or None if it is unknown
+        """
+        pass
+
+    def on_generation_end(self, info):
+        """Called after evaluating the pipelines of a generation.
+
+        info: dict with 'generation', 'n_pipelines', 'n_cached', 'duration' in seconds, and 'best_score',
+        the best internal CV score so far
+        """
+        pass
+
+    def on_evaluation_submitted(self, info):
+        """Called when the evaluation of a pipeline is dispatched to the workers.
+
+        info: dict with 'generation' and 'pipeline', the string representation of the pipeline
+        """
+        pass
+
+    def on_evaluation_completed(self, info):
+        """Called when the evaluation of a pipeline is completed, including when it failed.
+
+        info: dict with 'generation', 'pipeline', 'score', and the telemetry of the evaluation
+        when available, e.g. 'wall_time' and 'failure' (see evaluated_individuals_)
+        """
+        pass
+
+    def on_pareto_update(self, info):
+        """Called when the Pareto front changes.
+
+        info: dict with 'generation' and 'pareto_front', a list of the string representation
+        and the weighted fitness values of its pipelines: the negated objectives (by
+        default, the operator count) followed by the internal CV score
+        """
+        pass
+
+    def on_timeout(self, info):
+        """Called when the evaluation of a pipeline times out.
+
+        info: dict with 'generation' and 'pipeline'
+        """
+        pass
+
+
+class CallbackDispatcher(object):
+    """Notify callbacks of events from a background thread."""
+
+    def __init__(self, callbacks):
+        """Create a CallbackDispatcher object.
+
+        Parameters
+        ----------
+        callbacks: list
+            Callback objects to notify
+        """
+        self.callbacks = list(callbacks)
+        self.stop_requested = False
+        self._queue = None
+        self._thread = None
+
+    @property
+    def active(self):
+        """Whether the events are sent to the callbacks."""
+        return self._thread is not None
+
+    def start(self):
+        """Start the background thread calling the callbacks."""
+        if self.callbacks and self._thread is None:
+            self._queue = Queue()
+            self._thread = threading.Thread(target=self._run, name='tpot-callbacks')
+            self._thread.daemon = True
+            self._thread.start()
+
+    def emit(self, event, **info):
+        """Queue an event for the callbacks, without waiting for them.
+
+        Parameters
+        ----------
+        event: string
+            Name of the method of the callbacks to call, e.g. 'on_generation_start'
+        info: keyword arguments
+            Description of the event
+        """
+        if self._thread is not None:
+            info['time'] = time.time()
+            self._queue.put((event, info))
+
+    def close(self):
+        """Wait for the callbacks to handle the queued events and stop the background thread."""
+        if self._thread is not None:
+            self._queue.put(None)
+            self._thread.join()
+            self._thread = None
+            self._queue = None
+
+    def _run(self):
+        queue = self._queue
+        while True:
+            item = queue.get()
+            if item is None:
+                break
+            event, info = item
+            for callback in self.callbacks:
+                method = getattr(callback, event, None)
+                if method is None:
+                    continue
+                try:
+                    if method(dict(info)):
+                        self.stop_requested = True
+                except Exception:
+                    # a failing callback must not stop the optimization process
+                    traceback.print_exc()
+
+
+def _replace_file(src, dst):
+    """Rename src to dst, replacing dst if it exists, also on Windows."""
+    if hasattr(os, 'replace'):
+        os.replace(src, dst)
+    else:
+        # os.rename does not replace an existing file on Windows with Python 2
+        if os.name == 'nt' and os.path.exists(dst):
+            os.remove(dst)
+        os.rename(src, dst)
+
+
+def _metric_value(value):
+    """Convert a value to a JSON serializable number, or None if it is not a finite number."""
+    try:
+        value = float(value)
+    except (TypeError, ValueError):
+        return None
+    return None if math.isinf(value) or math.isnan(value) else value
+
+
+class MetricsSink(Callback):
+    """Callback writing the progress of the optimization process for monitoring tools.
+
+    The metrics are written either as JSON lines, with one record per evaluated pipeline
+    and one record per generation, or as a Prometheus textfile for the textfile collector
+    of the node exporter, which is rewritten with the current value of the metrics.
+    """
+
+    # write the Prometheus textfile at most this often while pipelines are evaluated
+    _min_write_interval_seconds = 1
+
+    def __init__(self, path, format=None):
+        """Create a MetricsSink object.
+
+        Parameters
+        ----------
+        path: string
+            Path of the file to write the metrics to
+        format: 'jsonl', 'prometheus' or None, optional (default: None)
+            Format of the file. If None, the format is 'prometheus' if the path ends
+            with '.prom', as expected by the textfile collector, and 'jsonl' otherwise.
+        """
+        if format is None:
+            format = 'prometheus' if path.endswith('.prom') else 'jsonl'
+        if format not in ['jsonl', 'prometheus']:
+            raise ValueError(
+                'The format of the metrics must be \'jsonl\' or \'prometheus\', got {}.'.format(format)
+            )
+        self.path = path
+        self.format = format
+        self._metrics = {
+            'generation': 0,
+            'evaluations_total': 0,
+            'failures_total': 0,
+            'timeouts_total': 0,
+            'cache_hits_total': 0,
+            'pipelines_total': 0,
+            'queue_depth': 0,
+            'pipelines_per_second': None,
+            'worker_utilization': None,
+            'cache_hit_rate': None,
+            'best_score': None,
+            'pareto_size': 0
+        }
+        self._generation_start = None
+        self._generation_busy_time = 0.
+        self._last_write = 0.
+
+    def on_generation_start(self, info):
+        self._generation_start = info
+        self._generation_busy_time = 0.
+        self._metrics['generation'] = info['generation']
+
+    def on_evaluation_submitted(self, info):
+        self._metrics['queue_depth'] += 1
+
+    def on_evaluation_completed(self, info):
+        metrics = self._metrics
+        metrics['queue_depth'] = max(metrics['queue_depth'] - 1, 0)
+        metrics['evaluations_total'] += 1
+        if info.get('failure') is not None:
+            metrics['failures_total'] += 1
+        self._generation_busy_time += info.get('wall_time') or 0.
+        if self.format == 'jsonl':
+            record = {'type': 'evaluation', 'queue_depth': metrics['queue_depth']}
+            for key in ['time', 'generation', 'pipeline', 'failure', 'worker']:
+                record[key] = info.get(key)
+            for key in ['score', 'wall_time', 'cpu_time', 'peak_rss_increase']:
+                record[key] = _metric_value(info.get(key))
+            self._append_record(record)
+        elif info['time'] - self._last_write >= self._min_write_interval_seconds:
+            self._write_textfile(info['time'])
+
+    def on_timeout(self, info):
+        self._metrics['timeouts_total'] += 1
+
+    def on_pareto_update(self, info):
+        self._metrics['pareto_size'] = len(info['pareto_front'])
+
+    def on_generation_end(self, info):
+        metrics = self._metrics
+        n_pipelines = info['n_pipelines']
+        n_cached = info.get('n_cached', 0)
+        duration = info['duration']
+        n_workers = self._generation_start.get('n_workers') if self._generation_start else None
+        metrics['pipelines_total'] += n_pipelines + n_cached
+        metrics['cache_hits_total'] += n_cached
+        metrics['pipelines_per_second'] = n_pipelines / duration if duration > 0 else None
+        metrics['worker_utilization'] = (
+            min(self._generation_busy_time / (duration * n_workers), 1.)
+            if n_workers and duration > 0 else None
+        )
+        metrics['cache_hit_rate'] = (
+            float(n_cached) / (n_pipelines + n_cached) if n_pipelines + n_cached else None
+        )
+        metrics['best_score'] = _metric_value(info.get('best_score'))
+        if self.format == 'jsonl':
+            record = dict(metrics)
+            record.update(
+                type='generation',
+                time=info['time'],
+                n_pipelines=n_pipelines,
+                n_cached=n_cached,
+                n_workers=n_workers,
+                duration=duration
+            )
+            self._append_record(record)
+        else:
+            self._write_textfile(info['time'])
+
+    def _append_record(self, record):
+        with open(self.path, 'a') as f:
+            f.write(json.dumps(record, sort_keys=True) + '\n')
+
+    def _write_textfile(self, now):
+        lines = []
+        for name, value in sorted(self._metrics.items()):
+            if value is None:
+                continue
+            metric_type = 'counter' if name.endswith('_total') else 'gauge'
+            lines.append('# TYPE tpot_{} {}'.format(name, metric_type))
+            lines.append('tpot_{} {}'.format(name, repr(float(value))))
+        # the collector may read the file at any time, so replace it in one step
+        tmp_path = '{}.{}.tmp'.format(self.path, os.getpid())
+        with open(tmp_path, 'w') as f:
+            f.write('\n'.join(lines) + '\n')
+        _replace_file(tmp_path, self.path)
+        self._last_write = now
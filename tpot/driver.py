@@ -31,7 +31,10 @@ from sklearn.model_selection import train_test_split
 # for manual scoring function, see load_scoring_function
 import sys
 import os
+import zipfile
 from importlib import import_module
+from tempfile import mkdtemp
+from shutil import rmtree
 
 from .tpot import TPOTClassifier, TPOTRegressor
 from ._version import __version__
@@ -96,7 +99,9 @@ def _get_arg_parser():
         type=str,
         help=(
             'Data file to use in the TPOT optimization process. Ensure that '
-            'the class label column is labeled as "class".'
+            'the class label column is labeled as "class". Delimited text, '
+            'NumPy .npy/.npz, Parquet and Feather/Arrow IPC files are supported; '
+            'the format is detected automatically.'
         )
     )
 
@@ -125,6 +130,34 @@ def _get_arg_parser():
         help='Name of the target column in the input file.'
     )
 
+    parser.add_argument(
+        '-dtype',
+        action='store',
+        dest='DTYPE',
+        choices=['float64', 'float32'],
+        default='float64',
+        type=str,
+        help=(
+            'Floating point type used to load the input file and to store the '
+            'features during the optimization process. float32 halves the memory '
+            'needed for the data set.'
+        )
+    )
+
+    parser.add_argument(
+        '-chunksize',
+        action='store',
+        dest='CHUNK_SIZE',
+        default=None,
+        type=positive_integer,
+        help=(
+            'If supplied, delimited text input files are read this many rows at a '
+            'time into a memory-mapped feature matrix in a temporary folder instead '
+            'of being loaded in memory at once. Input files with the .npy extension '
+            'are always memory-mapped.'
+        )
+    )
+
     parser.add_argument(
         '-mode',
         action='store',
@@ -399,6 +432,19 @@ def _get_arg_parser():
         )
     )
 
+    parser.add_argument(
+        '-metrics',
+        action='store',
+        dest='METRICS_PATH',
+        default=None,
+        type=str,
+        help=(
+            'If supplied, a file in which TPOT writes the metrics of the optimization '
+            'process for monitoring tools: a Prometheus textfile if the path ends with '
+            '.prom, JSON lines otherwise.'
+        )
+    )
+
     parser.add_argument(
         '-v',
         action='store',
@@ -457,17 +503,234 @@ def _read_data_file(args):
     input_data = pd.read_csv(
         args.INPUT_FILE,
         sep=args.INPUT_SEPARATOR,
-        dtype=np.float64,
+        dtype=args.DTYPE,
     )
 
-    if args.TARGET_NAME not in input_data.columns.values:
+    _check_target_column(args, input_data.columns.values)
+
+    return input_data
+
+
+def _check_target_column(args, columns):
+    if args.TARGET_NAME not in columns:
         raise ValueError(
             'The provided data file does not seem to have a target column. '
             'Please make sure to specify the target column using the -target '
             'parameter.'
         )
 
-    return input_data
+
+def _read_npy_file(args, memmap_folder):
+    """Memory-map a 2-D .npy file and split it into features and target.
+
+    For .npy files, -target is the index of the target column. When the target is
+    neither the first nor the last column, the features are copied a chunk of rows
+    at a time into a memory-mapped feature matrix in memmap_folder.
+    """
+    try:
+        target_index = int(args.TARGET_NAME)
+    except ValueError:
+        raise ValueError(
+            'A .npy data file does not have column names. Please specify the '
+            'index of the target column using the -target parameter, e.g. -target -1.'
+        )
+
+    input_data = np.load(args.INPUT_FILE, mmap_mode='r')
+    if input_data.ndim != 2 or not -input_data.shape[1] <= target_index < input_data.shape[1]:
+        raise ValueError(
+            'The provided .npy data file must contain a 2-D array with the target '
+            'column at index {}.'.format(target_index)
+        )
+    target_index %= input_data.shape[1]
+
+    target = np.asarray(input_data[:, target_index], dtype=args.DTYPE)
+    # Keep the features memory-mapped when the target is the first or the last column
+    if target_index == input_data.shape[1] - 1:
+        features = input_data[:, :-1]
+    elif target_index == 0:
+        features = input_data[:, 1:]
+    else:
+        features = np.memmap(
+            os.path.join(memmap_folder, 'features.dat'),
+            dtype=args.DTYPE,
+            mode='w+',
+            shape=(input_data.shape[0], input_data.shape[1] - 1)
+        )
+        chunk_size = args.CHUNK_SIZE or 10000
+        for start in range(0, input_data.shape[0], chunk_size):
+            chunk = input_data[start:start + chunk_size]
+            features[start:start + chunk_size, :target_index] = chunk[:, :target_index]
+            features[start:start + chunk_size, target_index:] = chunk[:, target_index + 1:]
+        features.flush()
+
+    return features, target
+
+
+def _read_csv_file_to_memmap(args, memmap_folder):
+    """Read a delimited text file in chunks into a memory-mapped feature matrix.
+
+    The target column is read first, which also gives the number of rows needed
+    to preallocate the memory map, then the features are copied one chunk at a time.
+    """
+    columns = pd.read_csv(args.INPUT_FILE, sep=args.INPUT_SEPARATOR, nrows=0).columns.values
+    _check_target_column(args, columns)
+    feature_columns = [column for column in columns if column != args.TARGET_NAME]
+
+    target = np.concatenate([
+        chunk[args.TARGET_NAME].values for chunk in pd.read_csv(
+            args.INPUT_FILE,
+            sep=args.INPUT_SEPARATOR,
+            dtype=args.DTYPE,
+            usecols=[args.TARGET_NAME],
+            chunksize=args.CHUNK_SIZE
+        )
+    ])
+
+    features = np.memmap(
+        os.path.join(memmap_folder, 'features.dat'),
+        dtype=args.DTYPE,
+        mode='w+',
+        shape=(target.shape[0], len(feature_columns))
+    )
+    start = 0
+    for chunk in pd.read_csv(
+        args.INPUT_FILE,
+        sep=args.INPUT_SEPARATOR,
+        dtype=args.DTYPE,
+        usecols=feature_columns,
+        chunksize=args.CHUNK_SIZE
+    ):
+        features[start:start + chunk.shape[0]] = chunk[feature_columns].values
+        start += chunk.shape[0]
+    features.flush()
+
+    return features, target
+
+
+def _read_npz_file(args):
+    """Read the target array and the feature matrix of a .npz file.
+
+    The target is the array named after -target and the features are the array
+    named "features", or the only other array in the file. Other arrays are not loaded.
+    """
+    with np.load(args.INPUT_FILE) as input_data:
+        _check_target_column(args, input_data.files)
+        feature_names = [name for name in input_data.files if name != args.TARGET_NAME]
+        if 'features' in feature_names:
+            feature_names = ['features']
+        if len(feature_names) != 1:
+            raise ValueError(
+                'The provided .npz data file must contain the feature matrix in an '
+                'array named "features" or in its only array besides the target.'
+            )
+
+        features = np.asarray(input_data[feature_names[0]], dtype=args.DTYPE)
+        target = np.asarray(input_data[args.TARGET_NAME], dtype=args.DTYPE)
+
+    return features, target
+
+
+def _read_arrow_file(args, file_format):
+    """Read a Parquet or Feather/Arrow IPC file, loading only the needed columns.
+
+    Only the target and feature columns are read from Parquet files, and Feather files
+    are memory-mapped. The feature columns are copied one at a time into a preallocated
+    feature matrix, so the table is never converted as a whole.
+    """
+    try:
+        import pyarrow.parquet
+        import pyarrow.feather
+    except ImportError:
+        raise ImportError(
+            'Reading Parquet and Feather/Arrow IPC data files requires the '
+            'optional pyarrow dependency.'
+        )
+
+    if file_format == 'parquet':
+        columns = pyarrow.parquet.read_schema(args.INPUT_FILE).names
+        _check_target_column(args, columns)
+        feature_columns = [column for column in columns if column != args.TARGET_NAME]
+        target_table = pyarrow.parquet.read_table(args.INPUT_FILE, columns=[args.TARGET_NAME])
+        feature_table = pyarrow.parquet.read_table(args.INPUT_FILE, columns=feature_columns)
+    else:
+        target_table = feature_table = pyarrow.feather.read_table(args.INPUT_FILE, memory_map=True)
+        columns = feature_table.column_names
+        _check_target_column(args, columns)
+        feature_columns = [column for column in columns if column != args.TARGET_NAME]
+
+    target = np.asarray(target_table.column(args.TARGET_NAME).to_pandas(), dtype=args.DTYPE)
+    features = np.empty((feature_table.num_rows, len(feature_columns)), dtype=args.DTYPE)
+    for i, column in enumerate(feature_columns):
+        features[:, i] = feature_table.column(column).to_pandas()
+
+    return features, target
+
+
+def _is_npz_file(input_file):
+    """Check whether a zip file is a NumPy .npz file, i.e. an archive of .npy files."""
+    try:
+        with zipfile.ZipFile(input_file) as f:
+            names = f.namelist()
+    except zipfile.BadZipfile:
+        return False
+    return bool(names) and all(name.endswith('.npy') for name in names)
+
+
+def _detect_file_format(input_file):
+    """Detect the format of the input file from its magic number, then from its extension.
+
+    Files which cannot be opened locally, e.g. URLs, are left to pandas.read_csv.
+
+    Returns
+    -------
+    file_format: one of 'npy', 'npz', 'parquet', 'feather' or 'csv'
+    """
+    try:
+        with open(input_file, 'rb') as f:
+            magic = f.read(8)
+    except (IOError, OSError):
+        return 'csv'
+
+    if magic.startswith(b'\x93NUMPY'):
+        return 'npy'
+    elif magic.startswith(b'PK\x03\x04') and _is_npz_file(input_file):
+        # other zip files are e.g. compressed CSV files
+        return 'npz'
+    elif magic.startswith(b'PAR1'):
+        return 'parquet'
+    elif magic.startswith(b'ARROW1') or magic.startswith(b'FEA1'):
+        return 'feather'
+
+    extension = os.path.splitext(input_file)[1].lower()
+    if extension in ['.parquet', '.pq']:
+        return 'parquet'
+    elif extension in ['.feather', '.arrow', '.ipc']:
+        return 'feather'
+    else:
+        return 'csv'
+
+
+def _load_data(args, memmap_folder):
+    """Load the features and the target of the input file.
+
+    Returns
+    -------
+    (features, target): numpy arrays, features may be memory-mapped
+    """
+    file_format = _detect_file_format(args.INPUT_FILE)
+
+    if file_format == 'npy':
+        return _read_npy_file(args, memmap_folder)
+    elif file_format == 'npz':
+        return _read_npz_file(args)
+    elif file_format in ['parquet', 'feather']:
+        return _read_arrow_file(args, file_format)
+    elif args.CHUNK_SIZE:
+        return _read_csv_file_to_memmap(args, memmap_folder)
+    else:
+        input_data = _read_data_file(args)
+        target = input_data.pop(args.TARGET_NAME).values
+        return input_data.values, target
 
 
 def load_scoring_function(scoring_func):
@@ -498,13 +761,26 @@ def tpot_driver(args):
     if args.VERBOSITY >= 2:
         _print_args(args)
 
-    input_data = _read_data_file(args)
-    features = input_data.drop(args.TARGET_NAME, axis=1)
+    memmap_folder = mkdtemp()
+    try:
+        features, target = _load_data(args, memmap_folder)
+
+        # Split row indices rather than the data set itself so that only the
+        # training and testing rows are copied out of the input data, in the
+        # order of the input file so that memory-mapped features are read sequentially
+        training_indices, testing_indices = train_test_split(np.arange(target.shape[0]), random_state=args.RANDOM_STATE)
+        training_indices, testing_indices = np.sort(training_indices), np.sort(testing_indices)
+        training_features, testing_features = features[training_indices], features[testing_indices]
+        training_target, testing_target = target[training_indices], target[testing_indices]
+        del features, target
 
-    training_features, testing_features, training_target, testing_target = \
-        train_test_split(features, input_data[args.TARGET_NAME], random_state=args.RANDOM_STATE)
+        _run_tpot(args, training_features, testing_features, training_target, testing_target)
+    finally:
+        rmtree(memmap_folder, ignore_errors=True)
 
 
+def _run_tpot(args, training_features, testing_features, training_target, testing_target):
+    """Optimize a pipeline on the training set and report its holdout score."""
     tpot_type = TPOTClassifier if args.TPOT_MODE == 'classification' else TPOTRegressor
 
     scoring_func = load_scoring_function(args.SCORING_FN)
@@ -526,6 +802,8 @@ def tpot_driver(args):
         memory=args.MEMORY,
         periodic_checkpoint_folder=args.CHECKPOINT_FOLDER,
         early_stop=args.EARLY_STOP,
+        dtype=args.DTYPE,
+        metrics_path=args.METRICS_PATH,
         verbosity=args.VERBOSITY,
         disable_update_check=args.DISABLE_UPDATE_CHECK
     )
@@ -533,7 +811,7 @@ def tpot_driver(args):
     tpot_obj.fit(training_features, training_target)
 
     if args.VERBOSITY in [1, 2] and tpot_obj._optimized_pipeline:
-        training_score = max([x.wvalues[1] for x in tpot_obj._pareto_front.keys])
+        training_score = max([x.wvalues[-1] for x in tpot_obj._pareto_front.keys])
         print('\nTraining score: {}'.format(training_score))
         print('Holdout score: {}'.format(tpot_obj.score(testing_features, testing_target)))
 
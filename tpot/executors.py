@@ -0,0 +1,307 @@
+# -*- coding: utf-8 -*-
+
+"""This file is part of the TPOT library.
+
+TPOT was primarily developed at the University of Pennsylvania by:
+    - Randal S. Olson (rso@randalolson.com)
+    - Weixuan Fu (weixuanf@upenn.edu)
+    - Daniel Angell (dpa34@drexel.edu)
+    - and many more generous open source contributors
+
+TPOT is free software: you can redistribute it and/or modify
+it under the terms of the GNU Lesser General Public License as
+published by the Free Software Foundation, either version 3 of
+the License, or (at your option) any later version.
+
+TPOT is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+GNU Lesser General Public License for more details.
+
+You should have received a copy of the GNU Lesser General Public
+License along with TPOT. If not, see <http://www.gnu.org/licenses/>.
+
+"""
+
+import sys
+import time
+from functools import partial
+
+
+class EvaluationExecutor(object):
+    """Base class of the executors TPOT uses to evaluate pipelines in parallel.
+
+    An executor is started once per call to fit() with the evaluation function and the
+    data set, then receives one submit() call per pipeline and returns a future of its
+    cross-validation score. Subclasses must implement start(), submit() and
+    as_completed(); shutdown() is optional.
+    """
+
+    def start(self, evaluate, **data):
+        """Prepare the executor for the evaluation of pipelines.
+
+        Parameters
+        ----------
+        evaluate: callable
+            Function with the signature evaluate(sklearn_pipeline, **data, **kwargs)
+            which returns the cross-validation score of a pipeline
+        data: keyword arguments
+            Data set passed to every call of evaluate, e.g. features and target.
+            Executors should ship it to their workers only once.
+
+        Returns
+        -------
+        None
+        """
+        raise NotImplementedError
+
+    def submit(self, sklearn_pipeline, **kwargs):
+        """Schedule the evaluation of a pipeline.
+
+        Parameters
+        ----------
+        sklearn_pipeline: sklearn.pipeline.Pipeline
+            Compiled pipeline to evaluate
+        kwargs: keyword arguments
+            Extra arguments for this call of evaluate, e.g. timeout
+
+        Returns
+        -------
+        future: object with result(), done() and cancel() methods
+            Future of the cross-validation score of the pipeline
+        """
+        raise NotImplementedError
+
+    def as_completed(self, futures, timeout=None):
+        """Iterate over futures returned by submit() as they complete.
+
+        Parameters
+        ----------
+        futures: list
+            Futures returned by submit()
+        timeout: float or None, optional (default: None)
+            If not None, stop iterating after this many seconds, even if some futures are
+            not completed yet
+
+        Returns
+        -------
+        An iterator over the completed futures
+        """
+        raise NotImplementedError
+
+    def shutdown(self):
+        """Release the resources acquired by start()."""
+        pass
+
+
+# Evaluation function and data set of the current local worker process,
+# set once per worker by _init_local_worker
+_worker_evaluate = None
+
+
+def _init_local_worker(evaluate, data):
+    global _worker_evaluate
+    _worker_evaluate = partial(evaluate, **data)
+
+
+def _evaluate_in_local_worker(sklearn_pipeline, kwargs):
+    return _worker_evaluate(sklearn_pipeline, **kwargs)
+
+
+class LocalProcessExecutor(EvaluationExecutor):
+    """Evaluate pipelines in a pool of local processes.
+
+    The data set is pickled once per worker process when the pool starts instead of
+    once per pipeline. Before Python 3.7, whose ProcessPoolExecutor has no initializer,
+    the data set is pickled along with every pipeline instead. Requires the futures
+    package on Python 2.
+    """
+
+    def __init__(self, n_jobs):
+        """Create a LocalProcessExecutor object.
+
+        Parameters
+        ----------
+        n_jobs: int
+            Number of worker processes
+        """
+        self.n_jobs = n_jobs
+        self._pool = None
+        self._evaluate = None
+
+    def start(self, evaluate, **data):
+        try:
+            from concurrent.futures import ProcessPoolExecutor
+        except ImportError:
+            raise ImportError(
+                'executor="processes" requires concurrent.futures. On Python 2, please '
+                'install the futures package.'
+            )
+        if sys.version_info >= (3, 7):
+            self._pool = ProcessPoolExecutor(
+                max_workers=self.n_jobs,
+                initializer=_init_local_worker,
+                initargs=(evaluate, data)
+            )
+        else:
+            self._pool = ProcessPoolExecutor(max_workers=self.n_jobs)
+            self._evaluate = partial(evaluate, **data)
+
+    def submit(self, sklearn_pipeline, **kwargs):
+        if self._evaluate is not None:
+            return self._pool.submit(self._evaluate, sklearn_pipeline, **kwargs)
+        return self._pool.submit(_evaluate_in_local_worker, sklearn_pipeline, kwargs)
+
+    def as_completed(self, futures, timeout=None):
+        return _concurrent_as_completed(futures, timeout)
+
+    def shutdown(self):
+        self._evaluate = None
+        if self._pool is not None:
+            self._pool.shutdown(wait=False)
+            self._pool = None
+
+
+class FuturesExecutor(EvaluationExecutor):
+    """Evaluate pipelines with any concurrent.futures.Executor.
+
+    The data set is passed along with every pipeline, which is free for thread pools
+    but pickles the data once per pipeline for process-based executors.
+    """
+
+    def __init__(self, executor, owned=False):
+        """Create a FuturesExecutor object.
+
+        Parameters
+        ----------
+        executor: concurrent.futures.Executor
+            Executor to submit the evaluations to
+        owned: bool, optional (default: False)
+            If True, the executor is shut down by shutdown()
+        """
+        self.executor = executor
+        self.owned = owned
+        self._evaluate = None
+
+    def start(self, evaluate, **data):
+        self._evaluate = partial(evaluate, **data)
+
+    def submit(self, sklearn_pipeline, **kwargs):
+        return self.executor.submit(self._evaluate, sklearn_pipeline, **kwargs)
+
+    def as_completed(self, futures, timeout=None):
+        return _concurrent_as_completed(futures, timeout)
+
+    def shutdown(self):
+        self._evaluate = None
+        if self.owned:
+            self.executor.shutdown(wait=False)
+
+
+class DaskExecutor(EvaluationExecutor):
+    """Evaluate pipelines on a dask.distributed cluster, e.g. spanning several machines.
+
+    The data set is scattered to all the workers once when the executor starts.
+    """
+
+    def __init__(self, client):
+        """Create a DaskExecutor object.
+
+        Parameters
+        ----------
+        client: dask.distributed.Client
+            Client connected to the scheduler of the cluster
+        """
+        self.client = client
+        self._evaluate = None
+        self._data = None
+
+    def start(self, evaluate, **data):
+        self._evaluate = evaluate
+        self._data = {
+            key: value if value is None else self.client.scatter(value, broadcast=True)
+            for key, value in data.items()
+        }
+
+    def submit(self, sklearn_pipeline, **kwargs):
+        kwargs.update(self._data)
+        # pure=False: the same pipeline may be evaluated again with other arguments
+        return self.client.submit(self._evaluate, sklearn_pipeline, pure=False, **kwargs)
+
+    def as_completed(self, futures, timeout=None):
+        return _dask_as_completed(futures, timeout)
+
+    def shutdown(self):
+        if self._data:
+            self.client.cancel([value for value in self._data.values() if value is not None])
+        self._evaluate = None
+        self._data = None
+
+
+class _DeadlineReached(Exception):
+    """Raised to stop the evaluation of pipelines when their deadline is reached."""
+
+
+def _concurrent_as_completed(futures, timeout=None):
+    """Iterate over concurrent.futures futures as they complete, for at most timeout seconds."""
+    from concurrent.futures import as_completed, TimeoutError
+    try:
+        for future in as_completed(futures, timeout):
+            yield future
+    except TimeoutError:
+        return
+
+
+def _dask_as_completed(futures, timeout=None):
+    """Iterate over dask.distributed futures as they complete, for at most timeout seconds."""
+    from distributed import wait
+    try:
+        from distributed import TimeoutError as DaskTimeoutError
+    except ImportError:
+        # older versions of distributed raise the timeout error of tornado
+        from tornado.gen import TimeoutError as DaskTimeoutError
+    end = None if timeout is None else time.time() + timeout
+    pending = set(futures)
+    while pending:
+        remaining = None if end is None else end - time.time()
+        if remaining is not None and remaining <= 0:
+            return
+        try:
+            done, pending = wait(pending, timeout=remaining, return_when='FIRST_COMPLETED')
+        except DaskTimeoutError:
+            return
+        for future in done:
+            yield future
+
+
+def make_executor(executor, n_jobs):
+    """Build the EvaluationExecutor described by TPOT's executor parameter.
+
+    Parameters
+    ----------
+    executor: None, string, EvaluationExecutor, concurrent.futures.Executor or dask.distributed.Client
+        The executor parameter of TPOT
+    n_jobs: int
+        Number of workers for the executors created by TPOT
+
+    Returns
+    -------
+    None if TPOT should use its default joblib based evaluation, an EvaluationExecutor otherwise
+    """
+    if executor is None or isinstance(executor, EvaluationExecutor):
+        return executor
+    elif executor == 'processes':
+        return LocalProcessExecutor(n_jobs)
+    elif executor == 'threads':
+        from concurrent.futures import ThreadPoolExecutor
+        return FuturesExecutor(ThreadPoolExecutor(max_workers=n_jobs), owned=True)
+    elif hasattr(executor, 'scatter') and hasattr(executor, 'submit'):
+        return DaskExecutor(executor)
+    elif hasattr(executor, 'submit') and hasattr(executor, 'shutdown'):
+        return FuturesExecutor(executor)
+    else:
+        raise ValueError(
+            'Could not recognize the executor for pipeline evaluation. Please provide '
+            '"processes", "threads", an instance of tpot.executors.EvaluationExecutor, '
+            'a concurrent.futures.Executor or a dask.distributed.Client.'
+        )
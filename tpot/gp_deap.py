@@ -26,17 +26,38 @@ License along with TPOT. If not, see <http://www.gnu.org/licenses/>.
 import numpy as np
 from deap import tools, gp
 from inspect import isclass
+from functools import partial
 from .operator_utils import set_sample_weight
-from sklearn.utils import indexable
+from sklearn.utils import indexable, safe_indexing
 from sklearn.metrics.scorer import check_scoring
 from sklearn.model_selection._validation import _fit_and_score
 from sklearn.model_selection._split import check_cv
 
 from sklearn.base import clone, is_classifier
+from sklearn.pipeline import Pipeline, FeatureUnion
+from .builtins import StackingEstimator
+from .profiling import _should_profile, _profiled_call
+from bisect import bisect_left, bisect_right
 from collections import defaultdict
+from operator import attrgetter, eq
+import numbers
+import os
+import socket
+import sys
+import threading
+import time
 import warnings
 from stopit import threading_timeoutable, TimeoutException
 
+try:
+    import resource
+except ImportError:
+    # resource is not available on Windows
+    resource = None
+
+# CPU time of the current process (time.clock on Python 2)
+_process_time = getattr(time, 'process_time', None) or time.clock
+
 
 def pick_two_individuals_eligible_for_crossover(population):
     """Pick two individuals from the population which can do crossover, that is, they share a primitive.
@@ -216,6 +237,12 @@ def eaMuPlusLambda(population, toolbox, mu, lambda_, cxpb, mutpb, ngen, pbar,
     :meth:`toolbox.select` and :meth:`toolbox.evaluate` aliases to be
     registered in the toolbox. This algorithm uses the :func:`varOr`
     variation.
+    If a :meth:`toolbox.screen` alias is registered, it replaces :func:`varOr`
+    with the same arguments, to generate more offspring than *lambda_* and only
+    keep the most promising ones.
+    If a :meth:`toolbox.migrate` alias is registered, it is called with the
+    selected population and the generation number, and returns the population
+    after exchanging individuals with the other islands.
     """
     logbook = tools.Logbook()
     logbook.header = ['gen', 'nevals'] + (stats.fields if stats else [])
@@ -243,8 +270,11 @@ def eaMuPlusLambda(population, toolbox, mu, lambda_, cxpb, mutpb, ngen, pbar,
         if per_generation_function is not None:
             per_generation_function()
 
-        # Vary the population
-        offspring = varOr(population, toolbox, lambda_, cxpb, mutpb)
+        # Vary the population, screening the offspring before their evaluation if needed
+        if hasattr(toolbox, 'screen'):
+            offspring = toolbox.screen(population, lambda_, cxpb, mutpb)
+        else:
+            offspring = varOr(population, toolbox, lambda_, cxpb, mutpb)
 
         # Update generation statistic for all individuals which have invalid 'generation' stats
         # This hold for individuals that have been altered in the varOr function
@@ -270,23 +300,25 @@ def eaMuPlusLambda(population, toolbox, mu, lambda_, cxpb, mutpb, ngen, pbar,
         # Select the next generation population
         population[:] = toolbox.select(population + offspring, mu)
 
+        # Exchange individuals with the other islands of the island model
+        if hasattr(toolbox, 'migrate'):
+            population[:] = toolbox.migrate(population, gen)
+
         # pbar process
         if not pbar.disable:
             # Print only the best individual fitness
             if verbose == 2:
-                high_score = max([halloffame.keys[x].wvalues[1] for x in range(len(halloffame.keys))])
+                high_score = max([halloffame.keys[x].wvalues[-1] for x in range(len(halloffame.keys))])
                 pbar.write('Generation {0} - Current best internal CV score: {1}'.format(gen, high_score))
 
             # Print the entire Pareto front
             elif verbose == 3:
                 pbar.write('Generation {} - Current Pareto front scores:'.format(gen))
                 for pipeline, pipeline_scores in zip(halloffame.items, reversed(halloffame.keys)):
-                    pbar.write('{}\t{}\t{}'.format(
-                            int(pipeline_scores.wvalues[0]),
-                            pipeline_scores.wvalues[1],
-                            pipeline
-                        )
-                    )
+                    pbar.write('\t'.join(
+                        ['{:g}'.format(objective) for objective in pipeline_scores.wvalues[:-1]] +
+                        ['{}'.format(pipeline_scores.wvalues[-1]), str(pipeline)]
+                    ))
                 pbar.write('')
 
         # Update the statistics with the new population
@@ -393,10 +425,176 @@ def mutNodeReplacement(individual, pset):
     return individual,
 
 
+def _dominates_2d(wvalues1, wvalues2):
+    """Return whether wvalues1 dominates wvalues2, given that wvalues1[0] >= wvalues2[0]."""
+    return wvalues1[1] >= wvalues2[1] and wvalues1 != wvalues2
+
+
+def sortNondominated(individuals, k, first_front_only=False):
+    """Sort the first *k* *individuals* into different nondomination levels,
+    as :func:`deap.tools.sortNondominated`.
+    With two objectives, as TPOT's operator count and CV score, the individuals
+    are sorted in :math:`O(N \log N)` instead of :math:`O(MN^2)`: once sorted by
+    decreasing fitness, an individual can only be dominated by the individuals
+    before it, and only by the last individual added to a front if by any of
+    them, so its front is found by a binary search over the fronts.
+    :param individuals: A list of individuals to select from.
+    :param k: The number of individuals to select.
+    :param first_front_only: If :obj:`True` sort only the first front and
+                             exit.
+    :returns: A list of Pareto fronts (lists), the first list includes
+              nondominated individuals.
+    """
+    if k == 0:
+        return []
+    if any(len(ind.fitness.wvalues) != 2 for ind in individuals):
+        return tools.sortNondominated(individuals, k, first_front_only)
+
+    fronts = []
+    # wvalues of the last individual added to each front, which has the highest second objective of the front
+    last_wvalues = []
+    for ind in sorted(individuals, key=lambda ind: ind.fitness.wvalues, reverse=True):
+        wvalues = ind.fitness.wvalues
+        # the fronts which dominate the individual come before the fronts which do not
+        low, high = 0, len(fronts)
+        while low < high:
+            middle = (low + high) // 2
+            if _dominates_2d(last_wvalues[middle], wvalues):
+                low = middle + 1
+            else:
+                high = middle
+        if low == len(fronts):
+            fronts.append([])
+            last_wvalues.append(None)
+        fronts[low].append(ind)
+        last_wvalues[low] = wvalues
+
+    if first_front_only:
+        return fronts[:1]
+
+    # keep the fronts needed to select k individuals
+    n_sorted = 0
+    for n_fronts, front in enumerate(fronts, 1):
+        n_sorted += len(front)
+        if n_sorted >= k:
+            return fronts[:n_fronts]
+    return fronts
+
+
+def assignCrowdingDist(individuals):
+    """Assign a crowding distance to each individual's fitness, as
+    :func:`deap.tools.emo.assignCrowdingDist`. The crowding distance can be
+    retrieved via the :attr:`crowding_dist` attribute of each individual's
+    fitness.
+    With two objectives, the individuals of a front sorted by
+    :func:`sortNondominated` are already sorted by each objective, so the
+    distances are computed in :math:`O(N)` without sorting them again.
+    :param individuals: A Pareto front as returned by :func:`sortNondominated`.
+    """
+    if len(individuals) == 0:
+        return
+    if len(individuals[0].fitness.values) != 2:
+        return tools.emo.assignCrowdingDist(individuals)
+
+    distances = [0.0] * len(individuals)
+    distances[0] = distances[-1] = float("inf")
+    for i in range(2):
+        values = [ind.fitness.values[i] for ind in individuals]
+        if values[0] == values[-1]:
+            continue
+        norm = 2 * float(abs(values[-1] - values[0]))
+        for j in range(1, len(individuals) - 1):
+            distances[j] += abs(values[j + 1] - values[j - 1]) / norm
+
+    for ind, dist in zip(individuals, distances):
+        ind.fitness.crowding_dist = dist
+
+
+def selNSGA2(individuals, k):
+    """Apply NSGA-II selection operator on the *individuals*, as
+    :func:`deap.tools.selNSGA2`, with the nondominated sort and the crowding
+    distance specialized for two objectives.
+    :param individuals: A list of individuals to select from.
+    :param k: The number of individuals to select.
+    :returns: A list of selected individuals.
+    """
+    pareto_fronts = sortNondominated(individuals, k)
+    for front in pareto_fronts:
+        assignCrowdingDist(front)
+
+    chosen = [ind for front in pareto_fronts[:-1] for ind in front]
+    k = k - len(chosen)
+    if k > 0:
+        sorted_front = sorted(pareto_fronts[-1], key=attrgetter("fitness.crowding_dist"), reverse=True)
+        chosen.extend(sorted_front[:k])
+
+    return chosen
+
+
+class ParetoFront(tools.ParetoFront):
+    """The Pareto front hall of fame of :class:`deap.tools.ParetoFront`, updated
+    by binary searches when the individuals have two objectives.
+    The fitnesses of the two-objective front are kept sorted, which sorts them by
+    increasing first objective and decreasing second objective, so the only
+    individual of the front which may dominate a new individual is the first one
+    whose first objective is not lower, and the individuals which the new one
+    dominates are contiguous. The *similar* function is only called to compare
+    individuals with equal fitnesses.
+    """
+
+    def __init__(self, similar=eq):
+        tools.ParetoFront.__init__(self, similar)
+        self._wvalues = []
+
+    def insert(self, item):
+        self._wvalues.insert(bisect_right(self._wvalues, tuple(item.fitness.wvalues)), tuple(item.fitness.wvalues))
+        tools.ParetoFront.insert(self, item)
+
+    def remove(self, index):
+        del self._wvalues[len(self) - (index % len(self) + 1)]
+        tools.ParetoFront.remove(self, index)
+
+    def clear(self):
+        tools.ParetoFront.clear(self)
+        self._wvalues = []
+
+    def update(self, population):
+        """Update the Pareto front hall of fame with the *population* by adding
+        the individuals from the population that are not dominated by the hall
+        of fame. If any individual in the hall of fame is dominated it is
+        removed.
+        :param population: A list of individual with a fitness attribute to
+                           update the hall of fame with.
+        """
+        for ind in population:
+            wvalues = tuple(ind.fitness.wvalues)
+            if len(wvalues) != 2:
+                tools.ParetoFront.update(self, [ind])
+                continue
+
+            # first individual of the front whose first objective is not lower
+            position = bisect_left(self._wvalues, (wvalues[0], -float("inf")))
+            if position < len(self._wvalues):
+                if self._wvalues[position] == wvalues:
+                    if self.similar(ind, self.items[len(self) - position - 1]):
+                        continue
+                elif self._wvalues[position][1] >= wvalues[1]:
+                    continue
+
+            # the individuals of the front which are dominated by the new one
+            end = bisect_left(self._wvalues, wvalues)
+            start = end
+            while start > 0 and self._wvalues[start - 1][1] <= wvalues[1]:
+                start -= 1
+            for key_index in reversed(range(start, end)):
+                self.remove(len(self) - key_index - 1)
+            self.insert(ind)
+
+
 @threading_timeoutable(default="Timeout")
 def _wrapped_cross_val_score(sklearn_pipeline, features, target,
                              cv, scoring_function, sample_weight=None,
-                             groups=None, use_dask=False):
+                             groups=None, eval_stats=None):
     """Fit estimator and compute scores for a given dataset split.
 
     Parameters
@@ -420,8 +618,11 @@ def _wrapped_cross_val_score(sklearn_pipeline, features, target,
         List of sample weights to balance (or un-balanace) the dataset target as needed
     groups: array-like {n_samples, }, optional
         Group labels for the samples used while splitting the dataset into train/test set
-    use_dask : bool, default False
-        Whether to use dask
+    eval_stats: dict, optional
+        If not None, the fit and score times and the number of test samples of each
+        fold ('fold_fit_times', 'fold_score_times' and 'fold_test_sizes'), the telemetry of each operator of the pipeline ('step_stats',
+        see _instrumented_clone) and the reason of the failure of the evaluation
+        ('failure': "Timeout" or the name of the exception) are stored in it
     """
     sample_weight_dict = set_sample_weight(sklearn_pipeline.steps, sample_weight)
 
@@ -431,50 +632,439 @@ def _wrapped_cross_val_score(sklearn_pipeline, features, target,
     cv_iter = list(cv.split(features, target, groups))
     scorer = check_scoring(sklearn_pipeline, scoring=scoring_function)
 
-    if use_dask:
-        try:
-            import dask_ml.model_selection  # noqa
-            import dask  # noqa
-            from dask.delayed import Delayed
-        except ImportError:
-            msg = "'use_dask' requires the optional dask and dask-ml depedencies."
-            raise ImportError(msg)
-
-        dsk, keys, n_splits = dask_ml.model_selection._search.build_graph(
-            estimator=sklearn_pipeline,
-            cv=cv,
-            scorer=scorer,
-            candidate_params=[{}],
-            X=features,
-            y=target,
-            groups=groups,
-            fit_params=sample_weight_dict,
-            refit=False,
-            error_score=float('-inf'),
-        )
+    if eval_stats is not None:
+        eval_stats['step_stats'] = []
+        clone_pipeline = partial(_instrumented_clone, step_stats=eval_stats['step_stats'])
+    else:
+        clone_pipeline = clone
+
+    try:
+        with warnings.catch_warnings():
+            warnings.simplefilter('ignore')
+            scores = [_fit_and_score(estimator=clone_pipeline(sklearn_pipeline),
+                                     X=features,
+                                     y=target,
+                                     scorer=scorer,
+                                     train=train,
+                                     test=test,
+                                     verbose=0,
+                                     parameters=None,
+                                     fit_params=sample_weight_dict,
+                                     return_times=True)
+                                for train, test in cv_iter]
+            scores = np.array(scores)
+            if eval_stats is not None:
+                eval_stats['fold_fit_times'] = scores[:, 1].tolist()
+                eval_stats['fold_score_times'] = scores[:, 2].tolist()
+                eval_stats['fold_test_sizes'] = [len(test) for _, test in cv_iter]
+            CV_score = scores[:, 0]
+            return np.nanmean(CV_score)
+    except TimeoutException:
+        if eval_stats is not None:
+            eval_stats['failure'] = "Timeout"
+        return "Timeout"
+    except Exception as e:
+        if eval_stats is not None:
+            eval_stats['failure'] = type(e).__name__
+        return -float('inf')
+
+
+def _operators(estimator):
+    """List the operators of a pipeline, i.e. the estimators which are not containers of other operators."""
+    if isinstance(estimator, Pipeline):
+        return [operator for _, step in estimator.steps for operator in _operators(step)]
+    elif isinstance(estimator, FeatureUnion):
+        return [operator for _, step in estimator.transformer_list for operator in _operators(step)]
+    elif isinstance(estimator, StackingEstimator):
+        return _operators(estimator.estimator)
+    else:
+        return [estimator]
 
-        cv_results = Delayed(keys[0], dsk)
-        scores = [cv_results['split{}_test_score'.format(i)]
-                  for i in range(n_splits)]
-        CV_score = dask.delayed(np.array)(scores)[:, 0]
-        return dask.delayed(np.nanmean)(CV_score)
+
+def _cached_operators(estimator):
+    """List the operators which are cloned before being fitted by a pipeline with memory caching.
+
+    The calls to the methods of these operators cannot be timed, since sklearn.pipeline.Pipeline
+    fits and then uses clones of the transformers of its steps when its memory is set.
+    """
+    if isinstance(estimator, Pipeline):
+        if getattr(estimator, 'memory', None) is not None:
+            return [operator for _, step in estimator.steps[:-1] for operator in _operators(step)] + \
+                _cached_operators(estimator.steps[-1][1])
+        return [operator for _, step in estimator.steps for operator in _cached_operators(step)]
+    elif isinstance(estimator, FeatureUnion):
+        return [operator for _, step in estimator.transformer_list for operator in _cached_operators(step)]
+    elif isinstance(estimator, StackingEstimator):
+        return _cached_operators(estimator.estimator)
     else:
-        try:
-            with warnings.catch_warnings():
-                warnings.simplefilter('ignore')
-                scores = [_fit_and_score(estimator=clone(sklearn_pipeline),
-                                         X=features,
-                                         y=target,
-                                         scorer=scorer,
-                                         train=train,
-                                         test=test,
-                                         verbose=0,
-                                         parameters=None,
-                                         fit_params=sample_weight_dict)
-                                    for train, test in cv_iter]
-                CV_score = np.array(scores)[:, 0]
-                return np.nanmean(CV_score)
-        except TimeoutException:
-            return "Timeout"
-        except Exception as e:
-            return -float('inf')
+        return []
+
+
+def _instrument_operator(operator, operator_stats):
+    """Time the calls to the fit and predict methods of an operator and record them in operator_stats."""
+    # calls between methods of the operator, e.g. fit_transform to fit, are counted once
+    in_call = [False]
+
+    def timed(method, kind):
+        def timed_method(*args, **kwargs):
+            if in_call[0]:
+                return method(*args, **kwargs)
+            in_call[0] = True
+            start_time = time.time()
+            start_peak_rss = _peak_rss()
+            try:
+                return method(*args, **kwargs)
+            except Exception as e:
+                operator_stats['failure'] = type(e).__name__
+                raise
+            finally:
+                in_call[0] = False
+                operator_stats[kind + '_time'] += time.time() - start_time
+                if start_peak_rss is not None:
+                    operator_stats['peak_rss_increase'] = max(operator_stats['peak_rss_increase'],
+                                                              _peak_rss() - start_peak_rss)
+        return timed_method
+
+    for kind, method_names in [('fit', ['fit', 'fit_transform']),
+                               ('predict', ['transform', 'predict', 'predict_proba', 'decision_function'])]:
+        for method_name in method_names:
+            if hasattr(operator, method_name):
+                # the instance attribute shadows the method of the class
+                setattr(operator, method_name, timed(getattr(operator, method_name), kind))
+
+
+def _instrumented_clone(sklearn_pipeline, step_stats):
+    """Clone a pipeline and time the fit and predict methods of each of its operators.
+
+    Parameters
+    ----------
+    sklearn_pipeline : pipeline object implementing 'fit'
+        The pipeline to clone.
+    step_stats: list
+        List of the telemetry of each operator of the pipeline, in the order of _operators,
+        which is accumulated over all the clones of the pipeline, e.g. over the CV folds.
+        The telemetry of an operator is a dict with:
+        'operator': class name of the operator
+        'params': parameters of the operator with a number, string or None value
+        'fit_time': time spent in fit and fit_transform, in seconds
+        'predict_time': time spent in transform, predict, predict_proba and decision_function, in seconds
+        'peak_rss_increase': largest increase of the peak resident set size of the worker
+            process during a call, in megabytes
+        'failure': None or the name of the exception raised by the operator
+        The times and the peak RSS increase are None for the operators which are not
+        measured, i.e. the transformers of a pipeline with memory caching (see _cached_operators).
+
+    Returns
+    -------
+    The instrumented clone of the pipeline
+    """
+    sklearn_pipeline = clone(sklearn_pipeline)
+    cached_operators = _cached_operators(sklearn_pipeline)
+    for position, operator in enumerate(_operators(sklearn_pipeline)):
+        if position == len(step_stats):
+            params = operator.get_params(deep=False)
+            step_stats.append({
+                'operator': type(operator).__name__,
+                'params': {key: value for key, value in params.items()
+                           if value is None or isinstance(value, (numbers.Number, str))},
+                'fit_time': 0.,
+                'predict_time': 0.,
+                'peak_rss_increase': 0.,
+                'failure': None
+            })
+        if any(operator is cached_operator for cached_operator in cached_operators):
+            step_stats[position].update(fit_time=None, predict_time=None, peak_rss_increase=None)
+        else:
+            _instrument_operator(operator, step_stats[position])
+    return sklearn_pipeline
+
+
+def _peak_rss():
+    """Return the peak resident set size of the current process in megabytes, or None if unknown."""
+    if resource is None:
+        return None
+    peak_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is in bytes on macOS and in kilobytes on Linux
+    if sys.platform == 'darwin':
+        return peak_rss / 2. ** 20
+    return peak_rss / 2. ** 10
+
+
+def _in_main_thread():
+    """Return whether the current thread is the main thread of its process."""
+    if hasattr(threading, 'main_thread'):
+        return threading.current_thread() is threading.main_thread()
+    # threading.main_thread is not available on Python 2
+    return threading.current_thread().name == 'MainThread'
+
+
+def _worker_id():
+    """Return an identifier of the current worker process: hostname:pid."""
+    return '{}:{}'.format(socket.gethostname(), os.getpid())
+
+
+def _cross_val_score_before_deadline(sklearn_pipeline, timeout, deadline=None, profile_fraction=0., **kwargs):
+    """Compute the CV score of a pipeline with telemetry, giving up when a deadline is reached.
+
+    Parameters
+    ----------
+    sklearn_pipeline : pipeline object implementing 'fit'
+        The object to use to fit the data.
+    timeout: float
+        Maximum number of seconds to evaluate the pipeline
+    deadline: float or None, optional (default: None)
+        If not None, time.time() at which the evaluation must be over. The timeout of the
+        evaluation is cut short when the evaluation starts close to the deadline, e.g. after
+        waiting for a worker.
+    profile_fraction: float, optional (default: 0.)
+        Probability to profile the evaluation with cProfile
+    kwargs: keyword arguments
+        Arguments of _wrapped_cross_val_score
+
+    Returns
+    -------
+    CV_score: float or "Timeout"
+        CV score of the pipeline
+    eval_stats: dict
+        Telemetry of the evaluation:
+        'wall_time': wall-clock time of the evaluation, in seconds
+        'cpu_time': CPU time of the worker process during the evaluation, in seconds
+        'peak_rss_increase': increase of the peak resident set size of the worker process
+            during the evaluation, in megabytes, i.e. how far the evaluation raised the
+            highest memory usage of the process so far, or None if it is unknown
+        'cpu_time' and 'peak_rss_increase' are None if the evaluation does not run in the
+            main thread of the worker process, e.g. with a thread executor or in a dask worker,
+            since they would then include the evaluations running concurrently in other threads
+        'fold_fit_times': fit time of each fold, in seconds
+        'fold_score_times': score time of each fold, in seconds
+        'fold_test_sizes': number of test samples of each fold
+        'step_stats': telemetry of each operator of the pipeline, see _instrumented_clone
+        'worker': hostname:pid of the worker process
+        'failure': None, "Timeout", "Deadline" if the evaluation did not start or was cut
+            short because of the deadline, or the name of the exception raised by the pipeline
+        'profile_stats': cProfile statistics of the evaluation, only if it was profiled
+    """
+    measure_process = _in_main_thread()
+    start_peak_rss = _peak_rss() if measure_process else None
+    eval_stats = {
+        'wall_time': 0.,
+        'cpu_time': 0. if measure_process else None,
+        'fold_fit_times': None,
+        'fold_score_times': None,
+        'fold_test_sizes': None,
+        'step_stats': None,
+        'failure': None
+    }
+    CV_score = "Timeout"
+    # the timeout of the pipeline is not the reason why it is not evaluated
+    cut_short = deadline is not None and deadline - time.time() < timeout
+    if cut_short:
+        timeout = deadline - time.time()
+    if timeout > 0:
+        start_time = time.time()
+        start_cpu_time = _process_time()
+        if _should_profile(profile_fraction):
+            CV_score, eval_stats['profile_stats'] = _profiled_call(
+                _wrapped_cross_val_score, sklearn_pipeline, timeout=timeout, eval_stats=eval_stats, **kwargs
+            )
+        else:
+            CV_score = _wrapped_cross_val_score(sklearn_pipeline, timeout=timeout, eval_stats=eval_stats, **kwargs)
+        eval_stats['wall_time'] = time.time() - start_time
+        if measure_process:
+            eval_stats['cpu_time'] = _process_time() - start_cpu_time
+    if CV_score == "Timeout":
+        eval_stats['failure'] = "Deadline" if cut_short else "Timeout"
+    eval_stats['peak_rss_increase'] = _peak_rss() - start_peak_rss if start_peak_rss is not None else None
+    eval_stats['worker'] = _worker_id()
+    return CV_score, eval_stats
+
+
+def _import_dask():
+    """Import dask, with a helpful message when the optional dependency is missing."""
+    try:
+        import dask  # noqa
+        from dask import delayed  # noqa
+    except ImportError:
+        msg = "'use_dask' requires the optional dask and dask-ml depedencies."
+        raise ImportError(msg)
+    return dask
+
+
+def _get_dask_client():
+    """Return the default dask.distributed client, or None if there is none."""
+    try:
+        from distributed import default_client
+        return default_client()
+    except (ImportError, ValueError):
+        return None
+
+
+def _dask_data(features, target, sample_weight=None):
+    """Send the data set to the dask workers once for the whole optimization process.
+
+    Parameters
+    ----------
+    features : array-like of shape at least 2D
+        The data to fit.
+    target : array-like
+        The target variable.
+    sample_weight : array-like, optional
+        List of sample weights to balance (or un-balanace) the dataset target as needed
+
+    Returns
+    -------
+    data: tuple
+        Handles of features, target and sample_weight to use in dask graphs: futures of the
+        data scattered to all the workers if a dask.distributed client is running, otherwise
+        delayed objects whose keys are shared by the graphs of all the generations.
+    """
+    dask = _import_dask()
+    client = _get_dask_client()
+    if client is not None:
+        return tuple(
+            value if value is None else client.scatter(value, broadcast=True)
+            for value in (features, target, sample_weight)
+        )
+    token = dask.base.tokenize(features, target, sample_weight)
+    return tuple(
+        dask.delayed(value, name='tpot-{}-{}'.format(name, token))
+        for name, value in zip(['features', 'target', 'sample_weight'], [features, target, sample_weight])
+    )
+
+
+def _estimator_token(estimator):
+    """Return a deterministic token of an unfitted estimator and its parameters."""
+    if hasattr(estimator, 'get_params') and not isclass(estimator):
+        params = estimator.get_params(deep=False)
+        return (type(estimator).__name__,
+                [(key, _estimator_token(params[key])) for key in sorted(params)])
+    elif isinstance(estimator, (list, tuple)):
+        return [_estimator_token(value) for value in estimator]
+    else:
+        return estimator
+
+
+def _split_fold(features, target, sample_weight, train, test):
+    """Split the data set into the training and testing sets of a fold."""
+    return (safe_indexing(features, train), safe_indexing(target, train),
+            safe_indexing(features, test), safe_indexing(target, test),
+            None if sample_weight is None else safe_indexing(sample_weight, train))
+
+
+def _fit_transform_step(step, fold, use_sample_weight):
+    """Fit a transformer on the training set of a fold and transform both sets of the fold.
+
+    Returns None if the transformer or one of the steps before it failed.
+    """
+    if fold is None:
+        return None
+    X_train, y_train, X_test, y_test, sample_weight = fold
+    fit_params = {'sample_weight': sample_weight} if use_sample_weight else {}
+    try:
+        with warnings.catch_warnings():
+            warnings.simplefilter('ignore')
+            step = clone(step)
+            if hasattr(step, 'fit_transform'):
+                Xt_train = step.fit_transform(X_train, y_train, **fit_params)
+            else:
+                Xt_train = step.fit(X_train, y_train, **fit_params).transform(X_train)
+            return Xt_train, y_train, step.transform(X_test), y_test, sample_weight
+    except Exception:
+        return None
+
+
+def _fit_and_score_step(estimator, fold, use_sample_weight, scorer):
+    """Fit the final estimator of a pipeline on the transformed training set of a fold and score it.
+
+    Returns -inf if the estimator or one of the steps before it failed.
+    """
+    if fold is None:
+        return -float('inf')
+    X_train, y_train, X_test, y_test, sample_weight = fold
+    fit_params = {'sample_weight': sample_weight} if use_sample_weight else {}
+    try:
+        with warnings.catch_warnings():
+            warnings.simplefilter('ignore')
+            estimator = clone(estimator).fit(X_train, y_train, **fit_params)
+            return scorer(estimator, X_test, y_test)
+    except Exception:
+        return -float('inf')
+
+
+def _dask_cv_scores(sklearn_pipeline_list, features, target, cv, scoring_function,
+                    data, sample_weight=None, groups=None):
+    """Build a single dask graph computing the CV scores of all the pipelines of a generation.
+
+    The folds are split once and each step of a pipeline is a node whose key only depends on
+    the fold and on the steps up to it, so pipelines starting with the same steps share the
+    fitted transformers and the transformed data instead of computing them again.
+
+    Parameters
+    ----------
+    sklearn_pipeline_list: list
+        A list of scikit-learn pipelines to evaluate
+    features : array-like of shape at least 2D
+        The data to fit, used to split the folds.
+    target : array-like
+        The target variable, used to split the folds.
+    cv: int or cross-validation generator
+        If CV is a number, then it is the number of folds to evaluate each
+        pipeline over in k-fold cross-validation during the TPOT optimization
+         process. If it is an object then it is an object to be used as a
+         cross-validation generator.
+    scoring_function : callable
+        A scorer callable object / function with signature
+        ``scorer(estimator, X, y)``.
+    data: tuple
+        Handles of features, target and sample_weight returned by _dask_data
+    sample_weight : array-like, optional
+        List of sample weights to balance (or un-balanace) the dataset target as needed
+    groups: array-like {n_samples, }, optional
+        Group labels for the samples used while splitting the dataset into train/test set
+
+    Returns
+    -------
+    scores: list of dask.delayed.Delayed
+        The CV score of each pipeline, in the order of sklearn_pipeline_list
+    """
+    dask = _import_dask()
+    tokenize = dask.base.tokenize
+    features, target, groups = indexable(features, target, groups)
+    data_token = tokenize(*[getattr(value, 'key', None) for value in data])
+
+    # folds are split once for classifiers and once for regressors
+    folds = {}
+    scores = []
+    for sklearn_pipeline in sklearn_pipeline_list:
+        classifier = is_classifier(sklearn_pipeline)
+        if classifier not in folds:
+            cv_iter = check_cv(cv, target, classifier=classifier).split(features, target, groups)
+            folds[classifier] = [
+                (fold_token, dask.delayed(_split_fold, pure=True)(
+                    *(data + (train, test)), dask_key_name='tpot-split-' + fold_token))
+                for fold_token, (train, test) in (
+                    (tokenize(data_token, train, test), (train, test)) for train, test in cv_iter
+                )
+            ]
+
+        scorer = check_scoring(sklearn_pipeline, scoring=scoring_function)
+        sample_weight_steps = [
+            key.split('__')[0]
+            for key in set_sample_weight(sklearn_pipeline.steps, sample_weight)
+        ]
+        fold_scores = []
+        for fold_token, fold in folds[classifier]:
+            step_token = fold_token
+            for name, step in sklearn_pipeline.steps[:-1]:
+                step_token = tokenize(step_token, _estimator_token(step), name in sample_weight_steps)
+                fold = dask.delayed(_fit_transform_step, pure=True)(
+                    step, fold, name in sample_weight_steps,
+                    dask_key_name='tpot-{}-{}'.format(name, step_token))
+            name, estimator = sklearn_pipeline.steps[-1]
+            score_token = tokenize(step_token, _estimator_token(estimator), str(scorer))
+            fold_scores.append(dask.delayed(_fit_and_score_step, pure=True)(
+                estimator, fold, name in sample_weight_steps, scorer,
+                dask_key_name='tpot-score-{}-{}'.format(name, score_token)))
+        scores.append(dask.delayed(np.nanmean, pure=True)(
+            fold_scores, dask_key_name='tpot-cv-score-' + tokenize([f.key for f in fold_scores])))
+    return scores
@@ -0,0 +1,126 @@
+# -*- coding: utf-8 -*-
+
+"""This file is part of the TPOT library.
+
+TPOT was primarily developed at the University of Pennsylvania by:
+    - Randal S. Olson (rso@randalolson.com)
+    - Weixuan Fu (weixuanf@upenn.edu)
+    - Daniel Angell (dpa34@drexel.edu)
+    - and many more generous open source contributors
+
+TPOT is free software: you can redistribute it and/or modify
+it under the terms of the GNU Lesser General Public License as
+published by the Free Software Foundation, either version 3 of
+the License, or (at your option) any later version.
+
+TPOT is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+GNU Lesser General Public License for more details.
+
+You should have received a copy of the GNU Lesser General Public
+License along with TPOT. If not, see <http://www.gnu.org/licenses/>.
+
+"""
+
+import traceback
+
+try:
+    from queue import Empty
+except ImportError:
+    from Queue import Empty
+
+
+class Island(object):
+    """Connection of an island of the island model to the other islands.
+
+    The islands form a ring: each island sends its emigrants to the next island and
+    receives immigrants from the previous one, without waiting for each other. The
+    pipelines are exchanged as strings, and their scores through the evaluation cache
+    shared by all the islands.
+    """
+
+    def __init__(self, index, inboxes, shared_cache, results, migration_size, initial_population=None):
+        """Create an Island object.
+
+        Parameters
+        ----------
+        index: int
+            Index of the island in the ring
+        inboxes: list of multiprocessing.Queue
+            Queue of the immigrants of each island
+        shared_cache: dict proxy of a multiprocessing.Manager
+            Evaluated pipelines of all the islands, with the same keys and values as evaluated_individuals_
+        results: multiprocessing.Queue
+            Queue of the results of the islands
+        migration_size: int
+            Number of individuals to send to the next island at each migration
+        initial_population: list of str, optional
+            String representations of individuals to start the island with
+        """
+        self.index = index
+        self.inboxes = inboxes
+        self.shared_cache = shared_cache
+        self.results = results
+        self.migration_size = migration_size
+        self.initial_population = initial_population or []
+
+    def send(self, emigrants):
+        """Send the string representations of individuals to the next island."""
+        self.inboxes[(self.index + 1) % len(self.inboxes)].put(emigrants)
+
+    def receive(self):
+        """Return the string representations of the individuals sent by the previous island since the last call."""
+        immigrants = []
+        while True:
+            try:
+                immigrants += self.inboxes[self.index].get_nowait()
+            except Empty:
+                return immigrants
+
+    def pull(self, individual_strs, evaluated_individuals):
+        """Copy the pipelines evaluated by the other islands from the shared cache to evaluated_individuals."""
+        for individual_str in individual_strs:
+            if individual_str not in evaluated_individuals:
+                stats = self.shared_cache.get(individual_str)
+                if stats is not None:
+                    evaluated_individuals[individual_str] = stats
+
+    def push(self, individual_strs, evaluated_individuals):
+        """Copy the pipelines evaluated by this island to the shared cache."""
+        self.shared_cache.update({individual_str: evaluated_individuals[individual_str]
+                                  for individual_str in individual_strs
+                                  if individual_str in evaluated_individuals})
+
+
+def _run_island(tpot_class, params, island, features, target, sample_weight=None, groups=None):
+    """Evolve an island in its own process and send the results to the main process.
+
+    Parameters
+    ----------
+    tpot_class: class
+        TPOTClassifier or TPOTRegressor
+    params: dict
+        Parameters of the TPOT object evolving the island
+    island: Island
+        Connection of the island to the other islands
+    features, target, sample_weight, groups:
+        Data set of the optimization process, already checked by fit()
+
+    The result sent to island.results is a tuple of the index of the island, its
+    evaluated_individuals_, the string representations of its final population and of
+    its Pareto front, and None; or of the index, None, None, None and a traceback if
+    the island failed.
+    """
+    try:
+        tpot_obj = tpot_class(**params)
+        population = tpot_obj._evolve_island(island, features, target, sample_weight, groups)
+        island.results.put((
+            island.index,
+            tpot_obj.evaluated_individuals_,
+            [str(ind) for ind in population],
+            [str(ind) for ind in tpot_obj._pareto_front.items],
+            None
+        ))
+    except BaseException:
+        island.results.put((island.index, None, None, None, traceback.format_exc()))
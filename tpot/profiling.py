@@ -0,0 +1,164 @@
+# -*- coding: utf-8 -*-
+
+"""This file is part of the TPOT library.
+
+TPOT was primarily developed at the University of Pennsylvania by:
+    - Randal S. Olson (rso@randalolson.com)
+    - Weixuan Fu (weixuanf@upenn.edu)
+    - Daniel Angell (dpa34@drexel.edu)
+    - and many more generous open source contributors
+
+TPOT is free software: you can redistribute it and/or modify
+it under the terms of the GNU Lesser General Public License as
+published by the Free Software Foundation, either version 3 of
+the License, or (at your option) any later version.
+
+TPOT is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+GNU Lesser General Public License for more details.
+
+You should have received a copy of the GNU Lesser General Public
+License along with TPOT. If not, see <http://www.gnu.org/licenses/>.
+
+"""
+
+import cProfile
+import pstats
+import random
+
+# the pipelines are picked for profiling independently of the random state of the optimization process
+_profile_random = random.Random()
+
+
+def _should_profile(fraction):
+    """Pick a pipeline for profiling with the probability fraction."""
+    return fraction > 0 and _profile_random.random() < fraction
+
+
+def _profiled_call(func, *args, **kwargs):
+    """Call a function with cProfile.
+
+    Returns
+    -------
+    result: object
+        Value returned by the function
+    stats: dict or None
+        cProfile statistics of the call, or None if another profiler is already active,
+        e.g. in another thread on Python 3.12 and later
+    """
+    profiler = cProfile.Profile()
+    try:
+        profiler.enable()
+    except ValueError:
+        return func(*args, **kwargs), None
+    try:
+        result = func(*args, **kwargs)
+    finally:
+        profiler.disable()
+    profiler.create_stats()
+    return result, profiler.stats
+
+
+class _StatsDump(object):
+    """Load cProfile statistics received from a worker into pstats.Stats."""
+
+    def __init__(self, stats):
+        self.stats = stats
+
+    def create_stats(self):
+        pass
+
+
+class ProfileCollector(object):
+    """Merge the cProfile statistics of the optimization process and of the evaluated pipelines.
+
+    The optimization process is profiled in the main process while it is not waiting for
+    the evaluation of pipelines, i.e. the TPOT overhead of generating, compiling and
+    pre-testing the pipelines. A fraction of the pipelines are profiled in the evaluation
+    workers and their statistics are sent back with their telemetry.
+    """
+
+    def __init__(self):
+        self._profiler = None
+        self._worker_stats = []
+        self.n_pipelines = 0
+        self.evaluation_time = 0.
+        self.estimator_time = 0.
+
+    def start(self):
+        """Start profiling the optimization process."""
+        self._profiler = cProfile.Profile()
+        self.resume()
+
+    def pause(self):
+        """Stop profiling the optimization process, e.g. while it evaluates pipelines."""
+        if self._profiler is not None:
+            self._profiler.disable()
+
+    def resume(self):
+        """Profile the optimization process again."""
+        if self._profiler is not None:
+            try:
+                self._profiler.enable()
+            except ValueError:
+                # another profiler is active, e.g. profiling a pipeline evaluated in a thread
+                pass
+
+    def add(self, eval_stats):
+        """Collect the statistics of a pipeline evaluation, if it was profiled.
+
+        Parameters
+        ----------
+        eval_stats: dict
+            Telemetry of the evaluation of a pipeline, see _cross_val_score_before_deadline
+        """
+        stats = eval_stats.get('profile_stats')
+        if stats is None:
+            return
+        self._worker_stats.append(stats)
+        self.n_pipelines += 1
+        self.evaluation_time += eval_stats.get('wall_time') or 0.
+        # the operators which are not measured are counted as evaluation overhead
+        self.estimator_time += sum((operator_stats['fit_time'] or 0.) + (operator_stats['predict_time'] or 0.)
+                                   for operator_stats in eval_stats.get('step_stats') or [])
+
+    def dump(self, path):
+        """Stop profiling and write the merged statistics to a file readable with pstats.
+
+        Parameters
+        ----------
+        path: string
+            Path of the .pstats file
+
+        Returns
+        -------
+        summary: dict
+            'n_pipelines': number of profiled pipelines
+            'estimator_time': time spent fitting and predicting with the operators of the
+                profiled pipelines, in seconds
+            'evaluation_overhead': time spent by TPOT and scikit-learn evaluating the profiled
+                pipelines besides their operators, e.g. splitting and scoring, in seconds
+            'optimization_overhead': time spent by the optimization process besides the
+                evaluation of pipelines, e.g. generating, compiling and pre-testing them, in seconds
+        """
+        stats = None
+        optimization_overhead = 0.
+        if self._profiler is not None:
+            self._profiler.disable()
+            stats = pstats.Stats(self._profiler)
+            optimization_overhead = stats.total_tt
+            self._profiler = None
+        for worker_stats in self._worker_stats:
+            if stats is None:
+                stats = pstats.Stats(_StatsDump(worker_stats))
+            else:
+                stats.add(_StatsDump(worker_stats))
+        if stats is not None:
+            stats.dump_stats(path)
+        return {
+            'n_pipelines': self.n_pipelines,
+            'estimator_time': self.estimator_time,
+            'evaluation_overhead': max(self.evaluation_time - self.estimator_time, 0.),
+            'optimization_overhead': optimization_overhead
+        }
@@ -0,0 +1,133 @@
+# -*- coding: utf-8 -*-
+
+"""This file is part of the TPOT library.
+
+TPOT was primarily developed at the University of Pennsylvania by:
+    - Randal S. Olson (rso@randalolson.com)
+    - Weixuan Fu (weixuanf@upenn.edu)
+    - Daniel Angell (dpa34@drexel.edu)
+    - and many more generous open source contributors
+
+TPOT is free software: you can redistribute it and/or modify
+it under the terms of the GNU Lesser General Public License as
+published by the Free Software Foundation, either version 3 of
+the License, or (at your option) any later version.
+
+TPOT is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+GNU Lesser General Public License for more details.
+
+You should have received a copy of the GNU Lesser General Public
+License along with TPOT. If not, see <http://www.gnu.org/licenses/>.
+
+"""
+
+import numpy as np
+from deap import gp
+from sklearn.ensemble import RandomForestRegressor
+
+
+class SurrogateModel(object):
+    """Predict the internal CV score of pipelines from their structure.
+
+    A pipeline is described by the number of times each primitive (operator) and
+    terminal (hyperparameter value) of the primitive set appears in it, its number
+    of nodes and its height. A random forest is trained on the pipelines evaluated so
+    far, and retrained whenever new pipelines are evaluated.
+    """
+
+    def __init__(self, pset, random_state=None, min_samples=10, n_estimators=50):
+        """Create a SurrogateModel object.
+
+        Parameters
+        ----------
+        pset: deap.gp.PrimitiveSetTyped
+            Primitive set of the pipelines
+        random_state: int, optional
+            Random number generator seed of the random forest
+        min_samples: int, optional (default: 10)
+            Minimum number of successfully evaluated pipelines to train the random forest
+        n_estimators: int, optional (default: 50)
+            Number of trees of the random forest
+        """
+        self._pset = pset
+        self._random_state = random_state
+        self._min_samples = min_samples
+        self._n_estimators = n_estimators
+        self._columns = {name: column for column, name in enumerate(sorted(pset.mapping))}
+        # features of the pipelines, by string representation
+        self._features = {}
+        self._n_samples = 0
+        self.model = None
+
+    def _pipeline_features(self, individual_str, individual=None):
+        """Return the feature vector of a pipeline."""
+        features = self._features.get(individual_str)
+        if features is None:
+            if individual is None:
+                individual = gp.PrimitiveTree.from_string(individual_str, self._pset)
+            features = np.zeros(len(self._columns) + 2)
+            for node in individual:
+                column = self._columns.get(node.name)
+                if column is not None:
+                    features[column] += 1
+            features[-2] = len(individual)
+            features[-1] = individual.height
+            self._features[individual_str] = features
+        return features
+
+    def fit(self, evaluated_individuals):
+        """Train the random forest on the evaluated pipelines.
+
+        Parameters
+        ----------
+        evaluated_individuals: dict
+            Evaluated pipelines, with the same keys and values as evaluated_individuals_
+
+        Returns
+        -------
+        self: SurrogateModel
+            Returns the surrogate model
+        """
+        features, scores = [], []
+        for individual_str, stats in evaluated_individuals.items():
+            score = stats['internal_cv_score']
+            # the failed and timed out pipelines say nothing about the score of the others
+            if np.isinf(score) or np.isnan(score):
+                continue
+            try:
+                features.append(self._pipeline_features(individual_str))
+            except Exception:
+                # pipelines of another primitive set, from a previous fit() with warm_start
+                continue
+            scores.append(score)
+
+        if len(scores) < self._min_samples:
+            self.model = None
+        elif len(scores) != self._n_samples:
+            self.model = RandomForestRegressor(
+                n_estimators=self._n_estimators,
+                random_state=self._random_state
+            ).fit(np.array(features), np.array(scores))
+        self._n_samples = len(scores)
+        return self
+
+    def predict(self, individuals):
+        """Predict the internal CV scores of pipelines.
+
+        Parameters
+        ----------
+        individuals: list
+            Individuals of the GP population
+
+        Returns
+        -------
+        scores: numpy.ndarray {len(individuals)}
+            Predicted internal CV scores of the pipelines, or None if the random forest
+            is not trained yet
+        """
+        if self.model is None:
+            return None
+        features = np.array([self._pipeline_features(str(ind), ind) for ind in individuals])
+        return self.model.predict(features)